@@ -1,5 +1,5 @@
 # import multiprocessing  # noqa
-# import os  # noqa
+import os
 
 # the socket to bind to
 bind = "0.0.0.0:8000"
@@ -17,7 +17,7 @@ workers = 2
 
 # If a worker does not notify the master process in this number of seconds
 # it is killed and a new worker is spawned to replace it
-timeout = 58
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "58"))
 
 # The number of seconds to wait for the next request
 keepalive = 2
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class LeaguePlannerConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "league_planner"
+
+    def ready(self) -> None:
+        import league_planner.signals  # noqa: F401
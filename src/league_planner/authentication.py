@@ -0,0 +1,63 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from league_planner.ttl_cache import TTLCache
+
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.dummy.DummyCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+)
+
+token_cache = TTLCache(settings.TOKEN_CACHE_SIZE, settings.TOKEN_CACHE_LOCAL_TTL)
+
+
+def token_cache_key(key: str) -> str:
+    return "auth-token:" + hashlib.sha256(key.encode()).hexdigest()
+
+
+def shared_token_cache() -> bool:
+    return settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+
+def forget_tokens(*keys: str) -> None:
+    cache_keys = [token_cache_key(key) for key in keys]
+    token_cache.delete(*cache_keys)
+    if shared_token_cache():
+        cache.delete_many(cache_keys)
+
+
+def cached_credentials(key: str, user_id: int, is_active: bool) -> tuple[User, Token]:
+    db = router.db_for_read(Token)
+    user = User.from_db(db, ["id", "is_active"], [user_id, is_active])
+    token = Token.from_db(db, ["key", "user_id"], [key, user_id])
+    token.user = user
+    return user, token
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    def authenticate_credentials(self, key: str) -> tuple[User, Token]:
+        if not settings.TOKEN_CACHE_TTL:
+            return super().authenticate_credentials(key)
+        cache_key = token_cache_key(key)
+        credentials = token_cache.get(cache_key)
+        if credentials is None:
+            shared = shared_token_cache()
+            credentials = cache.get(cache_key) if shared else None
+            if credentials is None:
+                user, token = super().authenticate_credentials(key)
+                credentials = (user.pk, user.is_active)
+                if shared:
+                    cache.set(cache_key, credentials, settings.TOKEN_CACHE_TTL)
+            token_cache.set(cache_key, credentials)
+        user_id, is_active = credentials
+        if not is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+        return cached_credentials(key, user_id, is_active)
@@ -0,0 +1,61 @@
+import hashlib
+from collections.abc import Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from league_planner.models.season_version import SeasonVersion
+
+
+def bump_season_versions(season_ids: Iterable[int | None]) -> None:
+    season_ids = {season_id for season_id in season_ids if season_id is not None}
+    if season_ids:
+        SeasonVersion.objects.filter(season_id__in=season_ids).update(version=F("version") + 1)
+
+
+def season_versions(season_ids: Iterable[int]) -> list[tuple[int, int]]:
+    season_ids = sorted(set(season_ids))
+    versions = dict(SeasonVersion.objects.filter(season_id__in=season_ids).values_list("season_id", "version"))
+    return [(season_id, versions.get(season_id, 0)) for season_id in season_ids]
+
+
+def requested_season_ids(request: Request) -> list[int] | None:
+    value = request.query_params.get("season", "")
+    ids = [part.strip() for part in value.split(",")]
+    if not value or not all(part.isdigit() for part in ids):
+        return None
+    return [int(part) for part in ids]
+
+
+def response_cache_key(request: Request, versions: list[tuple[int, int]]) -> str:
+    query = sorted(request.query_params.lists())
+    media_type = f"{request.accepted_renderer.format}|{request.accepted_media_type}"
+    raw_key = f"{request.get_host()}|{request.path}|{query}|{media_type}|{versions}"
+    return "league_planner:response:" + hashlib.sha256(raw_key.encode()).hexdigest()
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("If-None-Match", "")
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def versioned_response(request: Request, season_ids: Iterable[int], build: Callable[[], Response]) -> Response:
+    key = response_cache_key(request, season_versions(season_ids))
+    etag = f'"{key.rsplit(":", 1)[1][:40]}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    data = cache.get(key)
+    if data is not None:
+        return Response(data=data, status=status.HTTP_200_OK, headers=headers)
+    response = build()
+    if response.status_code == status.HTTP_200_OK:
+        cache.set(key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+        for header, value in headers.items():
+            response[header] = value
+    return response
@@ -0,0 +1,65 @@
+from collections.abc import Iterable
+from itertools import groupby
+from operator import itemgetter
+
+from django.db import connection
+from django.db.models import Q
+
+from league_planner.models.match import Match
+from league_planner.scoreboard import _placeholders, _table
+
+CONFLICTS_SQL = """
+WITH scoped AS (
+    SELECT id, season_id, host_id, visitor_id, address, datetime
+    FROM {match}
+    WHERE season_id IN ({season_ids}) AND datetime IS NOT NULL
+),
+sides AS (
+    SELECT
+        scoped.id,
+        scoped.season_id,
+        scoped.datetime,
+        CASE WHEN side.is_home = 1 THEN scoped.host_id ELSE scoped.visitor_id END AS team_id
+    FROM scoped
+    CROSS JOIN (SELECT 1 AS is_home UNION ALL SELECT 0) side
+)
+SELECT 'team' AS type, a.season_id, a.team_id AS team, NULL AS address, a.datetime, a.id AS first, b.id AS second
+FROM sides a
+JOIN sides b ON b.team_id = a.team_id AND b.datetime = a.datetime AND b.id > a.id
+UNION ALL
+SELECT 'venue' AS type, a.season_id, NULL AS team, a.address, a.datetime, a.id AS first, b.id AS second
+FROM scoped a
+JOIN scoped b ON b.address = a.address AND b.datetime = a.datetime AND b.id > a.id
+ORDER BY datetime, type, team, address, first, second
+"""
+
+CONFLICT_KEY = itemgetter("type", "team", "address", "datetime")
+
+
+def find_conflicts(season_ids: Iterable[int]) -> list[dict]:
+    season_ids = list(season_ids)
+    if not season_ids:
+        return []
+    sql = CONFLICTS_SQL.format(match=_table(Match), season_ids=_placeholders(season_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, season_ids)
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    conflicts = []
+    for _, group in groupby(rows, key=CONFLICT_KEY):
+        pairs = list(group)
+        conflict = {key: pairs[0][key] for key in ("type", "season_id", "team", "address", "datetime")}
+        conflict["matches"] = sorted({match_id for pair in pairs for match_id in (pair["first"], pair["second"])})
+        conflicts.append(conflict)
+    return conflicts
+
+
+def conflicting_match_ids(match: Match, limit: int = 10) -> list[int]:
+    if match.datetime is None:
+        return []
+    team_ids = [team_id for team_id in (match.host_id, match.visitor_id) if team_id is not None]
+    clashes = Q(host_id__in=team_ids) | Q(visitor_id__in=team_ids)
+    if match.address:
+        clashes |= Q(address=match.address, season__league__season=match.season_id)
+    conflicts = Match.objects.filter(clashes, datetime=match.datetime).exclude(pk=match.pk)
+    return list(conflicts.order_by("id").values_list("id", flat=True)[:limit])
@@ -0,0 +1,99 @@
+import csv
+import json
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+from league_planner.models.match import Match
+from league_planner.settings import DEFAULT_DATETIME_FORMAT
+
+EXPORT_FIELDS = {
+    "id": "id",
+    "datetime": "datetime",
+    "host_id": "host_id",
+    "host": "host__name",
+    "visitor_id": "visitor_id",
+    "visitor": "visitor__name",
+    "host_score": "host_score",
+    "visitor_score": "visitor_score",
+    "address": "address",
+}
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson; charset=utf-8",
+    "ics": "text/calendar; charset=utf-8",
+}
+ICS_DATETIME_FORMAT = "%Y%m%dT%H%M%SZ"
+ICS_LINE_LENGTH = 75
+
+
+class Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_rows(season_id: int, chunk_size: int = 2000) -> Iterator[dict]:
+    matches = Match.objects.filter(season_id=season_id).order_by("datetime", "id")
+    for row in matches.values(*EXPORT_FIELDS.values()).iterator(chunk_size=chunk_size):
+        yield {name: row[lookup] for name, lookup in EXPORT_FIELDS.items()}
+
+
+def _format_datetime(value: datetime | None) -> str | None:
+    return value.strftime(DEFAULT_DATETIME_FORMAT) if value is not None else None
+
+
+def export_csv(season_id: int) -> Iterator[str]:
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in export_rows(season_id):
+        row["datetime"] = _format_datetime(row["datetime"])
+        yield writer.writerow(row.values())
+
+
+def export_ndjson(season_id: int) -> Iterator[str]:
+    for row in export_rows(season_id):
+        row["datetime"] = _format_datetime(row["datetime"])
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+
+def _ics_text(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_line(line: str) -> str:
+    encoded = line.encode()
+    parts: list[str] = []
+    while len(encoded) > ICS_LINE_LENGTH:
+        cut = ICS_LINE_LENGTH if not parts else ICS_LINE_LENGTH - 1
+        while encoded[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode())
+        encoded = encoded[cut:]
+    parts.append(encoded.decode())
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ics_summary(row: dict) -> str:
+    host, visitor = row["host"] or "TBD", row["visitor"] or "TBD"
+    if row["host_score"] is None or row["visitor_score"] is None:
+        return f"{host} vs {visitor}"
+    return f"{host} {row['host_score']}:{row['visitor_score']} {visitor}"
+
+
+def export_ics(season_id: int, host: str) -> Iterator[str]:
+    stamp = datetime.now(timezone.utc).strftime(ICS_DATETIME_FORMAT)
+    yield "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//league-planner//matches//EN\r\nCALSCALE:GREGORIAN\r\n"
+    for row in export_rows(season_id):
+        if row["datetime"] is None:
+            continue
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:match-{row['id']}@{host}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{row['datetime'].astimezone(timezone.utc).strftime(ICS_DATETIME_FORMAT)}",
+            f"SUMMARY:{_ics_text(_ics_summary(row))}",
+        ]
+        if row["address"]:
+            lines.append(f"LOCATION:{_ics_text(row['address'])}")
+        lines.append("END:VEVENT")
+        yield "".join(_ics_line(line) for line in lines)
+    yield "END:VCALENDAR\r\n"
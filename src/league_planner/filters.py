@@ -1,5 +1,15 @@
+from django.db.models import Q
 from django.db.models.query import QuerySet
-from django_filters.rest_framework import BaseInFilter, FilterSet
+from django_filters.rest_framework import (
+    BaseInFilter,
+    BooleanFilter,
+    CharFilter,
+    DateTimeFromToRangeFilter,
+    FilterSet,
+    NumberFilter,
+)
+
+from league_planner.search import search_queryset
 
 
 class SeasonIdFilter(BaseInFilter):
@@ -18,3 +28,33 @@ class FilterBySeason(FilterSet):
 
 class FilterByLeague(FilterSet):
     league = LeagueIdFilter(lookup_expr="exact")
+
+
+class MatchFilter(FilterBySeason):
+    datetime = DateTimeFromToRangeFilter()
+    team = NumberFilter(method="filter_team")
+    host = NumberFilter(field_name="host_id")
+    visitor = NumberFilter(field_name="visitor_id")
+    played = BooleanFilter(method="filter_played")
+    address = CharFilter()
+
+    def filter_team(self, qs: QuerySet, name: str, team_id: int) -> QuerySet:
+        return qs.filter(Q(host_id=team_id) | Q(visitor_id=team_id))
+
+    def filter_played(self, qs: QuerySet, name: str, played: bool) -> QuerySet:
+        unplayed = Q(host_score__isnull=True) | Q(visitor_score__isnull=True)
+        return qs.exclude(unplayed) if played else qs.filter(unplayed)
+
+
+class TeamFilter(FilterBySeason):
+    search = CharFilter(method="filter_search")
+
+    def filter_search(self, qs: QuerySet, name: str, term: str) -> QuerySet:
+        return search_queryset(qs, term, ("name", "city"))
+
+
+class LeagueFilter(FilterSet):
+    search = CharFilter(method="filter_search")
+
+    def filter_search(self, qs: QuerySet, name: str, term: str) -> QuerySet:
+        return search_queryset(qs, term, ("name",))
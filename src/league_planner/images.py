@@ -0,0 +1,181 @@
+import hashlib
+import io
+import re
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.core.files.base import ContentFile, File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from league_planner.models.image_blob import ImageBlob
+from league_planner.models.image_job import ImageJob
+from league_planner.models.team import Team
+
+IMAGE_SIZES = (48, 128, 512)
+IMAGE_FORMATS = {"webp": "image/webp", "png": "image/png"}
+IMAGE_DIRECTORY = "images/blobs"
+DEFAULT_IMAGE_SIZE = IMAGE_SIZES[-1]
+DEFAULT_IMAGE_FORMAT = "png"
+BLOB_NAME_PATTERN = re.compile(rf"^{IMAGE_DIRECTORY}/[0-9a-f]{{2}}/(?P<digest>[0-9a-f]{{64}})_\d+\.\w+$")
+
+Renditions = dict[tuple[int, str], bytes]
+
+
+def blob_name(digest: str, size: int, image_format: str) -> str:
+    return f"{IMAGE_DIRECTORY}/{digest[:2]}/{digest}_{size}.{image_format}"
+
+
+def blob_digest(name: str | None) -> str | None:
+    match = BLOB_NAME_PATTERN.match(name or "")
+    return match["digest"] if match else None
+
+
+def rendition_name(team: Team, size: int, image_format: str) -> str | None:
+    digest = blob_digest(team.image.name)
+    if digest is None:
+        return None
+    return blob_name(digest, size, image_format)
+
+
+def encode_image(image: Image.Image, image_format: str) -> bytes:
+    buffer = io.BytesIO()
+    if image_format == "webp":
+        image.save(buffer, "WEBP", quality=80, method=6)
+    else:
+        image.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def render_image(source: File) -> Renditions:
+    source.seek(0)
+    with Image.open(source) as original:
+        image = (ImageOps.exif_transpose(original) or original).convert("RGBA")
+    renditions: Renditions = {}
+    for size in IMAGE_SIZES:
+        resized = image.copy()
+        resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+        resized.info.clear()
+        for image_format in IMAGE_FORMATS:
+            renditions[size, image_format] = encode_image(resized, image_format)
+    return renditions
+
+
+def acquire_blob(renditions: Renditions) -> str:
+    digest = hashlib.sha256(renditions[DEFAULT_IMAGE_SIZE, DEFAULT_IMAGE_FORMAT]).hexdigest()
+    with transaction.atomic():
+        blob, _ = ImageBlob.objects.select_for_update().get_or_create(digest=digest)
+        for (size, image_format), content in renditions.items():
+            name = blob_name(digest, size, image_format)
+            if not default_storage.exists(name):
+                default_storage.save(name, ContentFile(content))
+        blob.refcount = F("refcount") + 1
+        blob.save(update_fields=["refcount"])
+    return digest
+
+
+def delete_blob_files(digest: str) -> None:
+    with transaction.atomic():
+        blob = ImageBlob.objects.select_for_update().filter(digest=digest, refcount=0).first()
+        if blob is None:
+            return
+        for size in IMAGE_SIZES:
+            for image_format in IMAGE_FORMATS:
+                default_storage.delete(blob_name(digest, size, image_format))
+        blob.delete()
+
+
+def release_blob(digest: str) -> None:
+    with transaction.atomic():
+        blob = ImageBlob.objects.select_for_update().filter(digest=digest, refcount__gt=0).first()
+        if blob is None:
+            return
+        blob.refcount -= 1
+        blob.save(update_fields=["refcount"])
+        if blob.refcount == 0:
+            transaction.on_commit(partial(delete_blob_files, digest))
+
+
+def release_team_image(team: Team) -> None:
+    if not team.image:
+        return
+    digest = blob_digest(team.image.name)
+    if digest is None:
+        transaction.on_commit(partial(default_storage.delete, team.image.name))
+    else:
+        release_blob(digest)
+    team.image = None
+
+
+def delete_renditions(team: Team) -> None:
+    with transaction.atomic():
+        release_team_image(team)
+        team.save(update_fields=["image"])
+
+
+def save_renditions(team: Team, renditions: Renditions) -> None:
+    with transaction.atomic():
+        digest = acquire_blob(renditions)
+        release_team_image(team)
+        team.image.name = blob_name(digest, DEFAULT_IMAGE_SIZE, DEFAULT_IMAGE_FORMAT)
+        team.save(update_fields=["image"])
+
+
+def enqueue_image(team: Team, upload: File) -> ImageJob:
+    return ImageJob.objects.create(team=team, source=upload)
+
+
+def claim_image_job() -> ImageJob | None:
+    now = timezone.now()
+    stale = now - timedelta(seconds=settings.IMAGE_JOB_TIMEOUT)
+    with transaction.atomic():
+        job = (
+            ImageJob.objects.select_for_update(skip_locked=True)
+            .filter(Q(status=ImageJob.Status.PENDING) | Q(status=ImageJob.Status.PROCESSING, started_at__lt=stale))
+            .order_by("id")
+            .first()
+        )
+        if job is None:
+            return None
+        job.status = ImageJob.Status.PROCESSING
+        job.started_at = now
+        job.attempts += 1
+        job.save(update_fields=["status", "started_at", "attempts"])
+    return job
+
+
+def finish_image_job(job: ImageJob, status: str, error: str = "") -> None:
+    job.status = status
+    job.error = error
+    job.finished_at = timezone.now()
+    job.source.delete(save=False)
+    job.save(update_fields=["status", "error", "finished_at", "source"])
+
+
+def fail_image_job(job: ImageJob, error: str) -> None:
+    job.status = ImageJob.Status.FAILED
+    job.error = error
+    job.finished_at = timezone.now()
+    ImageJob.objects.filter(pk=job.pk).update(status=job.status, error=job.error, finished_at=job.finished_at)
+
+
+def process_image_job(job: ImageJob) -> None:
+    if job.attempts > settings.IMAGE_JOB_MAX_ATTEMPTS:
+        finish_image_job(job, ImageJob.Status.FAILED, "Image processing did not finish.")
+        return
+    try:
+        with job.source.open("rb") as source:
+            renditions = render_image(source)
+    except (OSError, Image.DecompressionBombError):
+        finish_image_job(job, ImageJob.Status.FAILED, "Upload a valid image.")
+        return
+    with transaction.atomic():
+        team = Team.objects.select_for_update().get(pk=job.team_id)
+        newer = ImageJob.objects.filter(team_id=job.team_id, id__gt=job.id, status=ImageJob.Status.DONE)
+        if not newer.exists():
+            save_renditions(team, renditions)
+        finish_image_job(job, ImageJob.Status.DONE)
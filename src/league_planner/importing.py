@@ -0,0 +1,169 @@
+import codecs
+import csv
+import io
+import json
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+
+from django.db import connection, transaction
+from django.db.models import Model
+from rest_framework.serializers import as_serializer_error, ValidationError
+
+from league_planner.caching import bump_season_versions
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+from league_planner.serializers.match import MatchImportSerializer
+from league_planner.serializers.team import TeamImportSerializer
+from league_planner.standings import rebuild_standings
+
+IMPORT_KINDS = ("teams", "matches")
+IMPORT_FORMATS = ("csv", "ndjson")
+IMPORT_COLUMNS = {
+    "teams": ("season", "name", "city", "number"),
+    "matches": ("season", "host", "visitor", "host_score", "visitor_score", "address", "datetime"),
+}
+MAX_REJECTED_ROWS = 100
+COPY_SQL = "COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)"
+
+ParsedRow = tuple[int, dict | None, str | None]
+
+
+@dataclass
+class ImportReport:
+    kind: str
+    processed: int = 0
+    created: int = 0
+    rejected_count: int = 0
+    rejected: list[dict] = field(default_factory=list)
+    seconds: float = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.processed / self.seconds if self.seconds else 0
+
+    def reject(self, row: int, errors: dict) -> None:
+        self.rejected_count += 1
+        if len(self.rejected) < MAX_REJECTED_ROWS:
+            self.rejected.append({"row": row, "errors": errors})
+
+
+def parse_rows(lines: Iterable[bytes], file_format: str) -> Iterator[ParsedRow]:
+    text = codecs.iterdecode(lines, "utf-8-sig")
+    if file_format == "csv":
+        for number, row in enumerate(csv.DictReader(text), start=1):
+            yield number, {key: value for key, value in row.items() if key and value not in ("", None)}, None
+        return
+    number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield number, None, "Invalid JSON."
+            continue
+        if not isinstance(row, dict):
+            yield number, None, "Expected a JSON object."
+            continue
+        yield number, {key: value for key, value in row.items() if value is not None}, None
+
+
+def copy_supported() -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        return hasattr(cursor.cursor, "copy_expert")
+
+
+def copy_instances(model: type[Model], fields: Iterable[str], instances: list[Model]) -> None:
+    columns = [model._meta.get_field(name).column for name in fields]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for instance in instances:
+        writer.writerow(getattr(instance, column) for column in columns)
+    buffer.seek(0)
+    sql = COPY_SQL.format(
+        table=connection.ops.quote_name(model._meta.db_table),
+        columns=", ".join(connection.ops.quote_name(column) for column in columns),
+    )
+    with connection.cursor() as cursor:
+        cursor.cursor.copy_expert(sql, buffer)
+
+
+class SeasonImporter:
+    def __init__(self, season: Season, kind: str, chunk_size: int = 1000, use_copy: bool | None = None) -> None:
+        self.season = season
+        self.kind = kind
+        self.chunk_size = chunk_size
+        self.use_copy = copy_supported() if use_copy is None else use_copy
+        self.model: type[Model] = Team if kind == "teams" else Match
+        self.report = ImportReport(kind=kind)
+        self.team_ids: dict[str, int] = {}
+        self.seen_names: set[str] = set()
+        serializer_class = TeamImportSerializer if kind == "teams" else MatchImportSerializer
+        self.serializer = serializer_class(context={"team_ids": self.team_ids})
+
+    def run(self, lines: Iterable[bytes], file_format: str) -> ImportReport:
+        started = time.perf_counter()
+        rows = parse_rows(lines, file_format)
+        with transaction.atomic():
+            if self.kind == "matches":
+                self.team_ids.update(Team.objects.filter(season_id=self.season.id).values_list("name", "id"))
+            while chunk := list(islice(rows, self.chunk_size)):
+                self.report.processed += len(chunk)
+                self.write(self.validate(chunk))
+            if self.report.created:
+                rebuild_standings([self.season.id])
+        if self.report.created:
+            bump_season_versions([self.season.id])
+        self.report.seconds = time.perf_counter() - started
+        return self.report
+
+    def validate(self, chunk: list[ParsedRow]) -> list[Model]:
+        valid: list[tuple[int, dict]] = []
+        for number, row, error in chunk:
+            if row is None:
+                self.report.reject(number, {"non_field_errors": [error]})
+                continue
+            try:
+                valid.append((number, self.serializer.run_validation(row)))
+            except ValidationError as exc:
+                self.report.reject(number, as_serializer_error(exc))
+        if self.kind == "teams":
+            valid = self.reject_taken_names(valid)
+            return [Team(season=self.season, **data) for _, data in valid]
+        return [
+            Match(
+                season=self.season,
+                host_id=data.pop("host"),
+                visitor_id=data.pop("visitor"),
+                **data,
+            )
+            for _, data in valid
+        ]
+
+    def reject_taken_names(self, valid: list[tuple[int, dict]]) -> list[tuple[int, dict]]:
+        names = [data["name"] for _, data in valid]
+        taken = set(Team.objects.filter(name__in=names).values_list("name", flat=True)) | self.seen_names
+        accepted = []
+        for number, data in valid:
+            if data["name"] in taken:
+                self.report.reject(number, {"name": ["team with this name already exists."]})
+                continue
+            taken.add(data["name"])
+            self.seen_names.add(data["name"])
+            accepted.append((number, data))
+        return accepted
+
+    def write(self, instances: list[Model]) -> None:
+        if not instances:
+            return
+        if self.use_copy:
+            copy_instances(self.model, IMPORT_COLUMNS[self.kind], instances)
+        else:
+            self.model.objects.bulk_create(instances, batch_size=self.chunk_size)
+        self.report.created += len(instances)
@@ -0,0 +1,39 @@
+import time
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authentication import BaseAuthentication, TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from league_planner.authentication import CachedTokenAuthentication, forget_tokens
+
+
+class Command(BaseCommand):
+    help = "Report the per-request cost of token authentication with and without the token cache."  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=2000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            user = User.objects.create_user(username=f"benchmark-auth-{time.time_ns()}")
+            token = Token.objects.create(user=user)
+            self.stdout.write(f"{'authentication':>26} {'us/request':>10} {'queries/request':>15}")
+            for authentication in (TokenAuthentication(), CachedTokenAuthentication()):
+                self.measure(authentication, token.key, options["requests"])
+            forget_tokens(token.key)
+            transaction.set_rollback(True)
+
+    def measure(self, authentication: BaseAuthentication, key: str, requests: int) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            for _ in range(requests):
+                authentication.authenticate_credentials(key)
+            elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"{type(authentication).__name__:>26} {elapsed / requests * 1e6:>10.1f} "
+            f"{len(queries) / requests:>15.3f}",
+        )
@@ -0,0 +1,74 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.test.utils import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from league_planner.models.league import League
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+
+ENDPOINTS = ("leagues-list", "seasons-list", "teams-list", "matches-list", "matches-detail")
+
+
+class Command(BaseCommand):
+    help = "Compare read endpoint latency of the serializer and the fast rendering paths."  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=100)
+        parser.add_argument("--requests", type=int, default=200)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            user = User.objects.create_user(username=f"benchmark-reads-{time.time_ns()}")
+            match = self.populate(user, options["rows"])
+            client = APIClient()
+            client.force_authenticate(user)
+            self.stdout.write(f"{'endpoint':>15} {'serializer ms':>13} {'fast ms':>8} {'speedup':>7}")
+            for url_name in ENDPOINTS:
+                url = reverse(url_name, args=[match.pk]) if url_name.endswith("detail") else reverse(url_name)
+                self.measure(client, url_name, f"{url}?page_size=100", options["requests"])
+            transaction.set_rollback(True)
+
+    def populate(self, user: User, rows: int) -> Match:
+        leagues = League.objects.bulk_create(
+            League(name=f"{user.username} league {number}", owner=user) for number in range(rows)
+        )
+        seasons = Season.objects.bulk_create(
+            Season(league=leagues[0], name=f"{user.username} season {number}") for number in range(rows)
+        )
+        teams = Team.objects.bulk_create(
+            Team(season=seasons[0], name=f"{user.username} team {number}", city="Zabrze", number=number)
+            for number in range(rows)
+        )
+        kickoff = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+        matches = Match.objects.bulk_create(
+            Match(
+                season=seasons[0],
+                host=teams[number],
+                visitor=teams[number - 1],
+                address=f"Stadium {number}",
+                datetime=kickoff + timedelta(days=number),
+            )
+            for number in range(rows)
+        )
+        return matches[0]
+
+    def measure(self, client: APIClient, url_name: str, url: str, requests: int) -> None:
+        timings, contents = [], []
+        for fast in (False, True):
+            with override_settings(FAST_READ_RENDERING=fast):
+                started = time.perf_counter()
+                for _ in range(requests):
+                    response = client.get(url)
+                timings.append((time.perf_counter() - started) / requests * 1e3)
+                contents.append(response.content)
+        if contents[0] != contents[1]:
+            raise CommandError(f"Fast rendering of {url_name} differs from the serializer output.")
+        self.stdout.write(f"{url_name:>15} {timings[0]:>13.2f} {timings[1]:>8.2f} {timings[0] / timings[1]:>6.1f}x")
@@ -0,0 +1,41 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from league_planner.scheduling.optimizer import optimize, Problem, WEIGHTS
+
+
+class Command(BaseCommand):
+    help = "Report schedule optimizer quality against its time budget on a generated season."  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--teams", type=int, default=30)
+        parser.add_argument("--venues", type=int, default=20)
+        parser.add_argument("--days", type=int, default=300)
+        parser.add_argument("--interval-days", type=int, default=2)
+        parser.add_argument("--min-rest-days", type=float, default=3)
+        parser.add_argument("--budgets", type=float, nargs="+", default=[0.5, 1, 2, 5])
+        parser.add_argument("--workers", type=int, default=1)
+        parser.add_argument("--single", action="store_true")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        teams = tuple(range(1, options["teams"] + 1))
+        kickoff = datetime(2000, 1, 1, 18, tzinfo=timezone.utc)
+        problem = Problem(
+            teams=teams,
+            slots=tuple(kickoff + timedelta(days=day) for day in range(0, options["days"], options["interval_days"])),
+            venues={team: f"venue-{team % options['venues']}" for team in teams},
+            double=not options["single"],
+            min_rest_days=options["min_rest_days"],
+        )
+        self.stdout.write(f"{'budget':>8} {'elapsed':>8} {'score':>7} {'iterations':>10}  " + " ".join(WEIGHTS))
+        for budget in options["budgets"]:
+            started = time.perf_counter()
+            result = optimize(problem, budget, options["workers"])
+            elapsed = time.perf_counter() - started
+            violations = " ".join(f"{result.violations[name]:>{len(name)}}" for name in WEIGHTS)
+            self.stdout.write(
+                f"{budget:>7.1f}s {elapsed:>7.2f}s {result.score:>7} {result.iterations:>10}  {violations}",
+            )
@@ -0,0 +1,101 @@
+import random
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+
+from league_planner import scoreboard, standings
+from league_planner.models.league import League
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+
+
+def legacy_scoreboard(season: Season) -> list[Team]:
+    teams = list(Team.objects.filter(season_id=season.id))
+    teams_to_points_map = {team.id: [0, 0] for team in teams}
+    matches = Match.objects.filter(season_id=season.id).annotate(
+        host_points=Case(
+            When(host_score__gt=F("visitor_score"), then=Value(season.points_per_win)),
+            When(host_score=F("visitor_score"), then=Value(season.points_per_draw)),
+            default=Value(season.points_per_lose),
+        ),
+        visitor_points=Case(
+            When(visitor_score__gt=F("host_score"), then=Value(season.points_per_win)),
+            When(visitor_score=F("host_score"), then=Value(season.points_per_draw)),
+            default=Value(season.points_per_lose),
+        ),
+    )
+    for match in matches:
+        if match.host_id is not None:
+            teams_to_points_map[match.host_id][0] += match.host_points
+        if match.visitor_id is not None:
+            teams_to_points_map[match.visitor_id][1] += match.visitor_points
+    for team in teams:
+        points = teams_to_points_map[team.id]
+        team.score = points[0] + points[1]
+        team.score_as_visitor = points[1]
+    teams.sort(key=lambda team: (team.score, team.score_as_visitor), reverse=True)
+    return teams
+
+
+class Command(BaseCommand):
+    help = "Compare scoreboard implementations on a generated season (rolled back afterwards)."  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--teams", type=int, default=20)
+        parser.add_argument("--matches", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args: Any, teams: int, matches: int, repeat: int, seed: int, **options: Any) -> None:
+        with transaction.atomic():
+            season = self.generate_season(teams, matches, random.Random(seed))  # noqa: S311
+            implementations: dict[str, Callable[[Season], list[Team]]] = {
+                "legacy python loop": legacy_scoreboard,
+                "sql aggregation": scoreboard.scoreboard,
+                "standings table": standings.scoreboard,
+            }
+            for name, implementation in implementations.items():
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    implementation(season)
+                    timings.append((time.perf_counter() - started) * 1000)
+                self.stdout.write(
+                    f"{name:<20} median {statistics.median(timings):8.2f} ms  min {min(timings):8.2f} ms",
+                )
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def generate_season(teams_count: int, matches_count: int, rng: random.Random) -> Season:
+        suffix = f"{time.time_ns()}"
+        owner = User.objects.create(username=f"benchmark-{suffix}")
+        league = League.objects.create(name=f"benchmark-{suffix}", owner=owner)
+        season = Season.objects.create(name=f"benchmark-{suffix}", league=league)
+        teams = Team.objects.bulk_create(
+            [Team(season=season, name=f"benchmark-{suffix}-{number}", number=number) for number in range(teams_count)],
+        )
+        kickoff = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        fixtures = []
+        for number in range(matches_count):
+            host, visitor = rng.sample(teams, 2)
+            fixtures.append(
+                Match(
+                    season=season,
+                    host=host,
+                    visitor=visitor,
+                    host_score=rng.randint(0, 5),
+                    visitor_score=rng.randint(0, 5),
+                    datetime=kickoff + timedelta(hours=number),
+                ),
+            )
+        Match.objects.bulk_create(fixtures, batch_size=1000)
+        standings.rebuild_standings([season.id])
+        return season
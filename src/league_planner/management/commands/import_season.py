@@ -0,0 +1,41 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from league_planner.importing import IMPORT_FORMATS, IMPORT_KINDS, SeasonImporter
+from league_planner.models.season import Season
+
+
+class Command(BaseCommand):
+    help = "Stream teams or matches of a season from a CSV or NDJSON file."  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path")
+        parser.add_argument("--season", type=int, required=True)
+        parser.add_argument("--kind", choices=IMPORT_KINDS, required=True)
+        parser.add_argument("--file-format", choices=IMPORT_FORMATS, help="Defaults to the file extension.")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument("--no-copy", action="store_true", help="Use bulk_create instead of COPY.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        season = Season.objects.filter(id=options["season"]).first()
+        if season is None:
+            raise CommandError(f"Season {options['season']} does not exist.")
+        file_format = options["file_format"] or options["path"].rsplit(".", 1)[-1].lower()
+        if file_format not in IMPORT_FORMATS:
+            raise CommandError("Can not infer the format from the file name, pass --file-format.")
+        importer = SeasonImporter(
+            season,
+            options["kind"],
+            chunk_size=options["chunk_size"],
+            use_copy=False if options["no_copy"] else None,
+        )
+        with open(options["path"], "rb") as lines:
+            report = importer.run(lines, file_format)
+        for rejected in report.rejected:
+            self.stderr.write(f"row {rejected['row']}: {rejected['errors']}")
+        self.stdout.write(
+            f"Imported {report.created} of {report.processed} {report.kind} "
+            f"({report.rejected_count} rejected) in {report.seconds:.2f} s, "
+            f"{report.rows_per_second:.0f} rows/s.",
+        )
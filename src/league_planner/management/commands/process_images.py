@@ -0,0 +1,32 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from league_planner.images import claim_image_job, fail_image_job, process_image_job
+
+
+class Command(BaseCommand):
+    help = "Process queued team image uploads."  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--once", action="store_true", help="Exit when the queue is empty.")
+        parser.add_argument("--poll-interval", type=float, default=1.0)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        processed = 0
+        while True:
+            job = claim_image_job()
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+            try:
+                process_image_job(job)
+            except Exception as error:
+                fail_image_job(job, "Image processing failed.")
+                self.stderr.write(f"Image job {job.id} for team {job.team_id} failed: {error!r}")
+            processed += 1
+            self.stdout.write(f"Image job {job.id} for team {job.team_id}: {job.status}")
+        self.stdout.write(f"Processed {processed} image jobs.")
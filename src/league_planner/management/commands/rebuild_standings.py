@@ -0,0 +1,24 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from league_planner import standings
+
+
+class Command(BaseCommand):
+    help = "Rebuild the standings table from matches and verify it against the live computation."  # noqa: A003
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--season", type=int, action="append", dest="seasons", help="Season id (repeatable).")
+        parser.add_argument("--check", action="store_true", help="Only compare the table, do not rebuild it.")
+
+    def handle(self, *args: Any, seasons: list[int] | None = None, check: bool = False, **options: Any) -> None:
+        if not check:
+            rows = standings.rebuild_standings(seasons)
+            self.stdout.write(f"Rebuilt {rows} standing rows.")
+        drift = standings.find_standings_drift(seasons)
+        for season_id, team_id, field, stored, expected in drift:
+            self.stderr.write(f"season={season_id} team={team_id} {field}: stored={stored} expected={expected}")
+        if drift:
+            raise CommandError(f"Standings table differs from live computation in {len(drift)} place(s).")
+        self.stdout.write(self.style.SUCCESS("Standings table matches live computation."))
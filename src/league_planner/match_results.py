@@ -0,0 +1,56 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from league_planner.caching import bump_season_versions
+from league_planner.models.match import Match
+from league_planner.serializers.match import MatchResultSerializer
+from league_planner.standings import rebuild_standings
+
+RESULT_FIELDS = ("host_score", "visitor_score")
+
+
+def submit_results(user: User, entries: list[dict]) -> list[dict]:
+    statuses: list[dict] = []
+    results: dict[int, dict] = {}
+    for entry in entries:
+        serializer = MatchResultSerializer(data=entry)
+        if not serializer.is_valid():
+            statuses.append({"id": entry.get("id"), "status": "invalid", "errors": serializer.errors})
+        elif serializer.validated_data["id"] in results:
+            statuses.append({"id": serializer.validated_data["id"], "status": "duplicate"})
+        else:
+            results[serializer.validated_data["id"]] = serializer.validated_data
+            statuses.append({"id": serializer.validated_data["id"], "status": "pending"})
+
+    with transaction.atomic():
+        matches = {
+            match.id: match
+            for match in Match.objects.filter(id__in=results)
+            .with_owner()
+            .select_for_update(of=("self",))
+            .order_by("id")
+            .only("id", "season_id", *RESULT_FIELDS)
+        }
+        changed: list[Match] = []
+        for item in statuses:
+            if item["status"] != "pending":
+                continue
+            match = matches.get(item["id"])
+            if match is None:
+                item["status"] = "not_found"
+            elif not match.is_owner(user):
+                item["status"] = "forbidden"
+            elif all(getattr(match, field) == results[match.id][field] for field in RESULT_FIELDS):
+                item["status"] = "unchanged"
+            else:
+                for field in RESULT_FIELDS:
+                    setattr(match, field, results[match.id][field])
+                changed.append(match)
+                item["status"] = "updated"
+
+        if changed:
+            season_ids = {match.season_id for match in changed}
+            Match.objects.bulk_update(changed, RESULT_FIELDS, batch_size=500)
+            rebuild_standings(season_ids)
+            bump_season_versions(season_ids)
+    return statuses
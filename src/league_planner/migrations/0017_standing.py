@@ -0,0 +1,100 @@
+# Generated by Django 4.2.8 on 2026-10-18 11:29
+
+from collections import Counter, defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_standings(apps, schema_editor):
+    Match = apps.get_model("league_planner", "Match")
+    Season = apps.get_model("league_planner", "Season")
+    Standing = apps.get_model("league_planner", "Standing")
+    Team = apps.get_model("league_planner", "Team")
+    rules = {
+        season.id: {"wins": season.points_per_win, "draws": season.points_per_draw, "losses": season.points_per_lose}
+        for season in Season.objects.all()
+    }
+    team_seasons = dict(Team.objects.values_list("id", "season_id"))
+    counters = defaultdict(Counter)
+    matches = Match.objects.filter(host_score__isnull=False, visitor_score__isnull=False).values_list(
+        "season_id",
+        "host_id",
+        "visitor_id",
+        "host_score",
+        "visitor_score",
+    )
+    for season_id, host_id, visitor_id, host_score, visitor_score in matches.iterator():
+        sides = ((host_id, "home", host_score, visitor_score), (visitor_id, "away", visitor_score, host_score))
+        for team_id, venue, goals_for, goals_against in sides:
+            if team_id is None or team_seasons.get(team_id) != season_id:
+                continue
+            outcome = "wins" if goals_for > goals_against else "draws" if goals_for == goals_against else "losses"
+            points = rules[season_id][outcome]
+            counters[team_id].update(
+                {
+                    "points": points,
+                    f"{venue}_points": points,
+                    f"{venue}_{outcome}": 1,
+                    "goals_for": goals_for,
+                    "goals_against": goals_against,
+                },
+            )
+    Standing.objects.bulk_create(
+        [
+            Standing(team_id=team_id, season_id=season_id, **counters[team_id])
+            for team_id, season_id in team_seasons.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("league_planner", "0016_season_points_per_draw_season_points_per_lose_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Standing",
+            fields=[
+                (
+                    "team",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="standing",
+                        serialize=False,
+                        to="league_planner.team",
+                    ),
+                ),
+                ("points", models.IntegerField(default=0)),
+                ("home_points", models.IntegerField(default=0)),
+                ("away_points", models.IntegerField(default=0)),
+                ("home_wins", models.IntegerField(default=0)),
+                ("home_draws", models.IntegerField(default=0)),
+                ("home_losses", models.IntegerField(default=0)),
+                ("away_wins", models.IntegerField(default=0)),
+                ("away_draws", models.IntegerField(default=0)),
+                ("away_losses", models.IntegerField(default=0)),
+                ("goals_for", models.IntegerField(default=0)),
+                ("goals_against", models.IntegerField(default=0)),
+                (
+                    "season",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="standings",
+                        to="league_planner.season",
+                        verbose_name="Standing belong to that Season",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-points", "-away_points"],
+                "indexes": [
+                    models.Index(fields=["season", "-points", "-away_points"], name="standing_season_points_idx"),
+                ],
+            },
+        ),
+        migrations.RunPython(populate_standings, migrations.RunPython.noop),
+    ]
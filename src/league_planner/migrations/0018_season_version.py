@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("league_planner", "0017_standing"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SeasonVersion",
+            fields=[
+                (
+                    "season",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="data_version",
+                        serialize=False,
+                        to="league_planner.season",
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("league_planner", "0019_match_conflict_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="match",
+            name="match_season_datetime_idx",
+        ),
+        migrations.AddIndex(
+            model_name="match",
+            index=models.Index(fields=["datetime", "id"], name="match_datetime_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="match",
+            index=models.Index(fields=["season", "datetime", "id"], name="match_season_datetime_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="team",
+            index=models.Index(fields=["number", "id"], name="team_number_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="team",
+            index=models.Index(fields=["season", "number", "id"], name="team_season_number_id_idx"),
+        ),
+    ]
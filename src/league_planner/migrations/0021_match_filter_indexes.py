@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("league_planner", "0020_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="match",
+            index=models.Index(
+                condition=models.Q(("host_score__isnull", True), ("visitor_score__isnull", True), _connector="OR"),
+                fields=["datetime"],
+                name="match_unplayed_datetime_idx",
+            ),
+        ),
+    ]
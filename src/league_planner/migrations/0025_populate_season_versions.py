@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+def populate_season_versions(apps, schema_editor):
+    Season = apps.get_model("league_planner", "Season")
+    SeasonVersion = apps.get_model("league_planner", "SeasonVersion")
+    season_ids = Season.objects.filter(data_version__isnull=True).values_list("id", flat=True)
+    SeasonVersion.objects.bulk_create(
+        [SeasonVersion(season_id=season_id) for season_id in season_ids.iterator()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("league_planner", "0024_image_blob"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_season_versions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,10 @@
+from django.db import models
+
+
+class ImageBlob(models.Model):
+    digest = models.CharField(
+        max_length=64,
+        primary_key=True,
+    )
+    refcount = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
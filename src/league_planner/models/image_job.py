@@ -0,0 +1,44 @@
+from django.db import models
+
+from league_planner.models.team import Team
+
+
+class ImageJob(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        PROCESSING = "processing"
+        DONE = "done"
+        FAILED = "failed"
+
+    team = models.ForeignKey(
+        Team,
+        on_delete=models.CASCADE,
+        related_name="image_jobs",
+    )
+    source = models.FileField(
+        upload_to="images/uploads/",
+        max_length=200,
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    error = models.TextField(
+        blank=True,
+        default="",
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True)
+    finished_at = models.DateTimeField(null=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(
+                fields=["status", "id"],
+                name="image_job_queue_idx",
+                condition=models.Q(status__in=["pending", "processing"]),
+            ),
+        ]
@@ -1,5 +1,7 @@
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class League(models.Model):
@@ -16,6 +18,12 @@ class League(models.Model):
 
     class Meta:
         ordering = ["id"]
+        indexes = [
+            models.Index(
+                OpClass(Upper("name"), name="text_pattern_ops"),
+                name="league_name_upper_idx",
+            ),
+        ]
 
     def is_owner(self, user: User) -> bool:
-        return user == self.owner
+        return user.pk is not None and self.owner_id == user.pk
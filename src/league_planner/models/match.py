@@ -1,10 +1,12 @@
 from django.db import models
-from rest_framework.authtoken.admin import User
 
+from league_planner.models.resource_with_owner import OwnedQuerySet, OwnedResourceMixin
 from league_planner.models.season import Season
 
 
-class Match(models.Model):
+class Match(OwnedResourceMixin, models.Model):
+    owner_path = "season__league__owner_id"
+
     season = models.ForeignKey(
         Season,
         on_delete=models.CASCADE,
@@ -42,9 +44,35 @@ class Match(models.Model):
         null=True,
     )
 
+    objects = OwnedQuerySet.as_manager()
+
     class Meta:
         ordering = ["datetime"]
         verbose_name_plural = "matches"
-
-    def is_owner(self, user: User) -> bool:
-        return self.season.is_owner(user)
+        indexes = [
+            models.Index(
+                fields=["datetime", "id"],
+                name="match_datetime_id_idx",
+            ),
+            models.Index(
+                fields=["season", "datetime", "id"],
+                name="match_season_datetime_id_idx",
+            ),
+            models.Index(
+                fields=["host", "datetime"],
+                name="match_host_datetime_idx",
+            ),
+            models.Index(
+                fields=["visitor", "datetime"],
+                name="match_visitor_datetime_idx",
+            ),
+            models.Index(
+                fields=["address", "datetime"],
+                name="match_address_datetime_idx",
+            ),
+            models.Index(
+                fields=["datetime"],
+                name="match_unplayed_datetime_idx",
+                condition=models.Q(host_score__isnull=True) | models.Q(visitor_score__isnull=True),
+            ),
+        ]
@@ -1,8 +1,32 @@
-from typing import Protocol
+from typing import Any, ClassVar, Protocol
 
+from django.db import models
+from django.db.models import F
 from rest_framework.authtoken.admin import User
 
 
 class ResourceWithOwner(Protocol):
+    owner_path: ClassVar[str]
+
     def is_owner(self, user: User) -> bool:
         ...
+
+
+class OwnedQuerySet(models.QuerySet):
+    def with_owner(self) -> "OwnedQuerySet":
+        return self.annotate(resolved_owner_id=F(self.model.owner_path))
+
+
+class OwnedResourceMixin:
+    owner_path: ClassVar[str]
+    objects: ClassVar[Any]
+    pk: Any
+
+    def resolve_owner_id(self) -> int | None:
+        if "resolved_owner_id" not in self.__dict__:
+            owner_ids = type(self).objects.filter(pk=self.pk).values_list(self.owner_path, flat=True)
+            self.__dict__["resolved_owner_id"] = owner_ids.first()
+        return self.__dict__["resolved_owner_id"]
+
+    def is_owner(self, user: User) -> bool:
+        return user.pk is not None and self.resolve_owner_id() == user.pk
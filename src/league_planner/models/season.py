@@ -1,10 +1,12 @@
 from django.db import models
-from rest_framework.authtoken.admin import User
 
 from league_planner.models.league import League
+from league_planner.models.resource_with_owner import OwnedQuerySet, OwnedResourceMixin
 
 
-class Season(models.Model):
+class Season(OwnedResourceMixin, models.Model):
+    owner_path = "league__owner_id"
+
     league = models.ForeignKey(
         League,
         on_delete=models.CASCADE,
@@ -35,8 +37,7 @@ class Season(models.Model):
         default=0,
     )
 
+    objects = OwnedQuerySet.as_manager()
+
     class Meta:
         ordering = ["start_date"]
-
-    def is_owner(self, user: User) -> bool:
-        return self.league.is_owner(user)
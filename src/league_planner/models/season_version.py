@@ -0,0 +1,13 @@
+from django.db import models
+
+from league_planner.models.season import Season
+
+
+class SeasonVersion(models.Model):
+    season = models.OneToOneField(
+        Season,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="data_version",
+    )
+    version = models.PositiveBigIntegerField(default=0)
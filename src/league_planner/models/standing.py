@@ -0,0 +1,51 @@
+from django.db import models
+
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+
+
+class Standing(models.Model):
+    team = models.OneToOneField(
+        Team,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="standing",
+    )
+    season = models.ForeignKey(
+        Season,
+        on_delete=models.CASCADE,
+        verbose_name="Standing belong to that Season",
+        related_name="standings",
+    )
+    points = models.IntegerField(default=0)
+    home_points = models.IntegerField(default=0)
+    away_points = models.IntegerField(default=0)
+    home_wins = models.IntegerField(default=0)
+    home_draws = models.IntegerField(default=0)
+    home_losses = models.IntegerField(default=0)
+    away_wins = models.IntegerField(default=0)
+    away_draws = models.IntegerField(default=0)
+    away_losses = models.IntegerField(default=0)
+    goals_for = models.IntegerField(default=0)
+    goals_against = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["-points", "-away_points"]
+        indexes = [
+            models.Index(
+                fields=["season", "-points", "-away_points"],
+                name="standing_season_points_idx",
+            ),
+        ]
+
+    @property
+    def wins(self) -> int:
+        return self.home_wins + self.away_wins
+
+    @property
+    def draws(self) -> int:
+        return self.home_draws + self.away_draws
+
+    @property
+    def losses(self) -> int:
+        return self.home_losses + self.away_losses
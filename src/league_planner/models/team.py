@@ -1,10 +1,14 @@
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
-from rest_framework.authtoken.admin import User
+from django.db.models.functions import Upper
 
+from league_planner.models.resource_with_owner import OwnedQuerySet, OwnedResourceMixin
 from league_planner.models.season import Season
 
 
-class Team(models.Model):
+class Team(OwnedResourceMixin, models.Model):
+    owner_path = "season__league__owner_id"
+
     season = models.ForeignKey(
         Season,
         on_delete=models.CASCADE,
@@ -27,8 +31,25 @@ class Team(models.Model):
         null=True,
     )
 
+    objects = OwnedQuerySet.as_manager()
+
     class Meta:
         ordering = ["number"]
-
-    def is_owner(self, user: User) -> bool:
-        return self.season.is_owner(user)
+        indexes = [
+            models.Index(
+                fields=["number", "id"],
+                name="team_number_id_idx",
+            ),
+            models.Index(
+                fields=["season", "number", "id"],
+                name="team_season_number_id_idx",
+            ),
+            models.Index(
+                OpClass(Upper("name"), name="text_pattern_ops"),
+                name="team_name_upper_idx",
+            ),
+            models.Index(
+                OpClass(Upper("city"), name="text_pattern_ops"),
+                name="team_city_upper_idx",
+            ),
+        ]
@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+from django.http import HttpRequest
+from rest_framework.request import Request
+
+from league_planner.authentication import PROCESS_LOCAL_CACHE_BACKENDS
+
+
+def owner_cache_key(model: type[Model], pk: int) -> str:
+    return f"owner:{model._meta.label_lower}:{pk}"
+
+
+def owner_cache_enabled() -> bool:
+    return (
+        settings.OWNERSHIP_CACHE_TTL > 0 and settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS
+    )
+
+
+def cached_owner_id(key: str) -> int | None:
+    return cache.get(key) if owner_cache_enabled() else None
+
+
+def forget_owners(*keys: str) -> None:
+    if owner_cache_enabled():
+        cache.delete_many(keys)
+
+
+class OwnershipResolver:
+    def __init__(self) -> None:
+        self.instances: dict[str, Model | None] = {}
+
+    @classmethod
+    def for_request(cls, request: Request | HttpRequest) -> "OwnershipResolver":
+        http_request = getattr(request, "_request", request)
+        resolver = getattr(http_request, "ownership_resolver", None)
+        if resolver is None:
+            resolver = cls()
+            http_request.ownership_resolver = resolver
+        return resolver
+
+    def get(self, model: type[Model], pk: int) -> Model | None:
+        key = owner_cache_key(model, pk)
+        if key in self.instances:
+            return self.instances[key]
+        if cached_owner_id(key) is not None:
+            self.instances[key] = model.from_db(DEFAULT_DB_ALIAS, ["id"], [pk])
+        else:
+            queryset = model.objects.all()
+            if hasattr(queryset, "with_owner"):
+                queryset = queryset.with_owner()
+            self.instances[key] = queryset.filter(pk=pk).first()
+        return self.instances[key]
+
+    def owner_id(self, model: type[Model], pk: int) -> int | None:
+        key = owner_cache_key(model, pk)
+        owner_id = cached_owner_id(key)
+        if owner_id is not None:
+            return owner_id
+        instance = self.get(model, pk)
+        if instance is None:
+            return None
+        owner_id = instance.resolve_owner_id() if hasattr(instance, "resolve_owner_id") else instance.owner_id
+        if owner_cache_enabled():
+            cache.set(key, owner_id, settings.OWNERSHIP_CACHE_TTL)
+        return owner_id
@@ -1,7 +1,143 @@
+import base64
+import json
+from collections import OrderedDict
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+from rest_framework import exceptions
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
+
+Cursor = tuple[Any, int, bool]
 
 
 class Pagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class KeysetPagination(Pagination):
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+    ordering_query_params = ("search",)
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view: APIView | None = None,
+    ) -> list | None:
+        self.keyset_field = getattr(view, "keyset_field", None)
+        if self.keyset_field is None or self.cursor_query_param not in request.query_params:
+            self.keyset_field = None
+            return super().paginate_queryset(queryset, request, view)
+        ordering_params = [param for param in self.ordering_query_params if request.query_params.get(param)]
+        if ordering_params:
+            message = f"Cursor pagination can not be combined with {', '.join(ordering_params)}."
+            raise exceptions.ValidationError({self.cursor_query_param: [message]})
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        field = queryset.model._meta.get_field(self.keyset_field)
+        cursor = self.decode_cursor(request, field)
+        if cursor is not None and cursor[2]:
+            rows = self.rows_before(queryset, cursor[0], cursor[1])
+            self.has_previous = len(rows) > self.page_size
+            self.has_next = True
+            rows = rows[: self.page_size][::-1]
+        else:
+            rows = self.rows_after(queryset, cursor)
+            self.has_next = len(rows) > self.page_size
+            self.has_previous = cursor is not None
+            rows = rows[: self.page_size]
+        self.first_row = rows[0] if rows else None
+        self.last_row = rows[-1] if rows else None
+        self.cursor = cursor
+        return rows
+
+    def rows_after(self, queryset: QuerySet, cursor: Cursor | None) -> list[Model]:
+        field = self.keyset_field
+        limit = self.page_size + 1
+        rows: list[Model] = []
+        if cursor is None or cursor[0] is not None:
+            filled = queryset.filter(**{f"{field}__isnull": False})
+            if cursor is not None:
+                value, pk, _ = cursor
+                filled = filled.filter(Q(**{f"{field}__gt": value}) | Q(id__gt=pk), **{f"{field}__gte": value})
+            rows = list(filled.order_by(field, "id")[:limit])
+        if len(rows) < limit:
+            empty = queryset.filter(**{f"{field}__isnull": True})
+            if cursor is not None and cursor[0] is None:
+                empty = empty.filter(id__gt=cursor[1])
+            rows += list(empty.order_by("id")[: limit - len(rows)])
+        return rows
+
+    def rows_before(self, queryset: QuerySet, value: Any, pk: int) -> list[Model]:
+        field = self.keyset_field
+        limit = self.page_size + 1
+        rows: list[Model] = []
+        filled = queryset.filter(**{f"{field}__isnull": False})
+        if value is None:
+            empty = queryset.filter(id__lt=pk, **{f"{field}__isnull": True})
+            rows = list(empty.order_by("-id")[:limit])
+        else:
+            filled = filled.filter(Q(**{f"{field}__lt": value}) | Q(id__lt=pk), **{f"{field}__lte": value})
+        if len(rows) < limit:
+            rows += list(filled.order_by(f"-{field}", "-id")[: limit - len(rows)])
+        return rows
+
+    def row_position(self, row: Any, field: str) -> tuple[Any, int]:
+        if isinstance(row, dict):
+            return row[field], row["id"]
+        return getattr(row, field), row.pk
+
+    def decode_cursor(self, request: Request, field: Any) -> Cursor | None:
+        encoded = request.query_params[self.cursor_query_param]
+        if not encoded:
+            return None
+        try:
+            value, pk, reverse = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            return field.to_python(value), int(pk), bool(reverse)
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def cursor_link(self, value: Any, pk: int, reverse: bool) -> str:
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        encoded = base64.urlsafe_b64encode(json.dumps([value, pk, reverse]).encode()).decode()
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def get_next_link(self) -> str | None:
+        if self.keyset_field is None:
+            return super().get_next_link()
+        if not self.has_next or self.last_row is None:
+            return None
+        return self.cursor_link(*self.row_position(self.last_row, self.keyset_field), reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if self.keyset_field is None:
+            return super().get_previous_link()
+        if not self.has_previous or self.cursor is None:
+            return None
+        if self.first_row is not None:
+            return self.cursor_link(*self.row_position(self.first_row, self.keyset_field), reverse=True)
+        value, pk, _ = self.cursor
+        return self.cursor_link(value, pk, reverse=True)
+
+    def get_paginated_response(self, data: list) -> Response:
+        if self.keyset_field is None:
+            return super().get_paginated_response(data)
+        return Response(
+            OrderedDict(
+                next=self.get_next_link(),
+                previous=self.get_previous_link(),
+                results=data,
+            ),
+        )
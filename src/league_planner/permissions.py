@@ -1,3 +1,4 @@
+from django.db.models import Model
 from rest_framework import permissions
 from rest_framework.request import Request
 from rest_framework.viewsets import GenericViewSet
@@ -5,6 +6,7 @@ from rest_framework.viewsets import GenericViewSet
 from league_planner.models.league import League
 from league_planner.models.resource_with_owner import ResourceWithOwner
 from league_planner.models.season import Season
+from league_planner.ownership import OwnershipResolver
 
 
 class IsLeagueOwner(permissions.BasePermission):
@@ -19,7 +21,10 @@ class IsLeagueOwner(permissions.BasePermission):
         return model.is_owner(request.user)
 
 
-class IsLeagueResourceOwner(IsLeagueOwner):
+class OwnedResourcePermission(IsLeagueOwner):
+    parent_field = ""
+    parent_model: type[Model] = Model
+
     def has_permission(
         self,
         request: Request,
@@ -28,32 +33,23 @@ class IsLeagueResourceOwner(IsLeagueOwner):
         if request.method != "POST":
             return True
 
-        league_id = request.data.get("league")
-        if not league_id:
+        parent_id = request.data.get(self.parent_field)
+        if not parent_id or isinstance(parent_id, bool):
             return True
-
         try:
-            league = League.objects.get(id=league_id)
-            return league.is_owner(request.user)
-        except League.DoesNotExist:
+            parent_id = int(parent_id)
+        except (TypeError, ValueError):
             return True
 
+        owner_id = OwnershipResolver.for_request(request).owner_id(self.parent_model, parent_id)
+        return owner_id is None or (request.user.pk is not None and owner_id == request.user.pk)
 
-class IsSeasonResourceOwner(IsLeagueOwner):
-    def has_permission(
-        self,
-        request: Request,
-        view: GenericViewSet,
-    ) -> bool:
-        if request.method != "POST":
-            return True
 
-        season_id = request.data.get("season")
-        if not season_id:
-            return True
+class IsLeagueResourceOwner(OwnedResourcePermission):
+    parent_field = "league"
+    parent_model = League
 
-        try:
-            season = Season.objects.get(id=season_id)
-            return season.is_owner(request.user)
-        except Season.DoesNotExist:
-            return True
+
+class IsSeasonResourceOwner(OwnedResourcePermission):
+    parent_field = "season"
+    parent_model = Season
@@ -0,0 +1,121 @@
+from collections.abc import Callable, Mapping
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any
+
+import orjson
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import QuerySet
+from rest_framework import ISO_8601, serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+Getter = Callable[[Mapping[str, Any]], Any]
+
+
+def _date_converter(field: serializers.DateField) -> Callable[[date], str]:
+    output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+    if output_format is None:
+        raise ImproperlyConfigured(f"Field {field.field_name!r} has no output format.")
+    if output_format.lower() == ISO_8601:
+        return date.isoformat
+    return lambda value: value.strftime(output_format)
+
+
+def _iso_datetime(value: datetime) -> str:
+    formatted = value.isoformat()
+    if formatted.endswith("+00:00"):
+        formatted = formatted[:-6] + "Z"
+    return formatted
+
+
+def _datetime_converter(field: serializers.DateTimeField) -> Callable[[datetime], str]:
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if output_format is None:
+        raise ImproperlyConfigured(f"Field {field.field_name!r} has no output format.")
+    if output_format.lower() == ISO_8601:
+        return lambda value: _iso_datetime(field.enforce_timezone(value))
+    return lambda value: field.enforce_timezone(value).strftime(output_format)
+
+
+def _converted(lookup: str, convert: Callable[[Any], Any]) -> Getter:
+    def getter(row: Mapping[str, Any]) -> Any:
+        value = row[lookup]
+        return None if value is None else convert(value)
+
+    return getter
+
+
+class RowMapper:
+    def __init__(self, serializer: serializers.Serializer, prefix: str = "") -> None:
+        self.key = f"{prefix}{serializer.Meta.model._meta.pk.name}"
+        self.lookups: list[str] = [self.key]
+        self.relations: list[str] = []
+        self.getters: list[tuple[str, Getter]] = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            lookup = prefix + field.source.replace(".", "__")
+            if isinstance(field, serializers.Serializer):
+                nested = RowMapper(field, prefix=f"{lookup}__")
+                self.lookups += nested.lookups
+                self.relations += [lookup, *nested.relations]
+                self.getters.append((name, nested))
+                continue
+            if "." in field.source:
+                self.relations.append(lookup.rsplit("__", 1)[0])
+            self.lookups.append(lookup)
+            self.getters.append((name, self.getter(field, lookup)))
+        self.lookups = list(dict.fromkeys(self.lookups))
+        self.relations = list(dict.fromkeys(self.relations))
+
+    @staticmethod
+    def getter(field: serializers.Field, lookup: str) -> Getter:
+        if isinstance(field, serializers.DateTimeField):
+            return _converted(lookup, _datetime_converter(field))
+        if isinstance(field, serializers.DateField):
+            return _converted(lookup, _date_converter(field))
+        if isinstance(field, (serializers.IntegerField, serializers.CharField, serializers.PrimaryKeyRelatedField)):
+            return itemgetter(lookup)
+        raise ImproperlyConfigured(f"Field {field.field_name!r} of type {type(field).__name__} cannot be mapped.")
+
+    def restrict(self, queryset: QuerySet, *extra_lookups: str) -> QuerySet:
+        if self.relations:
+            queryset = queryset.select_related(*self.relations)
+        return queryset.only(*self.lookups, *extra_lookups)
+
+    def __call__(self, row: Mapping[str, Any]) -> dict[str, Any] | None:
+        if row[self.key] is None:
+            return None
+        return {name: getter(row) for name, getter in self.getters}
+
+
+@lru_cache
+def row_mapper(
+    serializer_class: type[serializers.Serializer],
+    fields: tuple[str, ...] | None = None,
+    expand: tuple[str, ...] = (),
+) -> RowMapper:
+    if fields is None and not expand:
+        return RowMapper(serializer_class())
+    return RowMapper(serializer_class(fields=fields, expand=expand))
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type or "", renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
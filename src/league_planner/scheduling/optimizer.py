@@ -0,0 +1,205 @@
+import math
+import multiprocessing
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+
+from league_planner.scheduling.round_robin import round_robin
+
+WEIGHTS = {
+    "team_clashes": 1000,
+    "venue_clashes": 100,
+    "rest_violations": 10,
+    "imbalance": 5,
+    "breaks": 1,
+}
+SHIFT = 3
+START_TEMPERATURE = 3.0
+END_TEMPERATURE = 0.05
+
+
+@dataclass(frozen=True)
+class Problem:
+    teams: tuple[int, ...]
+    slots: tuple[datetime, ...]
+    venues: dict[int, str] = field(default_factory=dict)
+    double: bool = False
+    min_rest_days: float = 0
+
+
+@dataclass
+class ScheduleResult:
+    score: int
+    violations: dict[str, int]
+    fixtures: list[tuple[int, int, int]]
+    restarts: int = 1
+    iterations: int = 0
+
+
+class _Search:
+    def __init__(self, problem: Problem, rng: random.Random, shuffle: bool) -> None:
+        self.problem = problem
+        self.rng = rng
+        rounds = round_robin(problem.teams, problem.double)
+        if shuffle:
+            rng.shuffle(rounds)
+        self.home: list[int] = []
+        self.away: list[int] = []
+        self.slot: list[int] = []
+        last_slot = len(problem.slots) - 1
+        for number, pairings in enumerate(rounds):
+            slot = round(number * last_slot / max(len(rounds) - 1, 1))
+            for home, away in pairings:
+                self.home.append(home)
+                self.away.append(away)
+                self.slot.append(slot)
+        self.partner = self._leg_partners()
+        first_slot = problem.slots[0]
+        self.slot_days = [(slot - first_slot).total_seconds() / 86400 for slot in problem.slots]
+        self.team_fixtures: dict[int, list[int]] = {team: [] for team in problem.teams}
+        for fixture, (home, away) in enumerate(zip(self.home, self.away)):
+            self.team_fixtures[home].append(fixture)
+            self.team_fixtures[away].append(fixture)
+        self.venue_usage: Counter = Counter()
+        self.venue_cost = 0
+        for fixture in range(len(self.slot)):
+            self._occupy(fixture, 1)
+        self.team_cost = {team: self._weighted(self._team_violations(team)) for team in problem.teams}
+        self.cost = self.venue_cost + sum(self.team_cost.values())
+
+    def _leg_partners(self) -> list[int]:
+        legs: dict[frozenset, list[int]] = {}
+        for fixture, pairing in enumerate(zip(self.home, self.away)):
+            legs.setdefault(frozenset(pairing), []).append(fixture)
+        partner = [-1] * len(self.home)
+        for fixtures in legs.values():
+            if len(fixtures) == 2:
+                partner[fixtures[0]], partner[fixtures[1]] = fixtures[1], fixtures[0]
+        return partner
+
+    def _venue(self, fixture: int) -> str | None:
+        return self.problem.venues.get(self.home[fixture])
+
+    def _occupy(self, fixture: int, delta: int) -> None:
+        venue = self._venue(fixture)
+        if venue is None:
+            return
+        key = (venue, self.slot[fixture])
+        if delta > 0 and self.venue_usage[key] >= 1:
+            self.venue_cost += WEIGHTS["venue_clashes"]
+        self.venue_usage[key] += delta
+        if delta < 0 and self.venue_usage[key] >= 1:
+            self.venue_cost -= WEIGHTS["venue_clashes"]
+
+    def _team_violations(self, team: int) -> dict[str, int]:
+        fixtures = sorted(self.team_fixtures[team], key=self.slot.__getitem__)
+        violations = dict.fromkeys(WEIGHTS, 0)
+        home_games = 0
+        previous_slot = previous_home = None
+        for fixture in fixtures:
+            slot, is_home = self.slot[fixture], self.home[fixture] == team
+            home_games += is_home
+            if previous_slot is not None:
+                if slot == previous_slot:
+                    violations["team_clashes"] += 1
+                elif self.slot_days[slot] - self.slot_days[previous_slot] < self.problem.min_rest_days:
+                    violations["rest_violations"] += 1
+                if is_home == previous_home:
+                    violations["breaks"] += 1
+            previous_slot, previous_home = slot, is_home
+        violations["imbalance"] = max(0, abs(2 * home_games - len(fixtures)) - 1)
+        return violations
+
+    @staticmethod
+    def _weighted(violations: dict[str, int]) -> int:
+        return sum(WEIGHTS[name] * count for name, count in violations.items())
+
+    def place(self, fixture: int, slot: int, home: int, away: int) -> None:
+        self._occupy(fixture, -1)
+        self.slot[fixture], self.home[fixture], self.away[fixture] = slot, home, away
+        self._occupy(fixture, 1)
+
+    def attempt(self, changes: list[tuple[int, int, int, int]], temperature: float) -> None:
+        teams = {team for fixture, *_ in changes for team in (self.home[fixture], self.away[fixture])}
+        previous = [(fixture, self.slot[fixture], self.home[fixture], self.away[fixture]) for fixture, *_ in changes]
+        venue_cost = self.venue_cost
+        for change in changes:
+            self.place(*change)
+        team_cost = {team: self._weighted(self._team_violations(team)) for team in teams}
+        delta = self.venue_cost - venue_cost + sum(team_cost[team] - self.team_cost[team] for team in teams)
+        if delta <= 0 or self.rng.random() < math.exp(-delta / temperature):
+            self.team_cost.update(team_cost)
+            self.cost += delta
+            return
+        for change in reversed(previous):
+            self.place(*change)
+
+    def random_changes(self) -> list[tuple[int, int, int, int]]:
+        fixture = self.rng.randrange(len(self.slot))
+        move = self.rng.random()
+        if move < 0.4:
+            slot = min(max(self.slot[fixture] + self.rng.randint(-SHIFT, SHIFT), 0), len(self.problem.slots) - 1)
+            return [(fixture, slot, self.home[fixture], self.away[fixture])]
+        if move < 0.6:
+            other = self.rng.randrange(len(self.slot))
+            return [
+                (fixture, self.slot[other], self.home[fixture], self.away[fixture]),
+                (other, self.slot[fixture], self.home[other], self.away[other]),
+            ]
+        fixtures = [fixture] if self.partner[fixture] < 0 else [fixture, self.partner[fixture]]
+        return [(leg, self.slot[leg], self.away[leg], self.home[leg]) for leg in fixtures]
+
+    def violations(self) -> dict[str, int]:
+        totals: Counter = Counter()
+        for team in self.problem.teams:
+            totals.update(self._team_violations(team))
+        totals["venue_clashes"] = self.venue_cost // WEIGHTS["venue_clashes"]
+        return {name: totals[name] for name in WEIGHTS}
+
+    def snapshot(self) -> list[tuple[int, int, int]]:
+        return list(zip(self.home, self.away, self.slot))
+
+
+def anneal(problem: Problem, seed: int, deadline: float) -> ScheduleResult:
+    search = _Search(problem, random.Random(seed), shuffle=seed > 0)  # noqa: S311
+    best_cost, best = search.cost, search.snapshot()
+    started = time.time()
+    span = max(deadline - started, 1e-6)
+    temperature, iterations = START_TEMPERATURE, 0
+    while best_cost > 0 and search.slot:
+        if iterations % 256 == 0:
+            now = time.time()
+            if now >= deadline:
+                break
+            temperature = START_TEMPERATURE * (END_TEMPERATURE / START_TEMPERATURE) ** ((now - started) / span)
+        search.attempt(search.random_changes(), temperature)
+        iterations += 1
+        if search.cost < best_cost:
+            best_cost, best = search.cost, search.snapshot()
+    for fixture, (home, away, slot) in enumerate(best):
+        search.place(fixture, slot, home, away)
+    return ScheduleResult(score=best_cost, violations=search.violations(), fixtures=best, iterations=iterations)
+
+
+@lru_cache(maxsize=1)
+def worker_pool(workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def optimize(problem: Problem, budget: float, workers: int = 1) -> ScheduleResult:
+    if len(problem.teams) < 2 or not problem.slots:
+        return ScheduleResult(score=0, violations=dict.fromkeys(WEIGHTS, 0), fixtures=[], restarts=0)
+    deadline = time.time() + budget
+    if workers <= 1:
+        results = [anneal(problem, 0, deadline)]
+    else:
+        futures = [worker_pool(workers).submit(anneal, problem, seed, deadline) for seed in range(workers)]
+        results = [future.result() for future in futures]
+    best = min(results, key=lambda result: result.score)
+    best.restarts = len(results)
+    best.iterations = sum(result.iterations for result in results)
+    return best
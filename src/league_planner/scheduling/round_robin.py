@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+from datetime import date, timedelta
+
+Pairing = tuple[int, int]
+
+
+def round_robin(team_ids: Sequence[int], double: bool = False) -> list[list[Pairing]]:
+    teams: list[int | None] = list(team_ids)
+    if len(teams) % 2:
+        teams.append(None)
+    rounds = []
+    for round_number in range(len(teams) - 1):
+        pairings = []
+        for index in range(len(teams) // 2):
+            home, away = teams[index], teams[-1 - index]
+            if round_number % 2:
+                home, away = away, home
+            if home is not None and away is not None:
+                pairings.append((home, away))
+        rounds.append(pairings)
+        teams.insert(1, teams.pop())
+    if double:
+        rounds += [[(away, home) for home, away in pairings] for pairings in rounds]
+    return rounds
+
+
+def rounds_count(teams_count: int, double: bool = False) -> int:
+    rounds = teams_count - 1 + teams_count % 2 if teams_count > 1 else 0
+    return rounds * 2 if double else rounds
+
+
+def spread_dates(start: date, end: date | None, rounds: int, interval_days: int) -> list[date]:
+    if end is None or rounds < 2:
+        return [start + timedelta(days=interval_days * number) for number in range(rounds)]
+    span = (end - start).days
+    return [start + timedelta(days=round(span * number / (rounds - 1))) for number in range(rounds)]
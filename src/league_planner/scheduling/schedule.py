@@ -0,0 +1,97 @@
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from league_planner.caching import bump_season_versions
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+from league_planner.scheduling.optimizer import optimize, Problem, ScheduleResult
+from league_planner.scheduling.round_robin import Pairing, round_robin, spread_dates
+
+
+def season_team_ids(season: Season) -> list[int]:
+    teams = Team.objects.filter(season_id=season.id).order_by(F("number").asc(nulls_last=True), "id")
+    return list(teams.values_list("id", flat=True))
+
+
+def build_matches(
+    season: Season,
+    rounds: Sequence[Sequence[Pairing]],
+    dates: Sequence[date],
+    kickoff: time,
+) -> list[Match]:
+    tz = timezone.get_current_timezone()
+    return [
+        Match(
+            season=season,
+            host_id=host_id,
+            visitor_id=visitor_id,
+            datetime=datetime.combine(day, kickoff, tzinfo=tz),
+        )
+        for day, pairings in zip(dates, rounds)
+        for host_id, visitor_id in pairings
+    ]
+
+
+def build_round_robin(season: Season, double: bool, kickoff: time, interval_days: int) -> list[Match]:
+    rounds = round_robin(season_team_ids(season), double)
+    dates = spread_dates(season.start_date, season.end_date, len(rounds), interval_days)
+    return build_matches(season, rounds, dates, kickoff)
+
+
+def schedule_slots(season: Season, rounds_count: int, kickoffs: Sequence[time], interval_days: int) -> list[datetime]:
+    tz = timezone.get_current_timezone()
+    end_date = season.end_date or season.start_date + timedelta(days=interval_days * max(rounds_count - 1, 0))
+    days = range(0, (end_date - season.start_date).days + 1, interval_days)
+    return [
+        datetime.combine(season.start_date + timedelta(days=day), kickoff, tzinfo=tz)
+        for day in days
+        for kickoff in sorted(kickoffs)
+    ]
+
+
+def build_optimized(
+    season: Season,
+    double: bool,
+    kickoffs: Sequence[time],
+    interval_days: int,
+    min_rest_days: float,
+    venues: dict[int, str],
+    budget: float,
+    workers: int,
+) -> tuple[list[Match], ScheduleResult]:
+    team_ids = season_team_ids(season)
+    rounds_count = len(round_robin(team_ids, double))
+    slots = schedule_slots(season, rounds_count, kickoffs, interval_days)
+    problem = Problem(
+        teams=tuple(team_ids),
+        slots=tuple(slots),
+        venues=venues,
+        double=double,
+        min_rest_days=min_rest_days,
+    )
+    result = optimize(problem, budget, workers)
+    matches = [
+        Match(
+            season=season,
+            host_id=host_id,
+            visitor_id=visitor_id,
+            datetime=slots[slot],
+            address=venues.get(host_id),
+        )
+        for host_id, visitor_id, slot in sorted(result.fixtures, key=lambda fixture: fixture[2])
+    ]
+    return matches, result
+
+
+def save_schedule(season: Season, matches: list[Match], replace: bool = False) -> list[Match]:
+    with transaction.atomic():
+        if replace:
+            Match.objects.filter(season_id=season.id).delete()
+        matches = Match.objects.bulk_create(matches, batch_size=1000)
+    bump_season_versions([season.id])
+    return matches
@@ -0,0 +1,234 @@
+from collections.abc import Iterable
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+
+from django.db import connection
+from django.db.models import Model
+from django.db.models.query import RawQuerySet
+
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+
+MATCHES_SQL = "SELECT * FROM {match} WHERE season_id IN ({season_ids})"
+
+MATCHDAYS_SQL = """
+SELECT * FROM (
+    SELECT matches.*, DENSE_RANK() OVER (PARTITION BY season_id ORDER BY CAST(datetime AS DATE)) AS round
+    FROM ({matches}) matches
+    WHERE datetime IS NOT NULL
+) matchdays
+WHERE round <= %s
+"""
+
+SCOREBOARD_SQL = """
+WITH sides AS (
+    SELECT
+        m.season_id,
+        CASE WHEN side.is_home = 1 THEN m.host_id ELSE m.visitor_id END AS team_id,
+        CASE WHEN side.is_home = 1 THEN m.host_score ELSE m.visitor_score END AS goals_for,
+        CASE WHEN side.is_home = 1 THEN m.visitor_score ELSE m.host_score END AS goals_against,
+        side.is_home
+    FROM ({matches}) m
+    CROSS JOIN (SELECT 1 AS is_home UNION ALL SELECT 0) side
+    WHERE m.host_score IS NOT NULL
+        AND m.visitor_score IS NOT NULL
+),
+outcomes AS (
+    SELECT
+        sides.season_id,
+        sides.team_id,
+        sides.is_home,
+        sides.goals_for,
+        sides.goals_against,
+        CASE WHEN sides.goals_for > sides.goals_against THEN 1 ELSE 0 END AS win,
+        CASE WHEN sides.goals_for = sides.goals_against THEN 1 ELSE 0 END AS draw,
+        CASE WHEN sides.goals_for < sides.goals_against THEN 1 ELSE 0 END AS loss,
+        CASE
+            WHEN sides.goals_for > sides.goals_against THEN s.points_per_win
+            WHEN sides.goals_for = sides.goals_against THEN s.points_per_draw
+            ELSE s.points_per_lose
+        END AS points
+    FROM sides
+    JOIN {season} s ON s.id = sides.season_id
+),
+totals AS (
+    SELECT
+        season_id,
+        team_id,
+        SUM(points) AS score,
+        SUM(points * is_home) AS score_as_host,
+        SUM(points * (1 - is_home)) AS score_as_visitor,
+        SUM(win * is_home) AS home_wins,
+        SUM(draw * is_home) AS home_draws,
+        SUM(loss * is_home) AS home_losses,
+        SUM(win * (1 - is_home)) AS away_wins,
+        SUM(draw * (1 - is_home)) AS away_draws,
+        SUM(loss * (1 - is_home)) AS away_losses,
+        SUM(goals_for) AS goals_for,
+        SUM(goals_against) AS goals_against
+    FROM outcomes
+    GROUP BY season_id, team_id
+)
+SELECT
+    t.*,
+    COALESCE(totals.score, 0) AS score,
+    COALESCE(totals.score_as_host, 0) AS score_as_host,
+    COALESCE(totals.score_as_visitor, 0) AS score_as_visitor,
+    COALESCE(totals.home_wins, 0) AS home_wins,
+    COALESCE(totals.home_draws, 0) AS home_draws,
+    COALESCE(totals.home_losses, 0) AS home_losses,
+    COALESCE(totals.away_wins, 0) AS away_wins,
+    COALESCE(totals.away_draws, 0) AS away_draws,
+    COALESCE(totals.away_losses, 0) AS away_losses,
+    COALESCE(totals.home_wins + totals.away_wins, 0) AS wins,
+    COALESCE(totals.home_draws + totals.away_draws, 0) AS draws,
+    COALESCE(totals.home_losses + totals.away_losses, 0) AS losses,
+    COALESCE(totals.goals_for, 0) AS goals_for,
+    COALESCE(totals.goals_against, 0) AS goals_against,
+    COALESCE(totals.goals_for - totals.goals_against, 0) AS goal_difference
+FROM {team} t
+LEFT JOIN totals ON totals.team_id = t.id AND totals.season_id = t.season_id
+WHERE t.season_id IN ({season_ids})
+ORDER BY
+    t.season_id,
+    score DESC,
+    score_as_visitor DESC,
+    goal_difference DESC,
+    goals_for DESC,
+    t.number ASC NULLS LAST,
+    t.id
+"""
+
+
+PROGRESSION_SQL = """
+WITH matchdays AS (
+    SELECT
+        m.*,
+        CAST(m.datetime AS DATE) AS day,
+        DENSE_RANK() OVER (ORDER BY CAST(m.datetime AS DATE)) AS round
+    FROM {match} m
+    WHERE m.season_id = %s AND m.datetime IS NOT NULL
+),
+rounds AS (
+    SELECT DISTINCT round, day FROM matchdays
+),
+sides AS (
+    SELECT
+        md.round,
+        CASE WHEN side.is_home = 1 THEN md.host_id ELSE md.visitor_id END AS team_id,
+        CASE WHEN side.is_home = 1 THEN md.host_score ELSE md.visitor_score END AS goals_for,
+        CASE WHEN side.is_home = 1 THEN md.visitor_score ELSE md.host_score END AS goals_against,
+        side.is_home,
+        s.points_per_win,
+        s.points_per_draw,
+        s.points_per_lose
+    FROM matchdays md
+    JOIN {season} s ON s.id = md.season_id
+    CROSS JOIN (SELECT 1 AS is_home UNION ALL SELECT 0) side
+    WHERE md.host_score IS NOT NULL AND md.visitor_score IS NOT NULL
+),
+round_totals AS (
+    SELECT
+        round,
+        team_id,
+        SUM(points) AS points,
+        SUM(points * (1 - is_home)) AS away_points,
+        SUM(goals_for - goals_against) AS goal_difference,
+        SUM(goals_for) AS goals_for
+    FROM (
+        SELECT
+            sides.*,
+            CASE
+                WHEN goals_for > goals_against THEN points_per_win
+                WHEN goals_for = goals_against THEN points_per_draw
+                ELSE points_per_lose
+            END AS points
+        FROM sides
+    ) scored
+    GROUP BY round, team_id
+),
+cumulative AS (
+    SELECT
+        rounds.round,
+        rounds.day,
+        t.id AS team_id,
+        t.number,
+        SUM(COALESCE(rt.points, 0)) OVER team_rounds AS score,
+        SUM(COALESCE(rt.away_points, 0)) OVER team_rounds AS score_as_visitor,
+        SUM(COALESCE(rt.goal_difference, 0)) OVER team_rounds AS goal_difference,
+        SUM(COALESCE(rt.goals_for, 0)) OVER team_rounds AS goals_for
+    FROM rounds
+    CROSS JOIN {team} t
+    LEFT JOIN round_totals rt ON rt.round = rounds.round AND rt.team_id = t.id
+    WHERE t.season_id = %s
+    WINDOW team_rounds AS (PARTITION BY t.id ORDER BY rounds.round)
+)
+SELECT
+    round,
+    day,
+    team_id,
+    ROW_NUMBER() OVER (
+        PARTITION BY round
+        ORDER BY score DESC, score_as_visitor DESC, goal_difference DESC, goals_for DESC, number ASC NULLS LAST, team_id
+    ) AS position,
+    score,
+    score_as_visitor,
+    goal_difference,
+    goals_for
+FROM cumulative
+ORDER BY round, position
+"""
+
+
+def _table(model: type[Model]) -> str:
+    return connection.ops.quote_name(model._meta.db_table)
+
+
+def _matches_sql(season_ids: list[int], until: datetime | None, rounds: int | None) -> tuple[str, list]:
+    sql = MATCHES_SQL.format(match=_table(Match), season_ids=_placeholders(season_ids))
+    params: list = list(season_ids)
+    if until is not None:
+        sql += " AND datetime <= %s"
+        params.append(until)
+    if rounds is not None:
+        sql = MATCHDAYS_SQL.format(matches=sql)
+        params.append(rounds)
+    return sql, params
+
+
+def _placeholders(values: list) -> str:
+    return ", ".join(["%s"] * len(values)) or "NULL"
+
+
+def scoreboard_queryset(
+    season_ids: Iterable[int],
+    until: datetime | None = None,
+    rounds: int | None = None,
+) -> RawQuerySet:
+    season_ids = list(season_ids)
+    matches, params = _matches_sql(season_ids, until, rounds)
+    sql = SCOREBOARD_SQL.format(
+        matches=matches,
+        season=_table(Season),
+        team=_table(Team),
+        season_ids=_placeholders(season_ids),
+    )
+    return Team.objects.raw(sql, params + season_ids)
+
+
+def scoreboard(season: Season, until: datetime | None = None, rounds: int | None = None) -> list[Team]:
+    return list(scoreboard_queryset([season.id], until, rounds))
+
+
+def progression(season: Season) -> list[dict]:
+    sql = PROGRESSION_SQL.format(match=_table(Match), season=_table(Season), team=_table(Team))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [season.id, season.id])
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    return [
+        {"round": round_number, "date": day, "standings": list(standings)}
+        for (round_number, day), standings in groupby(rows, key=itemgetter("round", "day"))
+    ]
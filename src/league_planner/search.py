@@ -0,0 +1,41 @@
+from functools import reduce
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection
+from django.db.models import Case, F, FloatField, Q, QuerySet, Value, When
+from django.db.models.functions import Greatest, Upper
+
+TRIGRAM_EXTENSION_SQL = "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"
+SEARCH_MAX_LENGTH = 50
+
+_trigram_available: dict[str, bool] = {}
+
+
+def trigram_available() -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    if connection.alias not in _trigram_available:
+        with connection.cursor() as cursor:
+            cursor.execute(TRIGRAM_EXTENSION_SQL)
+            _trigram_available[connection.alias] = cursor.fetchone() is not None
+    return _trigram_available[connection.alias]
+
+
+def search_queryset(queryset: QuerySet, term: str, fields: tuple[str, ...]) -> QuerySet:
+    term = term.strip()[:SEARCH_MAX_LENGTH]
+    if not term:
+        return queryset
+    primary = fields[0]
+    matches = reduce(Q.__or__, (Q(**{f"{field}__istartswith": term}) for field in fields))
+    rank = Case(
+        When(**{f"{primary}__iexact": term}, then=Value(3.0)),
+        When(**{f"{primary}__istartswith": term}, then=Value(2.0)),
+        When(matches, then=Value(1.0)),
+        default=Value(0.0),
+        output_field=FloatField(),
+    )
+    if trigram_available():
+        matches |= reduce(Q.__or__, (Q(**{f"{field}__trigram_similar": term}) for field in fields))
+        similarities = [TrigramSimilarity(field, term) for field in fields]
+        rank = rank + (Greatest(*similarities) if len(similarities) > 1 else similarities[0])
+    return queryset.filter(matches).annotate(search_rank=rank).order_by(F("search_rank").desc(), Upper(primary), "id")
@@ -0,0 +1,23 @@
+from typing import Any
+
+from django.db.models import Model
+from rest_framework import serializers
+
+from league_planner.ownership import OwnershipResolver
+
+
+class ResolvedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    def to_internal_value(self, data: Any) -> Model:
+        request = self.context.get("request")
+        if request is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        instance = OwnershipResolver.for_request(request).get(self.get_queryset().model, pk)
+        if instance is None:
+            self.fail("does_not_exist", pk_value=data)
+        return instance
@@ -0,0 +1,48 @@
+from collections.abc import Collection
+from typing import Any
+
+from rest_framework import serializers
+
+
+class FieldsetSerializerMixin(serializers.Serializer):
+    expandable_fields: dict[str, type[serializers.Serializer]] = {}
+
+    def __init__(
+        self,
+        *args: Any,
+        fields: Collection[str] | None = None,
+        expand: Collection[str] = (),
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        for name in expand:
+            self.fields[name] = self.expandable_fields[name](read_only=True)
+        if fields is not None:
+            for name in [name for name in self.fields if name not in fields and name not in expand]:
+                self.fields.pop(name)
+
+
+class FieldsetQuerySerializer(serializers.Serializer):
+    fields = serializers.CharField(required=False, allow_blank=True)
+    expand = serializers.CharField(required=False, allow_blank=True)
+    sideload = serializers.BooleanField(default=False)
+
+    def names(self, value: str, allowed: Collection[str]) -> tuple[str, ...]:
+        if not value:
+            return ()
+        names = tuple(dict.fromkeys(name.strip() for name in value.split(",")))
+        unknown = [name for name in names if name not in allowed]
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown fields: {', '.join(unknown)}. Choose from: {', '.join(allowed)}.",
+            )
+        return names
+
+    def validate_fields(self, value: str) -> tuple[str, ...] | None:
+        if not value:
+            return None
+        serializer = self.context["serializer_class"]()
+        return self.names(value, [name for name, field in serializer.fields.items() if not field.write_only])
+
+    def validate_expand(self, value: str) -> tuple[str, ...]:
+        return self.names(value, list(getattr(self.context["serializer_class"], "expandable_fields", {})))
@@ -0,0 +1,30 @@
+from rest_framework import serializers
+
+from league_planner.importing import IMPORT_FORMATS, IMPORT_KINDS
+
+
+class ImportRequestSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(choices=IMPORT_KINDS)
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(
+        choices=IMPORT_FORMATS,
+        required=False,
+    )
+
+    def validate(self, attrs: dict) -> dict:
+        if "file_format" not in attrs:
+            extension = attrs["file"].name.rsplit(".", 1)[-1].lower()
+            if extension not in IMPORT_FORMATS:
+                raise serializers.ValidationError({"file_format": "Can not infer the format from the file name."})
+            attrs["file_format"] = extension
+        return attrs
+
+
+class ImportReportSerializer(serializers.Serializer):
+    kind = serializers.CharField()
+    processed = serializers.IntegerField()
+    created = serializers.IntegerField()
+    rejected_count = serializers.IntegerField()
+    rejected = serializers.ListField(child=serializers.DictField())
+    seconds = serializers.FloatField()
+    rows_per_second = serializers.FloatField()
@@ -2,9 +2,10 @@ from django.contrib.auth.models import User
 from rest_framework import serializers
 
 from league_planner.models.league import League
+from league_planner.serializers.fieldsets import FieldsetSerializerMixin
 
 
-class LeagueSerializer(serializers.ModelSerializer):
+class LeagueSerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
     id = serializers.IntegerField(read_only=True)  # noqa: A003
     name = serializers.CharField()
     owner = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
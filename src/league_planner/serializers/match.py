@@ -1,16 +1,23 @@
+import copy
+
 from rest_framework import serializers
 
+from league_planner.conflicts import conflicting_match_ids
 from league_planner.models.match import Match
 from league_planner.models.season import Season
 from league_planner.models.team import Team
+from league_planner.serializers.fields import ResolvedPrimaryKeyRelatedField
+from league_planner.serializers.fieldsets import FieldsetSerializerMixin
 from league_planner.serializers.season import SeasonSerializer
 from league_planner.serializers.team import TeamSerializer
 from league_planner.settings import DEFAULT_DATETIME_FORMAT
 
 
-class MatchSerializer(serializers.ModelSerializer):
+class MatchSerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
+    expandable_fields = {"season": SeasonSerializer, "host": TeamSerializer, "visitor": TeamSerializer}
+
     id = serializers.IntegerField(read_only=True)  # noqa: A003
-    season = serializers.PrimaryKeyRelatedField(queryset=Season.objects.all())
+    season = ResolvedPrimaryKeyRelatedField(queryset=Season.objects.all())
     host = serializers.PrimaryKeyRelatedField(
         queryset=Team.objects.all(),
         required=False,
@@ -49,6 +56,72 @@ class MatchSerializer(serializers.ModelSerializer):
             "datetime",
         )
 
+    def validate(self, attrs: dict) -> dict:
+        request = self.context.get("request")
+        if request is None:
+            return attrs
+        query_serializer = ConflictCheckQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        if not query_serializer.validated_data["reject_conflicts"]:
+            return attrs
+        match = copy.copy(self.instance) if self.instance is not None else Match()
+        for field, value in attrs.items():
+            setattr(match, field, value)
+        conflicts = conflicting_match_ids(match)
+        if conflicts:
+            raise serializers.ValidationError(
+                {"datetime": f"Match conflicts with matches {', '.join(map(str, conflicts))}."},
+            )
+        return attrs
+
+
+class ConflictCheckQuerySerializer(serializers.Serializer):
+    reject_conflicts = serializers.BooleanField(default=False)
+
+
+class MatchImportSerializer(MatchSerializer):
+    host = serializers.CharField(max_length=50)
+    visitor = serializers.CharField(max_length=50)
+
+    class Meta:
+        model = Match
+        fields = ("host", "host_score", "visitor", "visitor_score", "address", "datetime")
+
+    def validate_host(self, value: str) -> int:
+        return self.team_id(value)
+
+    def validate_visitor(self, value: str) -> int:
+        return self.team_id(value)
+
+    def team_id(self, name: str) -> int:
+        team_id = self.context["team_ids"].get(name)
+        if team_id is None:
+            raise serializers.ValidationError(f"Team {name!r} does not exist in this season.")
+        return team_id
+
+
+class MatchResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()  # noqa: A003
+    host_score = serializers.IntegerField(allow_null=True)
+    visitor_score = serializers.IntegerField(allow_null=True)
+
+
+class BulkResultsSerializer(serializers.Serializer):
+    results = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=1000,
+    )
+
+
+class ConflictSerializer(serializers.Serializer):
+    type = serializers.CharField()  # noqa: A003
+    season = serializers.IntegerField(source="season_id")
+    team = serializers.IntegerField(allow_null=True)
+    address = serializers.CharField(allow_null=True)
+    datetime = serializers.DateTimeField(format=DEFAULT_DATETIME_FORMAT)
+    matches = serializers.ListField(child=serializers.IntegerField())
+
 
 class MatchDetailSerializer(MatchSerializer):
     season = SeasonSerializer(read_only=True)
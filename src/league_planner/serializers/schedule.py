@@ -0,0 +1,79 @@
+from datetime import time
+
+from django.conf import settings
+from rest_framework import serializers
+
+from league_planner.models.match import Match
+from league_planner.models.team import Team
+from league_planner.scheduling.round_robin import rounds_count
+
+
+class ScheduleRequestSerializer(serializers.Serializer):
+    double = serializers.BooleanField(default=False)
+    dry_run = serializers.BooleanField(default=False)
+    replace = serializers.BooleanField(default=False)
+    kickoff = serializers.TimeField(default=time(18, 0))
+    interval_days = serializers.IntegerField(
+        default=7,
+        min_value=1,
+    )
+
+    def validate(self, attrs: dict) -> dict:
+        season = self.context["season"]
+        if season.start_date is None:
+            raise serializers.ValidationError("Season needs a start_date to be scheduled.")
+        if season.end_date is not None and season.end_date < season.start_date:
+            raise serializers.ValidationError("Season end_date is before its start_date.")
+        if season.end_date is not None:
+            days = (season.end_date - season.start_date).days + 1
+            rounds = rounds_count(Team.objects.filter(season_id=season.id).count(), attrs["double"])
+            if rounds > days:
+                raise serializers.ValidationError(
+                    f"Season spans {days} days but needs {rounds} match days, extend its end_date.",
+                )
+        if not attrs["dry_run"] and not attrs["replace"] and Match.objects.filter(season_id=season.id).exists():
+            raise serializers.ValidationError("Season already has matches, pass replace to overwrite them.")
+        return attrs
+
+
+class OptimizeScheduleRequestSerializer(ScheduleRequestSerializer):
+    kickoffs = serializers.ListField(
+        child=serializers.TimeField(),
+        min_length=1,
+        required=False,
+    )
+    interval_days = serializers.IntegerField(
+        default=1,
+        min_value=1,
+    )
+    min_rest_days = serializers.FloatField(
+        default=3,
+        min_value=0,
+    )
+    venues = serializers.DictField(
+        child=serializers.CharField(max_length=100),
+        default=dict,
+    )
+    budget = serializers.FloatField(
+        default=2,
+        min_value=0.1,
+    )
+
+    def validate_budget(self, value: float) -> float:
+        if value > settings.SCHEDULER_MAX_BUDGET:
+            raise serializers.ValidationError(f"Budget can not exceed {settings.SCHEDULER_MAX_BUDGET} seconds.")
+        return value
+
+    def validate_venues(self, value: dict) -> dict[int, str]:
+        if not all(str(team_id).isdigit() for team_id in value):
+            raise serializers.ValidationError("Venues must be keyed by team id.")
+        venues = {int(team_id): address for team_id, address in value.items()}
+        season_teams = Team.objects.filter(season_id=self.context["season"].id, id__in=venues)
+        if venues and season_teams.count() != len(venues):
+            raise serializers.ValidationError("Venues can only be assigned to teams of the season.")
+        return venues
+
+    def validate(self, attrs: dict) -> dict:
+        attrs = super().validate(attrs)
+        attrs.setdefault("kickoffs", [attrs["kickoff"]])
+        return attrs
@@ -2,11 +2,16 @@ from rest_framework import serializers
 
 from league_planner.models.league import League
 from league_planner.models.season import Season
+from league_planner.serializers.fields import ResolvedPrimaryKeyRelatedField
+from league_planner.serializers.fieldsets import FieldsetSerializerMixin
+from league_planner.serializers.league import LeagueSerializer
 
 
-class SeasonSerializer(serializers.ModelSerializer):
+class SeasonSerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
+    expandable_fields = {"league": LeagueSerializer}
+
     id = serializers.IntegerField(read_only=True)  # noqa: A003
-    league = serializers.PrimaryKeyRelatedField(queryset=League.objects.all())
+    league = ResolvedPrimaryKeyRelatedField(queryset=League.objects.all())
     name = serializers.CharField()
     start_date = serializers.DateField(
         required=False,
@@ -36,3 +41,50 @@ class SeasonSerializer(serializers.ModelSerializer):
             "points_per_draw",
             "points_per_lose",
         )
+
+
+class ScoreboardQuerySerializer(serializers.Serializer):
+    as_of = serializers.DateTimeField(required=False)
+    round = serializers.IntegerField(  # noqa: A003
+        required=False,
+        min_value=1,
+    )
+
+    def validate(self, attrs: dict) -> dict:
+        if "as_of" in attrs and "round" in attrs:
+            raise serializers.ValidationError("Use either as_of or round, not both.")
+        return attrs
+
+
+class ScoreboardsQuerySerializer(serializers.Serializer):
+    max_seasons = 100
+
+    ids = serializers.RegexField(
+        r"^\d+(,\d+)*$",
+        required=False,
+    )
+    league = serializers.IntegerField(required=False)
+
+    def validate(self, attrs: dict) -> dict:
+        if ("ids" in attrs) == ("league" in attrs):
+            raise serializers.ValidationError("Provide either ids or league.")
+        if "ids" in attrs:
+            attrs["ids"] = list(dict.fromkeys(int(season_id) for season_id in attrs["ids"].split(",")))
+            if len(attrs["ids"]) > self.max_seasons:
+                raise serializers.ValidationError(f"Ask for at most {self.max_seasons} seasons at once.")
+        return attrs
+
+
+class ProgressionStandingSerializer(serializers.Serializer):
+    id = serializers.IntegerField(source="team_id")  # noqa: A003
+    position = serializers.IntegerField()
+    score = serializers.IntegerField()
+    score_as_visitor = serializers.IntegerField()
+    goal_difference = serializers.IntegerField()
+    goals_for = serializers.IntegerField()
+
+
+class ProgressionRoundSerializer(serializers.Serializer):
+    round = serializers.IntegerField()  # noqa: A003
+    date = serializers.DateField()
+    standings = ProgressionStandingSerializer(many=True)
@@ -1,13 +1,22 @@
+from django.conf import settings
+from django.core.files.base import File
 from rest_framework import serializers
 
+from league_planner.images import DEFAULT_IMAGE_FORMAT, DEFAULT_IMAGE_SIZE, IMAGE_FORMATS, IMAGE_SIZES
+from league_planner.models.image_job import ImageJob
 from league_planner.models.season import Season
 from league_planner.models.team import Team
+from league_planner.serializers.fields import ResolvedPrimaryKeyRelatedField
+from league_planner.serializers.fieldsets import FieldsetSerializerMixin
 from league_planner.serializers.season import SeasonSerializer
+from league_planner.settings import DEFAULT_DATETIME_FORMAT
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(FieldsetSerializerMixin, serializers.ModelSerializer):
+    expandable_fields = {"season": SeasonSerializer}
+
     id = serializers.IntegerField(read_only=True)  # noqa: A003
-    season = serializers.PrimaryKeyRelatedField(queryset=Season.objects.all())
+    season = ResolvedPrimaryKeyRelatedField(queryset=Season.objects.all())
     name = serializers.CharField()
     city = serializers.CharField(required=False)
     number = serializers.IntegerField(required=False)
@@ -17,27 +26,79 @@ class TeamSerializer(serializers.ModelSerializer):
         fields = ("id", "season", "name", "city", "number")
 
 
+class TeamImportSerializer(TeamSerializer):
+    name = serializers.CharField(max_length=50)
+    city = serializers.CharField(max_length=50, required=False)
+
+    class Meta:
+        model = Team
+        fields = ("name", "city", "number")
+
+
 class TeamDetailSerializer(TeamSerializer):
     season = SeasonSerializer(read_only=True)
 
 
 class TeamImageSerializer(serializers.Serializer):
-    image = serializers.ImageField()
+    image = serializers.FileField()
 
     class Meta:
         model = Team
         fields = ("image",)
 
-    def update(self, instance: Team, validated_data: dict) -> Team:
-        instance.image = validated_data.get("image", instance.image)
-        instance.image.name = f"team_{instance.id}.png"
-        instance.save()
-        return instance
+    def validate_image(self, image: File) -> File:
+        if image.size > settings.IMAGE_UPLOAD_MAX_BYTES:
+            raise serializers.ValidationError(f"Upload at most {settings.IMAGE_UPLOAD_MAX_BYTES} bytes.")
+        return image
+
+
+class ImageJobSerializer(serializers.ModelSerializer):
+    created_at = serializers.DateTimeField(format=DEFAULT_DATETIME_FORMAT, read_only=True)
+    started_at = serializers.DateTimeField(format=DEFAULT_DATETIME_FORMAT, read_only=True)
+    finished_at = serializers.DateTimeField(format=DEFAULT_DATETIME_FORMAT, read_only=True)
+
+    class Meta:
+        model = ImageJob
+        fields = ("id", "team", "status", "error", "attempts", "created_at", "started_at", "finished_at")
+        read_only_fields = fields
+
+
+class TeamImageQuerySerializer(serializers.Serializer):
+    size = serializers.ChoiceField(choices=IMAGE_SIZES, default=DEFAULT_IMAGE_SIZE)
+    format = serializers.ChoiceField(choices=tuple(IMAGE_FORMATS), default=DEFAULT_IMAGE_FORMAT)  # noqa: A003
 
 
 class ScoreboardSerializer(TeamSerializer):
     score = serializers.IntegerField(read_only=True)
+    score_as_host = serializers.IntegerField(read_only=True)
+    score_as_visitor = serializers.IntegerField(read_only=True)
+    wins = serializers.IntegerField(read_only=True)
+    draws = serializers.IntegerField(read_only=True)
+    losses = serializers.IntegerField(read_only=True)
+    goals_for = serializers.IntegerField(read_only=True)
+    goals_against = serializers.IntegerField(read_only=True)
+    goal_difference = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Team
-        fields = ("id", "season", "name", "city", "number", "score")
+        fields = (
+            "id",
+            "season",
+            "name",
+            "city",
+            "number",
+            "score",
+            "score_as_host",
+            "score_as_visitor",
+            "wins",
+            "draws",
+            "losses",
+            "goals_for",
+            "goals_against",
+            "goal_difference",
+        )
+
+
+class SeasonScoreboardSerializer(serializers.Serializer):
+    season = serializers.IntegerField()
+    results = ScoreboardSerializer(many=True)
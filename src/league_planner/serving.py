@@ -0,0 +1,119 @@
+import mimetypes
+import re
+from collections.abc import Iterator
+from typing import IO
+
+from django.conf import settings
+from django.core.files.storage import Storage
+from django.http import FileResponse, HttpRequest, HttpResponse, HttpResponseBase, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework.request import Request
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+CHUNK_SIZE = 64 * 1024
+
+
+def file_range(header: str, size: int) -> tuple[int, int] | None:
+    match = RANGE_PATTERN.match(header.strip())
+    if match is None:
+        raise ValueError(header)
+    first, last = match.groups()
+    if not first and not last:
+        raise ValueError(header)
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return None
+    return start, end
+
+
+def iter_range(file: IO[bytes], start: int, length: int) -> Iterator[bytes]:
+    with file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                return
+            length -= len(chunk)
+            yield chunk
+
+
+def if_range_matches(request: HttpRequest | Request, etag: str, last_modified: int) -> bool:
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if if_range is None:
+        return True
+    if if_range.startswith(('"', "W/")):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def offloaded_response(storage: Storage, name: str, content_type: str) -> HttpResponse:
+    response = HttpResponse(content_type=content_type)
+    if settings.FILE_SENDFILE_HEADER == "X-Sendfile":
+        response["X-Sendfile"] = storage.path(name)
+    else:
+        response[settings.FILE_SENDFILE_HEADER] = settings.FILE_SENDFILE_PREFIX + name
+    return response
+
+
+def serve_file(
+    request: HttpRequest | Request,
+    storage: Storage,
+    name: str,
+    content_type: str | None = None,
+    cache_control: str = "private, no-cache",
+) -> HttpResponseBase:
+    size = storage.size(name)
+    last_modified = int(storage.get_modified_time(name).timestamp())
+    etag = f'"{last_modified:x}-{size:x}"'
+    content_type = content_type or mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        if settings.FILE_SENDFILE_HEADER:
+            response = offloaded_response(storage, name, content_type)
+        else:
+            response = ranged_response(request, storage, name, size, content_type, etag, last_modified)
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = cache_control
+    return response
+
+
+def ranged_response(
+    request: HttpRequest | Request,
+    storage: Storage,
+    name: str,
+    size: int,
+    content_type: str,
+    etag: str,
+    last_modified: int,
+) -> HttpResponseBase:
+    header = request.META.get("HTTP_RANGE")
+    response: HttpResponseBase
+    if header and request.method == "GET" and if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = file_range(header, size)
+        except ValueError:
+            byte_range = (0, size - 1)
+        if byte_range is None:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+        start, end = byte_range
+        if (start, end) != (0, size - 1):
+            response = StreamingHttpResponse(
+                iter_range(storage.open(name), start, end - start + 1),
+                status=206,
+                content_type=content_type,
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+            response["Content-Length"] = str(end - start + 1)
+            response["Accept-Ranges"] = "bytes"
+            return response
+    response = FileResponse(storage.open(name), content_type=content_type)
+    response["Accept-Ranges"] = "bytes"
+    return response
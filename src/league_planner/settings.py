@@ -17,6 +17,7 @@ INSTALLED_APPS = [
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
+    "django.contrib.postgres",
     "rest_framework.authtoken",
     "django_filters",
     "corsheaders",
@@ -69,6 +70,24 @@ DATABASES = {
     },
 }
 
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", default=300)
+GUNICORN_TIMEOUT = env.int("GUNICORN_TIMEOUT", default=58)
+SCHEDULER_MAX_BUDGET = min(env.float("SCHEDULER_MAX_BUDGET", default=5.0), GUNICORN_TIMEOUT / 4)
+SCHEDULER_WORKERS = env.int("SCHEDULER_WORKERS", default=1)
+OWNERSHIP_CACHE_TTL = env.int("OWNERSHIP_CACHE_TTL", default=0)
+TOKEN_CACHE_TTL = env.int("TOKEN_CACHE_TTL", default=300)
+TOKEN_CACHE_SIZE = env.int("TOKEN_CACHE_SIZE", default=1024)
+TOKEN_CACHE_LOCAL_TTL = env.float("TOKEN_CACHE_LOCAL_TTL", default=5.0)
+FILE_SENDFILE_HEADER = env.str("FILE_SENDFILE_HEADER", default="")
+FILE_SENDFILE_PREFIX = env.str("FILE_SENDFILE_PREFIX", default="/protected-media/")
+IMAGE_UPLOAD_MAX_BYTES = env.int("IMAGE_UPLOAD_MAX_BYTES", default=20 * 1024 * 1024)
+IMAGE_JOB_TIMEOUT = env.int("IMAGE_JOB_TIMEOUT", default=300)
+IMAGE_JOB_MAX_ATTEMPTS = env.int("IMAGE_JOB_MAX_ATTEMPTS", default=3)
+FAST_READ_RENDERING = env.bool("FAST_READ_RENDERING", default=False)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -97,7 +116,7 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework.authentication.TokenAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("league_planner.authentication.CachedTokenAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
@@ -0,0 +1,135 @@
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from league_planner import standings
+from league_planner.authentication import forget_tokens
+from league_planner.caching import bump_season_versions
+from league_planner.images import release_team_image
+from league_planner.models.league import League
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.season_version import SeasonVersion
+from league_planner.models.standing import Standing
+from league_planner.models.team import Team
+from league_planner.ownership import forget_owners, owner_cache_enabled, owner_cache_key
+
+
+@receiver(pre_save, sender=Match)
+def remember_match_result(sender: type[Match], instance: Match, **kwargs: Any) -> None:
+    instance._previous_result = None
+    if instance._state.adding:
+        return
+    row = (
+        Match.objects.filter(pk=instance.pk)
+        .values_list("season_id", "host_id", "visitor_id", "host_score", "visitor_score")
+        .first()
+    )
+    if row is not None:
+        instance._previous_result = standings.MatchResult(*row)
+
+
+@receiver(post_save, sender=Match)
+def update_standings_on_match_save(sender: type[Match], instance: Match, **kwargs: Any) -> None:
+    standings.apply_match_change(
+        getattr(instance, "_previous_result", None),
+        standings.MatchResult.from_match(instance),
+    )
+
+
+@receiver(post_delete, sender=Match)
+def update_standings_on_match_delete(sender: type[Match], instance: Match, **kwargs: Any) -> None:
+    standings.apply_match_change(standings.MatchResult.from_match(instance), None)
+
+
+@receiver(post_save, sender=Match)
+@receiver(post_delete, sender=Match)
+def bump_match_season_version(sender: type[Match], instance: Match, **kwargs: Any) -> None:
+    previous = getattr(instance, "_previous_result", None)
+    bump_season_versions([previous.season_id if previous else None, instance.season_id])
+
+
+@receiver(pre_save, sender=Season)
+def remember_points_rule(sender: type[Season], instance: Season, **kwargs: Any) -> None:
+    instance._previous_points_rule = None
+    if instance._state.adding:
+        return
+    previous = Season.objects.filter(pk=instance.pk).first()
+    if previous is not None:
+        instance._previous_points_rule = standings.PointsRule.from_season(previous)
+
+
+@receiver(post_save, sender=Season)
+def update_standings_on_points_rule_change(sender: type[Season], instance: Season, **kwargs: Any) -> None:
+    previous = getattr(instance, "_previous_points_rule", None)
+    if previous is not None and previous != standings.PointsRule.from_season(instance):
+        standings.apply_points_rule(instance)
+
+
+@receiver(post_save, sender=Season)
+def bump_season_version(sender: type[Season], instance: Season, created: bool, **kwargs: Any) -> None:
+    if created:
+        SeasonVersion.objects.create(season=instance)
+    else:
+        bump_season_versions([instance.pk])
+
+
+@receiver(pre_save, sender=Team)
+def remember_team_season(sender: type[Team], instance: Team, **kwargs: Any) -> None:
+    instance._previous_season_id = None
+    if not instance._state.adding:
+        instance._previous_season_id = Team.objects.filter(pk=instance.pk).values_list("season_id", flat=True).first()
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def bump_team_season_version(sender: type[Team], instance: Team, **kwargs: Any) -> None:
+    bump_season_versions([getattr(instance, "_previous_season_id", None), instance.season_id])
+
+
+@receiver(post_save, sender=Team)
+def create_team_standing(sender: type[Team], instance: Team, created: bool, **kwargs: Any) -> None:
+    if created:
+        Standing.objects.get_or_create(team=instance, defaults={"season_id": instance.season_id})
+        return
+    moved = Standing.objects.filter(team_id=instance.pk).exclude(season_id=instance.season_id)
+    if moved.update(season_id=instance.season_id):
+        standings.rebuild_standings([instance.season_id])
+
+
+@receiver(post_save, sender=Season)
+@receiver(post_delete, sender=Season)
+def forget_season_owner(sender: type[Season], instance: Season, **kwargs: Any) -> None:
+    forget_owners(owner_cache_key(Season, instance.pk))
+
+
+@receiver(post_save, sender=League)
+@receiver(post_delete, sender=League)
+def forget_league_owner(sender: type[League], instance: League, **kwargs: Any) -> None:
+    if kwargs.get("created") or not owner_cache_enabled():
+        return
+    season_ids = Season.objects.filter(league_id=instance.pk).values_list("id", flat=True)
+    forget_owners(
+        owner_cache_key(League, instance.pk),
+        *(owner_cache_key(Season, season_id) for season_id in season_ids),
+    )
+
+
+@receiver(post_delete, sender=Token)
+def forget_deleted_token(sender: type[Token], instance: Token, **kwargs: Any) -> None:
+    forget_tokens(instance.key)
+
+
+@receiver(post_save, sender=User)
+def forget_user_tokens(sender: type[User], instance: User, created: bool, **kwargs: Any) -> None:
+    if not created and settings.TOKEN_CACHE_TTL:
+        forget_tokens(*Token.objects.filter(user=instance).values_list("key", flat=True))
+
+
+@receiver(post_delete, sender=Team)
+def release_deleted_team_image(sender: type[Team], instance: Team, **kwargs: Any) -> None:
+    release_team_image(instance)
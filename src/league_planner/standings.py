@@ -0,0 +1,210 @@
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import F, Q
+
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.standing import Standing
+from league_planner.models.team import Team
+from league_planner.scoreboard import scoreboard_queryset
+
+STANDING_COUNTERS = (
+    "points",
+    "home_points",
+    "away_points",
+    "home_wins",
+    "home_draws",
+    "home_losses",
+    "away_wins",
+    "away_draws",
+    "away_losses",
+    "goals_for",
+    "goals_against",
+)
+SCOREBOARD_ATTRIBUTES = {
+    "points": "score",
+    "home_points": "score_as_host",
+    "away_points": "score_as_visitor",
+}
+
+
+@dataclass(frozen=True)
+class PointsRule:
+    win: int
+    draw: int
+    lose: int
+
+    @classmethod
+    def from_season(cls, season: Season) -> "PointsRule":
+        return cls(season.points_per_win, season.points_per_draw, season.points_per_lose)
+
+    def points(self, outcome: str) -> int:
+        return {"wins": self.win, "draws": self.draw, "losses": self.lose}[outcome]
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    season_id: int
+    host_id: int | None
+    visitor_id: int | None
+    host_score: int | None
+    visitor_score: int | None
+
+    @classmethod
+    def from_match(cls, match: Match) -> "MatchResult":
+        return cls(match.season_id, match.host_id, match.visitor_id, match.host_score, match.visitor_score)
+
+    @property
+    def is_played(self) -> bool:
+        return self.host_score is not None and self.visitor_score is not None
+
+    def deltas(self, rule: PointsRule, sign: int = 1) -> dict[int, Counter]:
+        deltas: dict[int, Counter] = defaultdict(Counter)
+        if self.host_score is None or self.visitor_score is None:
+            return deltas
+        sides = (
+            (self.host_id, "home", self.host_score, self.visitor_score),
+            (self.visitor_id, "away", self.visitor_score, self.host_score),
+        )
+        for team_id, venue, goals_for, goals_against in sides:
+            if team_id is None:
+                continue
+            outcome = "wins" if goals_for > goals_against else "draws" if goals_for == goals_against else "losses"
+            points = rule.points(outcome) * sign
+            deltas[team_id].update(
+                {
+                    "points": points,
+                    f"{venue}_points": points,
+                    f"{venue}_{outcome}": sign,
+                    "goals_for": goals_for * sign,
+                    "goals_against": goals_against * sign,
+                },
+            )
+        return deltas
+
+
+Drift = tuple[int, int, str, int | None, int | None]
+
+
+def points_rules(season_ids: Iterable[int]) -> dict[int, PointsRule]:
+    seasons = Season.objects.filter(id__in=set(season_ids)).only(
+        "points_per_win",
+        "points_per_draw",
+        "points_per_lose",
+    )
+    return {season.id: PointsRule.from_season(season) for season in seasons}
+
+
+def apply_match_change(previous: MatchResult | None, current: MatchResult | None) -> None:
+    if previous == current:
+        return
+    changes = [(result, sign) for result, sign in ((previous, -1), (current, 1)) if result and result.is_played]
+    if not changes:
+        return
+    rules = points_rules(result.season_id for result, _ in changes)
+    totals: dict[tuple[int, int], Counter] = defaultdict(Counter)
+    for result, sign in changes:
+        for team_id, delta in result.deltas(rules[result.season_id], sign).items():
+            totals[(result.season_id, team_id)].update(delta)
+    for (season_id, team_id), delta in totals.items():
+        updates = {field: F(field) + value for field, value in delta.items() if value}
+        if updates:
+            Standing.objects.filter(team_id=team_id, season_id=season_id).update(**updates)
+
+
+def apply_points_rule(season: Season) -> None:
+    rule = PointsRule.from_season(season)
+    home_points = F("home_wins") * rule.win + F("home_draws") * rule.draw + F("home_losses") * rule.lose
+    away_points = F("away_wins") * rule.win + F("away_draws") * rule.draw + F("away_losses") * rule.lose
+    Standing.objects.filter(season_id=season.id).update(
+        home_points=home_points,
+        away_points=away_points,
+        points=home_points + away_points,
+    )
+
+
+def compute_standings(season_ids: Iterable[int] | None = None) -> dict[int, dict[int, Counter]]:
+    if season_ids is None:
+        season_ids = Season.objects.values_list("id", flat=True)
+    standings: dict[int, dict[int, Counter]] = defaultdict(dict)
+    for team in scoreboard_queryset(season_ids):
+        standings[team.season_id][team.id] = Counter(
+            {field: getattr(team, SCOREBOARD_ATTRIBUTES.get(field, field)) for field in STANDING_COUNTERS},
+        )
+    return standings
+
+
+def rebuild_standings(season_ids: Iterable[int] | None = None) -> int:
+    with transaction.atomic():
+        if season_ids is None:
+            stale = Standing.objects.all()
+        else:
+            season_ids = set(season_ids)
+            stale = Standing.objects.filter(Q(season_id__in=season_ids) | Q(team__season_id__in=season_ids))
+        computed = compute_standings(season_ids)
+        stale.delete()
+        rows = [
+            Standing(team_id=team_id, season_id=season_id, **counters)
+            for season_id, teams in computed.items()
+            for team_id, counters in teams.items()
+        ]
+        Standing.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def find_standings_drift(season_ids: Iterable[int] | None = None) -> list[Drift]:
+    computed = compute_standings(season_ids)
+    stored = Standing.objects.all()
+    if season_ids is not None:
+        stored = stored.filter(Q(season_id__in=computed.keys()) | Q(team_id__in=_team_ids(computed)))
+    stored_rows = {row["team_id"]: row for row in stored.values("team_id", "season_id", *STANDING_COUNTERS)}
+    drift: list[Drift] = []
+    for season_id, teams in computed.items():
+        for team_id, counters in teams.items():
+            row = stored_rows.pop(team_id, None)
+            if row is None or row["season_id"] != season_id:
+                drift.append((season_id, team_id, "season_id", row["season_id"] if row else None, season_id))
+                continue
+            for field in STANDING_COUNTERS:
+                if row[field] != counters[field]:
+                    drift.append((season_id, team_id, field, row[field], counters[field]))
+    for team_id, row in stored_rows.items():
+        drift.append((row["season_id"], team_id, "team_id", team_id, None))
+    return drift
+
+
+def _team_ids(computed: dict[int, dict[int, Counter]]) -> list[int]:
+    return [team_id for teams in computed.values() for team_id in teams]
+
+
+def scoreboard(season: Season) -> list[Team]:
+    standings = (
+        Standing.objects.filter(season_id=season.id)
+        .select_related("team")
+        .annotate(goal_difference=F("goals_for") - F("goals_against"))
+        .order_by(
+            "-points",
+            "-away_points",
+            "-goal_difference",
+            "-goals_for",
+            F("team__number").asc(nulls_last=True),
+            "team_id",
+        )
+    )
+    teams = []
+    for standing in standings:
+        team = standing.team
+        team.score = standing.points
+        team.score_as_host = standing.home_points
+        team.score_as_visitor = standing.away_points
+        team.wins = standing.wins
+        team.draws = standing.draws
+        team.losses = standing.losses
+        team.goals_for = standing.goals_for
+        team.goals_against = standing.goals_against
+        team.goal_difference = standing.goal_difference
+        teams.append(team)
+    return teams
@@ -2,12 +2,15 @@ from typing import Generator
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from pytest_django.fixtures import SettingsWrapper
 from pytest_django.lazy_django import skip_if_no_django
 from pytest_factoryboy import register
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
+from league_planner.authentication import token_cache
+
 from .factories import LeagueFactory, MatchFactory, SeasonFactory, TeamFactory, UserFactory
 
 pytestmark = [pytest.mark.django_db]
@@ -28,6 +31,15 @@ def session_settings() -> "Generator":
     wrapper.finalize()
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache() -> "Generator":
+    cache.clear()
+    token_cache.clear()
+    yield
+    cache.clear()
+    token_cache.clear()
+
+
 @pytest.fixture()
 def test_user(user_factory: "UserFactory") -> "User":
     return user_factory.create(username="test", password="test")  # noqa: S105, S106
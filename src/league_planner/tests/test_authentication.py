@@ -0,0 +1,122 @@
+from pathlib import Path
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from league_planner.authentication import token_cache, token_cache_key
+from league_planner.tests.factories import LeagueFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_cached_token_authentication(
+    api_client: APIClient,
+    league_factory: LeagueFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    league = league_factory.create()
+    url = reverse("leagues-detail", args=[league.pk])
+    with django_assert_num_queries(2):
+        response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK, response
+    with django_assert_num_queries(1):
+        response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK, response
+
+    token_cache.clear()
+    with django_assert_num_queries(2):
+        response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK, response
+
+
+def test_shared_token_cache(
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    tmp_path: Path,
+    test_user: User,
+    test_token: Token,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": tmp_path},
+    }
+    with django_assert_num_queries(2):
+        response = api_client.get(reverse("leagues-list"))
+    assert response.status_code == status.HTTP_200_OK, response
+    assert cache.get(token_cache_key(test_token.key)) == (test_user.pk, True)
+
+    token_cache.clear()
+    with django_assert_num_queries(1):
+        response = api_client.get(reverse("leagues-list"))
+    assert response.status_code == status.HTTP_200_OK, response
+
+    test_user.is_active = False
+    test_user.save()
+    assert cache.get(token_cache_key(test_token.key)) is None
+    response = api_client.get(reverse("leagues-list"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response
+
+
+def test_process_local_cache_is_not_used_for_tokens(api_client: APIClient, test_token: Token) -> None:
+    assert api_client.get(reverse("leagues-list")).status_code == status.HTTP_200_OK
+    assert cache.get(token_cache_key(test_token.key)) is None
+
+
+def test_cached_token_authentication_disabled(
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    settings.TOKEN_CACHE_TTL = 0
+    for _ in range(2):
+        with django_assert_num_queries(2):
+            response = api_client.get(reverse("leagues-list"))
+        assert response.status_code == status.HTTP_200_OK, response
+
+
+def test_invalid_token(api_client: APIClient) -> None:
+    api_client.credentials(HTTP_AUTHORIZATION="Token invalid")
+    response = api_client.get(reverse("leagues-list"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response
+
+
+def test_logout(api_client: APIClient, test_token: Token) -> None:
+    assert api_client.get(reverse("leagues-list")).status_code == status.HTTP_200_OK
+    response = api_client.post("/logout/")
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response
+    assert not Token.objects.filter(key=test_token.key).exists()
+    response = api_client.get(reverse("leagues-list"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response
+
+
+def test_token_rotation(api_client: APIClient, test_user: User, test_token: Token) -> None:
+    assert api_client.get(reverse("leagues-list")).status_code == status.HTTP_200_OK
+    test_token.delete()
+    new_token = Token.objects.create(user=test_user)
+    response = api_client.get(reverse("leagues-list"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response
+    api_client.credentials(HTTP_AUTHORIZATION="Token " + new_token.key)
+    assert api_client.get(reverse("leagues-list")).status_code == status.HTTP_200_OK
+
+
+def test_user_deactivation(api_client: APIClient, test_user: User) -> None:
+    assert api_client.get(reverse("leagues-list")).status_code == status.HTTP_200_OK
+    test_user.is_active = False
+    test_user.save()
+    response = api_client.get(reverse("leagues-list"))
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED, response
+
+
+def test_benchmark_auth_command(capsys: pytest.CaptureFixture) -> None:
+    call_command("benchmark_auth", requests=5)
+    output = capsys.readouterr().out
+    assert "CachedTokenAuthentication" in output
+    assert not User.objects.exists()
@@ -0,0 +1,162 @@
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.caching import bump_season_versions, season_versions
+from league_planner.models.season import Season
+from league_planner.models.season_version import SeasonVersion
+from league_planner.tests.factories import MatchFactory, SeasonFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_bump_season_versions(season_factory: SeasonFactory) -> None:
+    season1 = season_factory.create()
+    season2 = season_factory.create()
+    bump_season_versions([season1.pk])
+    bump_season_versions([season1.pk, season2.pk, None])
+    assert season_versions([season2.pk, season1.pk]) == [(season1.pk, 2), (season2.pk, 1)]
+
+
+def test_scoreboard_etag(
+    api_client: APIClient,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    test_user: User,
+) -> None:
+    season = season_factory.create(league__owner=test_user)
+    team = team_factory.create(season=season)
+    url = reverse("seasons-scoreboard", args=[season.pk])
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK, response
+    etag = response["ETag"]
+
+    with django_assert_num_queries(2):
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED, response
+    assert response["ETag"] == etag
+
+    with django_assert_num_queries(2):
+        response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response["ETag"] == etag
+    assert response.data["results"][0]["id"] == team.pk
+
+    response = api_client.patch(reverse("teams-detail", args=[team.pk]), data={"city": "Bytom"}, format="json")
+    assert response.status_code == status.HTTP_200_OK, response
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response["ETag"] != etag
+    assert response.data["results"][0]["city"] == "Bytom"
+
+
+def test_scoreboard_of_missing_season(api_client: APIClient) -> None:
+    response = api_client.get("/seasons/abc/scoreboard/")
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response
+    response = api_client.get(reverse("seasons-scoreboard", args=[0]))
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response
+
+
+def test_scoreboard_of_deleted_season(api_client: APIClient, season_factory: SeasonFactory, test_user: User) -> None:
+    season = season_factory.create(league__owner=test_user)
+    url = reverse("seasons-scoreboard", args=[season.pk])
+    assert api_client.get(url).status_code == status.HTTP_200_OK
+    Season.objects.filter(pk=season.pk).delete()
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response
+
+
+def test_model_writes_bump_season_versions(
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+) -> None:
+    season, other = season_factory.create(), season_factory.create()
+    assert season_versions([season.pk, other.pk]) == [(season.pk, 0), (other.pk, 0)]
+    team = team_factory.create(season=season)
+    match = match_factory.create(season=season, host=team, visitor=team_factory.create(season=season))
+    assert season_versions([season.pk]) == [(season.pk, 3)]
+
+    match.host_score = 0
+    match.save()
+    team.season = other
+    team.save()
+    assert season_versions([season.pk, other.pk]) == [(season.pk, 5), (other.pk, 1)]
+
+    match.delete()
+    season.points_per_win = 2
+    season.save()
+    assert season_versions([season.pk]) == [(season.pk, 7)]
+
+
+def test_matches_list_invalidated_by_writes(
+    api_client: APIClient,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+    test_user: User,
+) -> None:
+    season = season_factory.create(league__owner=test_user)
+    host = team_factory.create(season=season)
+    visitor = team_factory.create(season=season)
+    match = match_factory.create(season=season, host=host, visitor=visitor)
+    url = f"{reverse('matches-list')}?season={season.pk}"
+    etag = api_client.get(url)["ETag"]
+    assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = api_client.patch(reverse("matches-detail", args=[match.pk]), data={"host_score": 0}, format="json")
+    assert response.status_code == status.HTTP_200_OK, response
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["results"][0]["host_score"] == 0
+    etag = response["ETag"]
+
+    response = api_client.patch(
+        reverse("seasons-detail", args=[season.pk]),
+        data={"points_per_win": 2},
+        format="json",
+    )
+    assert response.status_code == status.HTTP_200_OK, response
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["results"][0]["season"]["points_per_win"] == 2
+    etag = response["ETag"]
+
+    response = api_client.delete(reverse("matches-detail", args=[match.pk]))
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["count"] == 0
+
+
+def test_list_without_season_filter_is_not_cached(
+    api_client: APIClient,
+    team_factory: TeamFactory,
+) -> None:
+    team_factory.create()
+    response = api_client.get(reverse("teams-list"))
+    assert response.status_code == status.HTTP_200_OK, response
+    assert "ETag" not in response
+
+
+@pytest.mark.django_db(transaction=True)
+def test_delete_versioned_season(
+    api_client: APIClient,
+    season_factory: SeasonFactory,
+    match_factory: MatchFactory,
+    test_user: User,
+) -> None:
+    season = season_factory.create(league__owner=test_user)
+    match = match_factory.create(season=season)
+    response = api_client.delete(reverse("matches-detail", args=[match.pk]))
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response
+    assert SeasonVersion.objects.filter(season=season).exists()
+
+    response = api_client.delete(reverse("seasons-detail", args=[season.pk]))
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response
+    assert not Season.objects.filter(pk=season.pk).exists()
+    assert not SeasonVersion.objects.filter(season_id=season.pk).exists()
@@ -0,0 +1,177 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.conflicts import conflicting_match_ids, find_conflicts
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+from league_planner.tests.factories import MatchFactory, SeasonFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+KICKOFF = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+LATER = datetime(2024, 3, 8, 18, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def season(season_factory: SeasonFactory, test_user: User) -> Season:
+    return season_factory.create(league__owner=test_user)
+
+
+@pytest.fixture()
+def teams(season: Season, team_factory: TeamFactory) -> list[Team]:
+    return [team_factory.create(season=season) for _ in range(4)]
+
+
+def test_find_conflicts(
+    season: Season,
+    teams: list[Team],
+    match_factory: MatchFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    first = match_factory.create(season=season, host=teams[0], visitor=teams[1], address="A", datetime=KICKOFF)
+    second = match_factory.create(season=season, host=teams[2], visitor=teams[0], address="B", datetime=KICKOFF)
+    third = match_factory.create(season=season, host=teams[3], visitor=teams[1], address="A", datetime=KICKOFF)
+    match_factory.create(season=season, host=teams[0], visitor=teams[3], address="A", datetime=LATER)
+    match_factory.create(season=season, host=teams[1], visitor=teams[2], address=None, datetime=LATER)
+
+    with django_assert_num_queries(1):
+        conflicts = find_conflicts([season.id])
+    assert conflicts == [
+        {
+            "type": "team",
+            "season_id": season.id,
+            "team": teams[0].id,
+            "address": None,
+            "datetime": KICKOFF,
+            "matches": [first.id, second.id],
+        },
+        {
+            "type": "team",
+            "season_id": season.id,
+            "team": teams[1].id,
+            "address": None,
+            "datetime": KICKOFF,
+            "matches": [first.id, third.id],
+        },
+        {
+            "type": "venue",
+            "season_id": season.id,
+            "team": None,
+            "address": "A",
+            "datetime": KICKOFF,
+            "matches": [first.id, third.id],
+        },
+    ]
+    assert find_conflicts([]) == []
+
+
+def test_season_conflicts(
+    api_client: APIClient,
+    season: Season,
+    teams: list[Team],
+    match_factory: MatchFactory,
+) -> None:
+    url = reverse("seasons-conflicts", args=[season.pk])
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["count"] == 0
+
+    match_factory.create(season=season, host=teams[0], visitor=teams[1], address="A", datetime=KICKOFF)
+    response = api_client.post(
+        reverse("matches-list"),
+        data={"season": season.pk, "host": teams[2].pk, "visitor": teams[1].pk, "datetime": "2024-03-01 18:00:00"},
+        format="json",
+    )
+    assert response.status_code == status.HTTP_201_CREATED, response
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["count"] == 1
+    conflict = response.data["results"][0]
+    assert conflict["type"] == "team"
+    assert conflict["season"] == season.pk
+    assert conflict["team"] == teams[1].pk
+    assert conflict["datetime"] == "2024-03-01 18:00:00"
+    assert response.get("ETag")
+    assert api_client.get("/seasons/abc/conflicts/").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_league_conflicts(
+    api_client: APIClient,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+    season: Season,
+    teams: list[Team],
+) -> None:
+    other_season = season_factory.create(league=season.league)
+    other_teams = [team_factory.create(season=other_season) for _ in range(2)]
+    first = match_factory.create(season=season, host=teams[0], visitor=teams[1], address="A", datetime=KICKOFF)
+    second = match_factory.create(
+        season=other_season,
+        host=other_teams[0],
+        visitor=other_teams[1],
+        address="A",
+        datetime=KICKOFF,
+    )
+    match_factory.create(season=season_factory.create(), address="A", datetime=KICKOFF)
+
+    response = api_client.get(reverse("seasons-conflicts", args=[season.pk]))
+    assert response.data["count"] == 0
+    response = api_client.get(reverse("leagues-conflicts", args=[season.league_id]))
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["count"] == 1
+    assert response.data["results"][0]["type"] == "venue"
+    assert response.data["results"][0]["matches"] == [first.id, second.id]
+
+
+def test_reject_conflicts(
+    api_client: APIClient,
+    season: Season,
+    teams: list[Team],
+    match_factory: MatchFactory,
+) -> None:
+    existing = match_factory.create(season=season, host=teams[0], visitor=teams[1], address="A", datetime=KICKOFF)
+    url = f"{reverse('matches-list')}?reject_conflicts=true"
+    data = {"season": season.pk, "host": teams[2].pk, "visitor": teams[3].pk, "datetime": "2024-03-01 18:00:00"}
+
+    response = api_client.post(url, data={**data, "address": "A"}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+    assert str(existing.id) in response.data["datetime"][0]
+    response = api_client.post(url, data={**data, "visitor": teams[1].pk, "address": "B"}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+    response = api_client.post(url, data={**data, "address": "B"}, format="json")
+    assert response.status_code == status.HTTP_201_CREATED, response
+    created_id = response.data["id"]
+
+    detail_url = f"{reverse('matches-detail', args=[existing.pk])}?reject_conflicts=1"
+    response = api_client.patch(detail_url, data={"host_score": 1}, format="json")
+    assert response.status_code == status.HTTP_200_OK, response
+    response = api_client.patch(detail_url, data={"address": "B"}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+    response = api_client.patch(
+        reverse("matches-detail", args=[existing.pk]),
+        data={"address": "B"},
+        format="json",
+    )
+    assert response.status_code == status.HTTP_200_OK, response
+    assert find_conflicts([season.id])[0]["matches"] == [existing.id, created_id]
+
+
+def test_conflicting_match_ids(
+    season: Season,
+    teams: list[Team],
+    match_factory: MatchFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    existing = match_factory.create(season=season, host=teams[0], visitor=teams[1], address="A", datetime=KICKOFF)
+    match = match_factory.build(season=season, host=teams[1], visitor=teams[2], address="C", datetime=KICKOFF)
+    with django_assert_num_queries(1):
+        assert conflicting_match_ids(match) == [existing.id]
+    match.datetime = None
+    assert conflicting_match_ids(match) == []
@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.tests.factories import MatchFactory, SeasonFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture()
+def exported_season(
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+    test_user: User,
+) -> Season:
+    season = season_factory.create(league__owner=test_user)
+    host = team_factory.create(season=season, name="Górnik; Zabrze")
+    visitor = team_factory.create(season=season, name="Ruch")
+    match_factory.create(
+        season=season,
+        host=host,
+        visitor=visitor,
+        host_score=2,
+        visitor_score=1,
+        address="Roosevelta 81, Zabrze",
+        datetime=datetime(2024, 3, 1, 18, tzinfo=timezone.utc),
+    )
+    Match.objects.create(
+        season=season,
+        host=visitor,
+        visitor=host,
+        datetime=datetime(2024, 3, 8, 18, tzinfo=timezone.utc),
+    )
+    Match.objects.create(season=season, host=host, visitor=None)
+    return season
+
+
+def export(api_client: APIClient, season: Season, export_format: str, **headers: str) -> tuple[str, str]:
+    response = api_client.get(reverse("seasons-export", args=[season.pk, export_format]), **headers)
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.streaming
+    return response["Content-Type"], b"".join(response.streaming_content).decode()
+
+
+def test_export_csv(
+    api_client: APIClient,
+    exported_season: Season,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    with django_assert_num_queries(3):
+        content_type, content = export(api_client, exported_season, "csv")
+    assert content_type == "text/csv; charset=utf-8"
+    rows = list(csv.DictReader(io.StringIO(content)))
+    assert len(rows) == 3
+    assert rows[0]["host"] == "Górnik; Zabrze"
+    assert rows[0]["datetime"] == "2024-03-01 18:00:00"
+    assert rows[0]["address"] == "Roosevelta 81, Zabrze"
+    assert rows[2]["visitor"] == ""
+
+
+def test_export_ndjson(api_client: APIClient, exported_season: Season) -> None:
+    content_type, content = export(api_client, exported_season, "ndjson")
+    assert content_type == "application/x-ndjson; charset=utf-8"
+    rows = [json.loads(line) for line in content.splitlines()]
+    assert [row["host_score"] for row in rows] == [2, None, None]
+    assert rows[1]["visitor"] == "Górnik; Zabrze"
+    assert rows[2]["datetime"] is None
+
+
+def test_export_ics(api_client: APIClient, exported_season: Season) -> None:
+    content_type, content = export(api_client, exported_season, "ics", HTTP_ACCEPT="text/calendar")
+    assert content_type == "text/calendar; charset=utf-8"
+    lines = content.split("\r\n")
+    assert lines[0] == "BEGIN:VCALENDAR"
+    assert lines[-2:] == ["END:VCALENDAR", ""]
+    assert content.count("BEGIN:VEVENT") == 2
+    assert "DTSTART:20240301T180000Z" in lines
+    assert "SUMMARY:Górnik\\; Zabrze 2:1 Ruch" in lines
+    assert "LOCATION:Roosevelta 81\\, Zabrze" in lines
+    assert "SUMMARY:Ruch vs Górnik\\; Zabrze" in lines
+    assert all(len(line.encode()) <= 75 for line in lines)
+
+
+def test_export_ics_folds_long_lines(api_client: APIClient, exported_season: Season) -> None:
+    Match.objects.filter(season=exported_season).update(address="Stadion Śląski, Chorzów " * 3)
+    _, content = export(api_client, exported_season, "ics")
+    lines = content.split("\r\n")
+    assert all(len(line.encode()) <= 75 for line in lines)
+    location = next(index for index, line in enumerate(lines) if line.startswith("LOCATION:"))
+    assert lines[location + 1].startswith(" ")
+
+
+def test_export_unknown(api_client: APIClient, exported_season: Season) -> None:
+    response = api_client.get(f"/seasons/{exported_season.pk}/export/xml/")
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response
@@ -0,0 +1,145 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+from league_planner.rendering import FastJSONRenderer
+from league_planner.tests.factories import SeasonFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture()
+def season(season_factory: SeasonFactory, team_factory: TeamFactory, test_user: User) -> Season:
+    season = season_factory.create(
+        league__owner=test_user,
+        league__name='Ekstraklasa\u2028\u2029 "2024"',
+        name="Wiosna 😀",
+        start_date=date(2024, 3, 1),
+    )
+    season_factory.create(league=season.league, name="Jesień\\\t")
+    teams = [team_factory.create(season=season, name=f"Górnik {number}", number=number % 3) for number in range(5)]
+    teams.append(team_factory.create(season=season, name="Ruch", number=None))
+    for number, host in enumerate(teams):
+        Match.objects.create(
+            season=season,
+            host=host,
+            visitor=teams[number - 1] if number else None,
+            host_score=number if number % 2 else None,
+            address=f"Stadion {number}",
+            datetime=datetime(2024, 3, number % 3 + 1, 18, 30, tzinfo=timezone.utc) if number < 4 else None,
+        )
+    return season
+
+
+def responses(api_client: APIClient, settings: SettingsWrapper, url: str, **params: object) -> tuple[bytes, bytes]:
+    contents = []
+    for fast in (False, True):
+        settings.FAST_READ_RENDERING = fast
+        response = api_client.get(url, data=params)
+        assert response.status_code == status.HTTP_200_OK, response
+        assert isinstance(response.accepted_renderer, FastJSONRenderer) is fast
+        contents.append(response.content)
+    return contents[0], contents[1]
+
+
+@pytest.mark.parametrize(
+    ("url_name", "params"),
+    [
+        ("leagues-list", {}),
+        ("leagues-list", {"search": "ekstra"}),
+        ("seasons-list", {}),
+        ("seasons-list", {"page_size": 1, "page": 2}),
+        ("teams-list", {}),
+        ("teams-list", {"search": "gorn", "page_size": 2}),
+        ("teams-list", {"cursor": "", "page_size": 2}),
+        ("matches-list", {}),
+        ("matches-list", {"cursor": "", "page_size": 4}),
+        ("matches-list", {"played": False}),
+    ],
+)
+def test_fast_list_matches_serializers(
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    season: Season,
+    url_name: str,
+    params: dict,
+) -> None:
+    default, fast = responses(api_client, settings, reverse(url_name), **params)
+    assert fast == default
+    assert b"count" in fast or b"next" in fast
+
+
+def test_fast_list_follows_cursor(api_client: APIClient, settings: SettingsWrapper, season: Season) -> None:
+    settings.FAST_READ_RENDERING = True
+    url = reverse("matches-list")
+    response = api_client.get(url, data={"cursor": "", "page_size": 4})
+    next_url = response.json()["next"]
+    default, fast = responses(api_client, settings, next_url)
+    assert fast == default
+    assert len(response.json()["results"]) == 4
+    assert [row["datetime"] for row in response.json()["results"]][:2] == ["2024-03-01 18:30:00"] * 2
+
+
+@pytest.mark.parametrize("url_name", ["leagues-detail", "seasons-detail", "teams-detail", "matches-detail"])
+def test_fast_retrieve_matches_serializers(
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    season: Season,
+    url_name: str,
+) -> None:
+    instances = {
+        "leagues-detail": season.league,
+        "seasons-detail": season,
+        "teams-detail": Team.objects.filter(season=season).first(),
+        "matches-detail": Match.objects.get(season=season, visitor=None),
+    }
+    default, fast = responses(api_client, settings, reverse(url_name, args=[instances[url_name].pk]))
+    assert fast == default
+
+
+@pytest.mark.parametrize("url_name", ["leagues-detail", "seasons-detail", "teams-detail", "matches-detail"])
+def test_fast_retrieve_missing(api_client: APIClient, settings: SettingsWrapper, url_name: str) -> None:
+    settings.FAST_READ_RENDERING = True
+    response = api_client.get(reverse(url_name, args=[0]))
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response
+
+
+@pytest.mark.parametrize(("url_name", "budget"), [("teams-list", 3), ("matches-list", 3), ("matches-detail", 2)])
+def test_fast_read_query_budget(
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    season: Season,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    url_name: str,
+    budget: int,
+) -> None:
+    settings.FAST_READ_RENDERING = True
+    args = [Match.objects.filter(season=season).first().pk] if url_name.endswith("detail") else []
+    url = reverse(url_name, args=args)
+    with django_assert_num_queries(budget):
+        response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK, response
+
+
+def test_fast_read_keeps_indent(api_client: APIClient, settings: SettingsWrapper, season: Season) -> None:
+    settings.FAST_READ_RENDERING = True
+    response = api_client.get(reverse("matches-list"), HTTP_ACCEPT="application/json; indent=2")
+    assert isinstance(response.accepted_renderer, FastJSONRenderer)
+    assert response.content.startswith(b'{\n  "count": 6')
+
+
+def test_benchmark_reads_command(capsys: pytest.CaptureFixture) -> None:
+    call_command("benchmark_reads", rows=3, requests=2)
+    output = capsys.readouterr().out
+    assert "matches-list" in output
+    assert "x\n" in output
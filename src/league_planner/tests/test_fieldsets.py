@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.tests.factories import SeasonFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+KICKOFF = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def season(season_factory: SeasonFactory, team_factory: TeamFactory, test_user: User) -> Season:
+    season = season_factory.create(league__owner=test_user)
+    teams = [team_factory.create(season=season, number=number) for number in range(4)]
+    for number, host in enumerate(teams):
+        Match.objects.create(
+            season=season,
+            host=host,
+            visitor=teams[number - 1],
+            host_score=number,
+            visitor_score=1,
+            datetime=KICKOFF + timedelta(days=number),
+        )
+    return season
+
+
+def get(api_client: APIClient, url: str, **params: object) -> tuple[dict, list[str]]:
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url, data=params)
+    assert response.status_code == status.HTTP_200_OK, response
+    return response.json(), [query["sql"] for query in queries]
+
+
+def test_fields_select_columns_without_joins(api_client: APIClient, season: Season) -> None:
+    data, queries = get(api_client, reverse("matches-list"), fields="id,host_score,visitor_score")
+    assert data["count"] == 4
+    assert [list(row) for row in data["results"]] == [["id", "host_score", "visitor_score"]] * 4
+    assert "JOIN" not in queries[-1]
+    assert '"league_planner_match"."address"' not in queries[-1]
+
+
+def test_expand_embeds_only_requested_relations(api_client: APIClient, season: Season) -> None:
+    data, queries = get(api_client, reverse("matches-list"), expand="host")
+    row = data["results"][0]
+    assert list(row) == ["id", "season", "host", "host_score", "visitor", "visitor_score", "address", "datetime"]
+    assert row["season"] == season.pk
+    assert isinstance(row["visitor"], int)
+    assert row["host"]["season"] == season.pk
+    assert queries[-1].count("JOIN") == 1
+
+    data, _ = get(api_client, reverse("matches-list"), fields="id", expand="season")
+    assert data["results"][0] == {"id": data["results"][0]["id"], "season": data["results"][0]["season"]}
+    assert data["results"][0]["season"]["name"] == season.name
+
+
+def test_default_output_is_unchanged(api_client: APIClient, season: Season) -> None:
+    default, _ = get(api_client, reverse("matches-list"))
+    expanded, _ = get(api_client, reverse("matches-list"), expand="season,host,visitor")
+    assert expanded == default
+    flat, _ = get(api_client, reverse("matches-list"), expand="")
+    assert flat["results"][0]["season"] == season.pk
+
+
+@pytest.mark.parametrize(
+    ("url_name", "params", "keys"),
+    [
+        ("teams-list", {"fields": "id,name"}, ["id", "name"]),
+        ("teams-list", {"expand": "season"}, ["id", "season", "name", "city", "number"]),
+        ("seasons-list", {"fields": "id,league", "expand": "league"}, ["id", "league"]),
+        ("leagues-list", {"fields": "owner_login"}, ["owner_login"]),
+    ],
+)
+def test_fieldsets_across_viewsets(
+    api_client: APIClient,
+    season: Season,
+    url_name: str,
+    params: dict,
+    keys: list[str],
+) -> None:
+    data, _ = get(api_client, reverse(url_name), **params)
+    assert list(data["results"][0]) == keys
+    if "expand" in params:
+        assert isinstance(data["results"][0][params["expand"]], dict)
+
+
+def test_fieldset_on_retrieve(api_client: APIClient, season: Season) -> None:
+    match = Match.objects.filter(season=season).first()
+    data, queries = get(api_client, reverse("matches-detail", args=[match.pk]), fields="id,host_score")
+    assert data == {"id": match.pk, "host_score": match.host_score}
+    assert "JOIN" not in queries[-1]
+
+
+def test_fieldset_with_cursor(api_client: APIClient, season: Season) -> None:
+    data, _ = get(api_client, reverse("matches-list"), fields="id", cursor="", page_size=2)
+    next_page, _ = get(api_client, data["next"])
+    ids = list(Match.objects.filter(season=season).order_by("datetime").values_list("id", flat=True))
+    assert [row["id"] for row in data["results"] + next_page["results"]] == ids
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"fields": "id,secret"}, {"expand": "owner"}, {"expand": "season,league"}, {"expand": "address"}],
+)
+def test_fieldset_validation(api_client: APIClient, params: dict) -> None:
+    response = api_client.get(reverse("matches-list"), data=params)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+
+
+@pytest.mark.parametrize(
+    ("url_name", "params"),
+    [
+        ("matches-list", {"fields": "id,host_score,visitor_score"}),
+        ("matches-list", {"expand": "visitor", "cursor": ""}),
+        ("teams-list", {"fields": "name,season", "expand": "season"}),
+        ("seasons-list", {"expand": "league"}),
+        ("leagues-list", {"fields": "id,owner_login"}),
+    ],
+)
+def test_fast_read_fieldsets(
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    season: Season,
+    url_name: str,
+    params: dict,
+) -> None:
+    contents = []
+    for fast in (False, True):
+        settings.FAST_READ_RENDERING = fast
+        response = api_client.get(reverse(url_name), data=params)
+        assert response.status_code == status.HTTP_200_OK, response
+        contents.append(response.content)
+    assert contents[0] == contents[1]
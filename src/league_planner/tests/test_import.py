@@ -0,0 +1,139 @@
+import json
+from pathlib import Path
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command, CommandError
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.importing import SeasonImporter
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.standing import Standing
+from league_planner.models.team import Team
+from league_planner.tests.factories import SeasonFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+TEAMS_CSV = b"""\xef\xbb\xbfname,city,number
+Lions,Bytom,1
+Tigers,,2
+Lions,Gliwice,3
+Bears,Zabrze,abc
+Wolves,Katowice,
+"""
+
+
+@pytest.fixture()
+def season(season_factory: SeasonFactory, test_user: User) -> Season:
+    return season_factory.create(league__owner=test_user)
+
+
+def matches_ndjson(*rows: object) -> bytes:
+    return b"\n".join(json.dumps(row).encode() if not isinstance(row, bytes) else row for row in rows)
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_import_teams(season: Season, team_factory: TeamFactory, use_copy: bool) -> None:
+    team_factory.create(name="Wolves")
+    report = SeasonImporter(season, "teams", chunk_size=2, use_copy=use_copy).run(
+        TEAMS_CSV.splitlines(keepends=True),
+        "csv",
+    )
+    assert report.processed == 5
+    assert report.created == 2
+    rejected = {row["row"]: set(row["errors"]) for row in report.rejected}
+    assert rejected == {3: {"name"}, 4: {"number"}, 5: {"name"}}
+    teams = {team.name: (team.city, team.number) for team in Team.objects.filter(season=season)}
+    assert teams == {"Lions": ("Bytom", 1), "Tigers": ("Not Set", 2)}
+    assert Standing.objects.filter(season=season).count() == 2
+
+
+@pytest.mark.parametrize("use_copy", [True, False])
+def test_import_matches(season: Season, team_factory: TeamFactory, use_copy: bool) -> None:
+    host = team_factory.create(season=season, name="Lions")
+    visitor = team_factory.create(season=season, name="Tigers")
+    team_factory.create(name="Elsewhere")
+    lines = matches_ndjson(
+        {"host": "Lions", "visitor": "Tigers", "host_score": 2, "visitor_score": 1, "datetime": "2024-03-01 18:00"},
+        {"host": "Tigers", "visitor": "Lions", "address": "Stadium", "host_score": None},
+        b"",
+        {"host": "Lions", "visitor": "Elsewhere"},
+        b"{broken",
+        [1, 2],
+        {"host": "Lions", "visitor": "Tigers", "host_score": "x"},
+    ).splitlines(keepends=True)
+    report = SeasonImporter(season, "matches", use_copy=use_copy).run(lines, "ndjson")
+    assert report.processed == 6
+    assert report.created == 2
+    assert [rejected["row"] for rejected in report.rejected] == [3, 4, 5, 6]
+    assert set(report.rejected[0]["errors"]) == {"visitor"}
+    assert report.rejected[1]["errors"] == {"non_field_errors": ["Invalid JSON."]}
+    matches = list(Match.objects.filter(season=season).order_by("id"))
+    assert [(match.host_id, match.visitor_id, match.host_score, match.address) for match in matches] == [
+        (host.id, visitor.id, 2, None),
+        (visitor.id, host.id, None, "Stadium"),
+    ]
+    assert matches[0].datetime.isoformat() == "2024-03-01T18:00:00+00:00"
+    assert Standing.objects.get(team=host).points == 3
+
+
+def test_import_endpoint(api_client: APIClient, season: Season) -> None:
+    url = reverse("seasons-import", args=[season.pk])
+    response = api_client.post(
+        url,
+        data={"kind": "teams", "file": SimpleUploadedFile("teams.csv", TEAMS_CSV)},
+        format="multipart",
+    )
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["created"] == 3
+    assert response.data["rejected_count"] == 2
+    assert response.data["rows_per_second"] > 0
+
+    response = api_client.post(
+        url,
+        data={
+            "kind": "matches",
+            "file_format": "ndjson",
+            "file": SimpleUploadedFile("matches.txt", matches_ndjson({"host": "Lions", "visitor": "Tigers"})),
+        },
+        format="multipart",
+    )
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["created"] == 1
+    assert Match.objects.filter(season=season).count() == 1
+
+    response = api_client.post(
+        url,
+        data={"kind": "matches", "file": SimpleUploadedFile("matches.txt", b"")},
+        format="multipart",
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+
+
+def test_import_endpoint_user_is_not_owner(api_client: APIClient, season_factory: SeasonFactory) -> None:
+    season = season_factory.create()
+    response = api_client.post(
+        reverse("seasons-import", args=[season.pk]),
+        data={"kind": "teams", "file": SimpleUploadedFile("teams.csv", TEAMS_CSV)},
+        format="multipart",
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN, response
+    assert not Team.objects.filter(season=season).exists()
+
+
+def test_import_command(season: Season, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    path = tmp_path / "teams.csv"
+    path.write_bytes(TEAMS_CSV)
+    call_command("import_season", str(path), season=season.pk, kind="teams", no_copy=True)
+    output = capsys.readouterr()
+    assert "Imported 3 of 5 teams (2 rejected)" in output.out
+    assert "row 4:" in output.err
+
+    with pytest.raises(CommandError):
+        call_command("import_season", str(path), season=0, kind="teams")
+    with pytest.raises(CommandError):
+        call_command("import_season", str(tmp_path / "teams.txt"), season=season.pk, kind="teams")
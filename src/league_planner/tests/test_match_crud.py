@@ -4,6 +4,7 @@ import pytest
 from django.contrib.auth.models import User
 from django.forms import model_to_dict
 from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -175,3 +176,70 @@ def test_match_create_user_is_not_league_owner(
     url = reverse("teams-list")
     response = api_client.post(url, data=create_match_data)
     assert response.status_code == status.HTTP_403_FORBIDDEN, response
+
+
+def test_bulk_results(
+    api_client: APIClient,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+    test_user: User,
+    django_assert_max_num_queries: DjangoAssertNumQueries,
+) -> None:
+    season = season_factory.create(league__owner=test_user)
+    host = team_factory.create(season=season)
+    visitor = team_factory.create(season=season)
+    kickoff = datetime(2024, 1, 1, 18)
+    first, second, third = (
+        match_factory.create(season=season, host=host, visitor=visitor, datetime=kickoff + timedelta(days=day))
+        for day in range(3)
+    )
+    foreign = match_factory.create()
+    etag = api_client.get(reverse("seasons-scoreboard", args=[season.pk]))["ETag"]
+    data = {
+        "results": [
+            {"id": first.pk, "host_score": 0, "visitor_score": 3},
+            {"id": second.pk, "host_score": None, "visitor_score": None},
+            {"id": third.pk, "host_score": 20, "visitor_score": 10},
+            {"id": first.pk, "host_score": 1, "visitor_score": 1},
+            {"id": foreign.pk, "host_score": 1, "visitor_score": 1},
+            {"id": 0, "host_score": 1, "visitor_score": 1},
+            {"id": third.pk, "host_score": "abc"},
+        ],
+    }
+    with django_assert_max_num_queries(14) as captured:
+        response = api_client.post(reverse("matches-bulk_results"), data=data, format="json")
+    assert response.status_code == status.HTTP_200_OK, response
+    locks = [query["sql"] for query in captured.captured_queries if "FOR UPDATE" in query["sql"]]
+    assert len(locks) == 1
+    assert locks[0].endswith('ORDER BY "league_planner_match"."id" ASC FOR UPDATE OF "league_planner_match"')
+    assert [item["status"] for item in response.data["results"]] == [
+        "updated",
+        "updated",
+        "unchanged",
+        "duplicate",
+        "forbidden",
+        "not_found",
+        "invalid",
+    ]
+    assert response.data["updated"] == 2
+    assert response.data["failed"] == 4
+    assert set(response.data["results"][-1]["errors"]) == {"host_score", "visitor_score"}
+
+    first.refresh_from_db()
+    second.refresh_from_db()
+    foreign.refresh_from_db()
+    assert (first.host_score, first.visitor_score) == (0, 3)
+    assert (second.host_score, second.visitor_score) == (None, None)
+    assert (foreign.host_score, foreign.visitor_score) == (20, 10)
+
+    response = api_client.get(reverse("seasons-scoreboard", args=[season.pk]), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK, response
+    scores = {team["id"]: (team["score"], team["wins"], team["losses"]) for team in response.data["results"]}
+    assert scores == {host.pk: (3, 1, 1), visitor.pk: (3, 1, 1)}
+
+
+def test_bulk_results_validation(api_client: APIClient) -> None:
+    url = reverse("matches-bulk_results")
+    assert api_client.post(url, data={"results": []}, format="json").status_code == status.HTTP_400_BAD_REQUEST
+    assert api_client.post(url, data={"results": [1]}, format="json").status_code == status.HTTP_400_BAD_REQUEST
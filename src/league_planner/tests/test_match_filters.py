@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.filters import MatchFilter
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+from league_planner.tests.factories import SeasonFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+KICKOFF = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def season(season_factory: SeasonFactory, test_user: User) -> Season:
+    return season_factory.create(league__owner=test_user)
+
+
+@pytest.fixture()
+def teams(season: Season, team_factory: TeamFactory) -> list[Team]:
+    return [team_factory.create(season=season) for _ in range(3)]
+
+
+@pytest.fixture()
+def matches(season: Season, teams: list[Team]) -> list[Match]:
+    first, second, third = teams
+    return [
+        Match.objects.create(
+            season=season,
+            host=first,
+            visitor=second,
+            datetime=KICKOFF,
+            host_score=1,
+            visitor_score=0,
+        ),
+        Match.objects.create(season=season, host=second, visitor=third, datetime=KICKOFF + timedelta(days=3)),
+        Match.objects.create(season=season, host=third, visitor=first, datetime=KICKOFF + timedelta(days=8)),
+        Match.objects.create(season=season, host=first, visitor=third, address="Stadium", host_score=2),
+    ]
+
+
+def filtered(api_client: APIClient, **params: object) -> list[int]:
+    response = api_client.get(reverse("matches-list"), data={"page_size": 100, **params})
+    assert response.status_code == status.HTTP_200_OK, response
+    return [row["id"] for row in response.data["results"]]
+
+
+def test_filter_matches(api_client: APIClient, season: Season, teams: list[Team], matches: list[Match]) -> None:
+    first, second, third = teams
+    ids = [match.id for match in matches]
+    assert filtered(api_client, team=first.id) == [ids[0], ids[2], ids[3]]
+    assert filtered(api_client, host=first.id, season=season.id) == [ids[0], ids[3]]
+    assert filtered(api_client, visitor=third.id) == [ids[1], ids[3]]
+    assert filtered(api_client, played=True) == [ids[0]]
+    assert filtered(api_client, played=False) == ids[1:]
+    assert filtered(api_client, address="Stadium") == [ids[3]]
+    week = {"datetime_after": "2024-03-02T00:00:00Z", "datetime_before": "2024-03-08T00:00:00Z"}
+    assert filtered(api_client, **week) == [ids[1]]
+    assert filtered(api_client, team=second.id, played=False, datetime_after="2024-03-02T00:00:00Z") == [ids[1]]
+
+
+def test_filter_matches_validation(api_client: APIClient) -> None:
+    response = api_client.get(reverse("matches-list"), data={"datetime_after": "never"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+
+
+@pytest.mark.parametrize(
+    ("params", "condition"),
+    [
+        (
+            {"datetime_after": "2024-03-02T00:00:00Z", "datetime_before": "2024-03-08T00:00:00Z"},
+            "Index Cond: ((datetime >= ",
+        ),
+        ({"team": "host"}, "Index Cond: (host_id = "),
+        ({"team": "host"}, "Index Cond: (visitor_id = "),
+        ({"played": False}, "match_unplayed_datetime_idx"),
+        ({"address": "Stadium"}, "Index Cond: ((address)::text = "),
+        ({"season": "season"}, "Index Cond: (season_id = "),
+    ],
+)
+def test_filters_are_index_backed(
+    matches: list[Match],
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    params: dict,
+    condition: str,
+) -> None:
+    other_season = season_factory.create()
+    other_teams = [team_factory.create(season=other_season) for _ in range(50)]
+    Match.objects.bulk_create(
+        Match(
+            season=other_season,
+            host=other_teams[number % 50],
+            visitor=other_teams[(number + 1) % 50],
+            host_score=1,
+            visitor_score=1,
+            address=f"Hall {number}",
+            datetime=KICKOFF - timedelta(days=number + 1),
+        )
+        for number in range(500)
+    )
+    ids = {"host": matches[0].host_id, "season": str(matches[0].season_id)}
+    params = {name: ids.get(value, value) if isinstance(value, str) else value for name, value in params.items()}
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE league_planner_match")
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    plan = MatchFilter(params, queryset=Match.objects.all()).qs.explain()
+    assert "Seq Scan" not in plan, plan
+    assert condition in plan, plan
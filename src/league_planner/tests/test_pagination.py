@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+from league_planner.tests.factories import SeasonFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+KICKOFF = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def season(season_factory: SeasonFactory, team_factory: TeamFactory, test_user: User) -> Season:
+    season = season_factory.create(league__owner=test_user)
+    host = team_factory.create(season=season, number=1)
+    visitor = team_factory.create(season=season, number=None)
+    for day in (3, 1, 1, 2, None, 1, None, 4):
+        Match.objects.create(
+            season=season,
+            host=host,
+            visitor=visitor,
+            datetime=KICKOFF + timedelta(days=day) if day is not None else None,
+        )
+    return season
+
+
+def expected_matches(season: Season) -> list[int]:
+    matches = Match.objects.filter(season=season)
+    dated = matches.filter(datetime__isnull=False).order_by("datetime", "id")
+    return [
+        *dated.values_list("id", flat=True),
+        *matches.filter(datetime=None).order_by("id").values_list("id", flat=True),
+    ]
+
+
+def walk(api_client: APIClient, url: str, data: dict | None = None, link: str = "next") -> list[list[int]]:
+    pages = []
+    response = api_client.get(url, data=data)
+    while True:
+        assert response.status_code == status.HTTP_200_OK, response
+        assert "count" not in response.data
+        pages.append([row["id"] for row in response.data["results"]])
+        if response.data[link] is None:
+            return pages
+        response = api_client.get(response.data[link])
+
+
+def test_keyset_pagination_matches(api_client: APIClient, season: Season) -> None:
+    expected = expected_matches(season)
+    pages = walk(api_client, reverse("matches-list"), {"season": season.pk, "cursor": "", "page_size": 3})
+    assert [len(page) for page in pages] == [3, 3, 2]
+    assert sum(pages, []) == expected
+
+    response = api_client.get(reverse("matches-list"), data={"season": season.pk, "cursor": "", "page_size": 3})
+    last_page = api_client.get(response.data["next"]).data
+    last_page = api_client.get(last_page["next"]).data
+    assert last_page["previous"] is not None
+    backwards = walk(api_client, last_page["previous"], link="previous")
+    assert backwards == [expected[3:6], expected[:3]]
+
+
+def test_keyset_pagination_concurrent_insert(api_client: APIClient, season: Season) -> None:
+    url = reverse("matches-list")
+    response = api_client.get(url, data={"season": season.pk, "cursor": "", "page_size": 4})
+    first_page = [row["id"] for row in response.data["results"]]
+    Match.objects.create(season=season, datetime=KICKOFF)
+    Match.objects.create(season=season, datetime=KICKOFF + timedelta(days=10))
+    rest = sum(walk(api_client, response.data["next"]), [])
+    assert not set(first_page) & set(rest)
+    expected = expected_matches(season)
+    start = expected.index(first_page[-1]) + 1
+    assert rest == expected[start:]
+
+
+def test_keyset_pagination_teams(api_client: APIClient, season: Season, team_factory: TeamFactory) -> None:
+    for number in (5, None, 2, 2):
+        team_factory.create(season=season, number=number)
+    teams = Team.objects.filter(season=season)
+    expected = [
+        *teams.filter(number__isnull=False).order_by("number", "id").values_list("id", flat=True),
+        *teams.filter(number=None).order_by("id").values_list("id", flat=True),
+    ]
+    pages = walk(api_client, reverse("teams-list"), {"season": season.pk, "cursor": "", "page_size": 2})
+    assert sum(pages, []) == expected
+
+
+def test_keyset_pagination_query_count(
+    api_client: APIClient,
+    season: Season,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    url = reverse("matches-list")
+    response = api_client.get(url, data={"season": season.pk, "cursor": "", "page_size": 2})
+    with django_assert_num_queries(2):
+        response = api_client.get(response.data["next"])
+    assert response.status_code == status.HTTP_200_OK, response
+
+
+def test_page_number_pagination_still_supported(api_client: APIClient, season: Season) -> None:
+    response = api_client.get(reverse("matches-list"), data={"season": season.pk, "page": 2, "page_size": 3})
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["count"] == 8
+    assert len(response.data["results"]) == 3
+    assert "page=3" in response.data["next"]
+
+
+@pytest.mark.parametrize("cursor", ["invalid", "WzEsIDJd", "WyJub3QgYSBkYXRlIiwgMSwgZmFsc2Vd"])
+def test_keyset_pagination_invalid_cursor(api_client: APIClient, season: Season, cursor: str) -> None:
+    response = api_client.get(reverse("matches-list"), data={"cursor": cursor})
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response
+
+
+def test_keyset_pagination_rejects_search(api_client: APIClient, season: Season) -> None:
+    url = reverse("teams-list")
+    response = api_client.get(url, data={"search": "team", "cursor": ""})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+    assert "search" in response.data["cursor"][0]
+    response = api_client.get(url, data={"search": "", "cursor": ""})
+    assert response.status_code == status.HTTP_200_OK, response
+    response = api_client.get(url, data={"search": "team", "page": 1})
+    assert response.status_code == status.HTTP_200_OK, response
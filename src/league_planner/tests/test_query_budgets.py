@@ -0,0 +1,251 @@
+from pathlib import Path
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.models.league import League
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.models.team import Team
+from league_planner.ownership import owner_cache_enabled, owner_cache_key
+from league_planner.tests.factories import LeagueFactory, MatchFactory, SeasonFactory, TeamFactory, UserFactory
+
+pytestmark = [pytest.mark.django_db]
+
+LIST_BUDGETS = {
+    "leagues-list": 3,
+    "seasons-list": 3,
+    "teams-list": 3,
+    "matches-list": 3,
+}
+
+
+def populate(
+    rows: int,
+    test_user: User,
+    league_factory: LeagueFactory,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+) -> Season:
+    season = season_factory.create(league__owner=test_user)
+    for number in range(rows):
+        league_factory.create(owner=test_user)
+        season_factory.create(league=season.league)
+        host = team_factory.create(season=season)
+        visitor = team_factory.create(season=season)
+        match_factory.create(season=season, host=host, visitor=visitor, address=f"address {number}")
+    return season
+
+
+@pytest.mark.parametrize("url_name", LIST_BUDGETS)
+@pytest.mark.parametrize("rows", [1, 15])
+def test_list_query_budget(
+    api_client: APIClient,
+    test_user: User,
+    league_factory: LeagueFactory,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    url_name: str,
+    rows: int,
+) -> None:
+    populate(rows, test_user, league_factory, season_factory, team_factory, match_factory)
+    with django_assert_num_queries(LIST_BUDGETS[url_name]):
+        response = api_client.get(reverse(url_name), data={"page_size": 100})
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["count"] >= rows
+
+
+@pytest.mark.parametrize(
+    ("url_name", "budget"),
+    [
+        ("leagues-detail", 2),
+        ("seasons-detail", 2),
+        ("teams-detail", 2),
+        ("matches-detail", 2),
+    ],
+)
+def test_retrieve_query_budget(
+    api_client: APIClient,
+    test_user: User,
+    match_factory: MatchFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    url_name: str,
+    budget: int,
+) -> None:
+    match = match_factory.create(season__league__owner=test_user)
+    instance = {
+        "leagues-detail": match.season.league,
+        "seasons-detail": match.season,
+        "teams-detail": match.host,
+        "matches-detail": match,
+    }[url_name]
+    with django_assert_num_queries(budget):
+        response = api_client.get(reverse(url_name, args=[instance.pk]))
+    assert response.status_code == status.HTTP_200_OK, response
+
+
+@pytest.mark.parametrize(
+    ("url_name", "data", "budget"),
+    [
+        ("leagues-detail", {"name": "renamed"}, 3),
+        ("seasons-detail", {"name": "renamed"}, 5),
+        ("teams-detail", {"city": "Bytom"}, 6),
+        ("matches-detail", {"host_score": 3}, 8),
+    ],
+)
+def test_update_query_budget(
+    api_client: APIClient,
+    test_user: User,
+    match_factory: MatchFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    url_name: str,
+    data: dict,
+    budget: int,
+) -> None:
+    match = match_factory.create(season__league__owner=test_user)
+    match.host.season = match.season
+    match.host.save()
+    instance = {
+        "leagues-detail": match.season.league,
+        "seasons-detail": match.season,
+        "teams-detail": match.host,
+        "matches-detail": match,
+    }[url_name]
+    with django_assert_num_queries(budget):
+        response = api_client.patch(reverse(url_name, args=[instance.pk]), data=data, format="json")
+    assert response.status_code == status.HTTP_200_OK, response
+
+
+@pytest.mark.parametrize("model", [Match, Team, Season])
+def test_owner_resolution(
+    test_user: User,
+    user_factory: UserFactory,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    model: type[Match | Team | Season],
+) -> None:
+    season = season_factory.create(league__owner=test_user)
+    match = match_factory.create(season=season, host=team_factory.create(season=season))
+    other_user = user_factory.create()
+    instance = model.objects.with_owner().get(pk={Match: match, Team: match.host, Season: match.season}[model].pk)
+    with django_assert_num_queries(0):
+        assert instance.is_owner(test_user)
+        assert not instance.is_owner(other_user)
+
+    instance = model.objects.get(pk=instance.pk)
+    with django_assert_num_queries(1):
+        assert instance.is_owner(test_user)
+        assert not instance.is_owner(other_user)
+
+
+def test_league_owner_resolution(
+    test_user: User,
+    league_factory: LeagueFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    league_factory.create(owner=test_user)
+    league = League.objects.get()
+    with django_assert_num_queries(0):
+        assert league.is_owner(test_user)
+        assert not league.is_owner(User())
+
+
+def shared_owner_cache(settings: SettingsWrapper, location: Path) -> None:
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location},
+    }
+    settings.OWNERSHIP_CACHE_TTL = 60
+
+
+def test_owner_cache_requires_shared_backend(settings: SettingsWrapper) -> None:
+    settings.OWNERSHIP_CACHE_TTL = 60
+    assert not owner_cache_enabled()
+
+
+@pytest.mark.parametrize(
+    ("url_name", "budget", "cached_budget"),
+    [
+        ("seasons-list", 4, 2),
+        ("teams-list", 8, 6),
+        ("matches-list", 6, 4),
+    ],
+)
+def test_create_query_budget(
+    api_client: APIClient,
+    test_user: User,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    settings: SettingsWrapper,
+    tmp_path: Path,
+    url_name: str,
+    budget: int,
+    cached_budget: int,
+) -> None:
+    season = season_factory.create(league__owner=test_user)
+    host = team_factory.create(season=season)
+    visitor = team_factory.create(season=season)
+    data = {
+        "seasons-list": {"league": season.league_id, "name": "next"},
+        "teams-list": {"season": season.pk, "name": "new team"},
+        "matches-list": {"season": season.pk, "host": host.pk, "visitor": visitor.pk},
+    }[url_name]
+    with django_assert_num_queries(budget):
+        response = api_client.post(reverse(url_name), data=data, format="json")
+    assert response.status_code == status.HTTP_201_CREATED, response
+
+    shared_owner_cache(settings, tmp_path)
+    for name in ("second", "third"):
+        if "name" in data:
+            data["name"] = name
+        response = api_client.post(reverse(url_name), data=data, format="json")
+        assert response.status_code == status.HTTP_201_CREATED, response
+    if "name" in data:
+        data["name"] = "fourth"
+    with django_assert_num_queries(cached_budget):
+        response = api_client.post(reverse(url_name), data=data, format="json")
+    assert response.status_code == status.HTTP_201_CREATED, response
+
+
+def test_owner_cache_invalidation(
+    api_client: APIClient,
+    test_user: User,
+    user_factory: UserFactory,
+    season_factory: SeasonFactory,
+    settings: SettingsWrapper,
+    tmp_path: Path,
+) -> None:
+    shared_owner_cache(settings, tmp_path)
+    season = season_factory.create(league__owner=test_user)
+    data = {"season": season.pk, "name": "new team"}
+    response = api_client.post(reverse("teams-list"), data=data, format="json")
+    assert response.status_code == status.HTTP_201_CREATED, response
+    assert cache.get(owner_cache_key(Season, season.pk)) == test_user.pk
+
+    league = season.league
+    league.owner = user_factory.create()
+    league.save()
+    assert cache.get(owner_cache_key(Season, season.pk)) is None
+    data["name"] = "another team"
+    response = api_client.post(reverse("teams-list"), data=data, format="json")
+    assert response.status_code == status.HTTP_403_FORBIDDEN, response
+
+    response = api_client.post(reverse("teams-list"), data=data, format="json")
+    assert response.status_code == status.HTTP_403_FORBIDDEN, response
+    assert cache.get(owner_cache_key(Season, season.pk)) == league.owner_id
+
+    season.delete()
+    assert cache.get(owner_cache_key(Season, season.pk)) is None
+    response = api_client.post(reverse("teams-list"), data=data, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
@@ -0,0 +1,245 @@
+from collections import Counter
+from datetime import date, datetime, timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.scheduling.optimizer import optimize, Problem, worker_pool
+from league_planner.scheduling.round_robin import round_robin, rounds_count, spread_dates
+from league_planner.tests.factories import MatchFactory, SeasonFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture()
+def scheduled_season(
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    test_user: User,
+) -> Season:
+    season = season_factory.create(
+        league__owner=test_user,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 6, 30),
+    )
+    for number in range(6):
+        team_factory.create(season=season, number=number)
+    return season
+
+
+@pytest.mark.parametrize("teams_count", [2, 5, 6, 20])
+def test_round_robin(teams_count: int) -> None:
+    rounds = round_robin(list(range(teams_count)), double=True)
+    fixtures = [pairing for pairings in rounds for pairing in pairings]
+    assert len(fixtures) == teams_count * (teams_count - 1)
+    assert len(set(fixtures)) == len(fixtures)
+    for pairings in rounds:
+        teams = [team for pairing in pairings for team in pairing]
+        assert len(teams) == len(set(teams))
+    home_games = Counter(host for host, _ in fixtures)
+    assert set(home_games.values()) == {teams_count - 1}
+
+
+@pytest.mark.parametrize(
+    ("teams_count", "double", "rounds"),
+    [(0, False, 0), (1, True, 0), (5, False, 5), (6, True, 10)],
+)
+def test_rounds_count(teams_count: int, double: bool, rounds: int) -> None:
+    assert rounds_count(teams_count, double) == rounds
+
+
+def test_spread_dates() -> None:
+    assert spread_dates(date(2024, 1, 1), date(2024, 1, 31), 4, 7) == [
+        date(2024, 1, 1),
+        date(2024, 1, 11),
+        date(2024, 1, 21),
+        date(2024, 1, 31),
+    ]
+    assert spread_dates(date(2024, 1, 1), None, 2, 3) == [date(2024, 1, 1), date(2024, 1, 4)]
+
+
+def test_generate_schedule_dry_run(api_client: APIClient, scheduled_season: Season) -> None:
+    url = reverse("seasons-generate_schedule", args=[scheduled_season.pk])
+    response = api_client.post(url, data={"dry_run": True}, format="json")
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["count"] == 15
+    assert response.data["results"][0]["datetime"] == "2024-01-01 18:00:00"
+    assert response.data["results"][-1]["datetime"] == "2024-06-30 18:00:00"
+    assert not Match.objects.filter(season=scheduled_season).exists()
+
+
+def test_generate_schedule(
+    api_client: APIClient,
+    scheduled_season: Season,
+    django_assert_max_num_queries: DjangoAssertNumQueries,
+) -> None:
+    url = reverse("seasons-generate_schedule", args=[scheduled_season.pk])
+    with django_assert_max_num_queries(15):
+        response = api_client.post(url, data={"double": True, "kickoff": "20:30"}, format="json")
+    assert response.status_code == status.HTTP_201_CREATED, response
+    assert response.data["count"] == 30
+    matches = Match.objects.filter(season=scheduled_season)
+    assert matches.count() == 30
+    assert {match.datetime.strftime("%H:%M") for match in matches} == {"20:30"}
+    assert all(result["id"] is not None for result in response.data["results"])
+
+    response = api_client.post(url, data={}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+    response = api_client.post(url, data={"replace": True}, format="json")
+    assert response.status_code == status.HTTP_201_CREATED, response
+    assert Match.objects.filter(season=scheduled_season).count() == 15
+
+
+def test_generate_schedule_validation(
+    api_client: APIClient,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+    test_user: User,
+) -> None:
+    season = season_factory.create(league__owner=test_user)
+    url = reverse("seasons-generate_schedule", args=[season.pk])
+    response = api_client.post(url, data={"dry_run": True}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+    season.start_date = date(2024, 1, 1)
+    season.end_date = date(2023, 1, 1)
+    season.save()
+    response = api_client.post(url, data={"dry_run": True}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+    season.end_date = None
+    season.save()
+    team_factory.create(season=season)
+    response = api_client.post(url, data={"dry_run": True}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+
+
+@pytest.mark.parametrize(
+    ("url_name", "double"),
+    [("seasons-generate_schedule", False), ("seasons-optimize_schedule", True)],
+)
+def test_generate_schedule_short_season(
+    api_client: APIClient,
+    scheduled_season: Season,
+    url_name: str,
+    double: bool,
+) -> None:
+    url = reverse(url_name, args=[scheduled_season.pk])
+    scheduled_season.end_date = scheduled_season.start_date + timedelta(days=8 if double else 3)
+    scheduled_season.save()
+    response = api_client.post(url, data={"double": double, "dry_run": True}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+    assert "needs" in str(response.data["non_field_errors"][0])
+
+    scheduled_season.end_date += timedelta(days=1)
+    scheduled_season.save()
+    response = api_client.post(url, data={"double": double, "dry_run": True, "budget": 0.1}, format="json")
+    assert response.status_code == status.HTTP_200_OK, response
+    days = {row["datetime"][:10] for row in response.data["results"]}
+    assert len(days) == (10 if double else 5)
+
+
+def test_generate_schedule_user_is_not_owner(api_client: APIClient, season_factory: SeasonFactory) -> None:
+    season = season_factory.create(start_date=date(2024, 1, 1))
+    response = api_client.post(reverse("seasons-generate_schedule", args=[season.pk]), data={}, format="json")
+    assert response.status_code == status.HTTP_403_FORBIDDEN, response
+
+
+@pytest.fixture()
+def optimizer_problem() -> Problem:
+    teams = tuple(range(1, 9))
+    return Problem(
+        teams=teams,
+        slots=tuple(datetime(2024, 1, 1, 18) + timedelta(days=day) for day in range(60)),
+        venues={team: f"venue-{team % 4}" for team in teams},
+        double=True,
+        min_rest_days=2,
+    )
+
+
+def test_optimize(optimizer_problem: Problem) -> None:
+    result = optimize(optimizer_problem, budget=0.5)
+    assert result.restarts == 1
+    assert len(result.fixtures) == 56
+    assert len({(host, visitor) for host, visitor, _ in result.fixtures}) == 56
+    assert result.violations["team_clashes"] == 0
+    assert result.violations["venue_clashes"] == 0
+    assert result.violations["rest_violations"] == 0
+    venue_slots = [(optimizer_problem.venues[host], slot) for host, _, slot in result.fixtures]
+    assert len(set(venue_slots)) == len(venue_slots)
+
+
+def test_optimize_parallel_restarts(optimizer_problem: Problem) -> None:
+    result = optimize(optimizer_problem, budget=0.5, workers=2)
+    assert result.restarts == 2
+    assert len({(host, visitor) for host, visitor, _ in result.fixtures}) == 56
+    pool = worker_pool(2)
+    assert optimize(optimizer_problem, budget=0.1, workers=2).restarts == 2
+    assert worker_pool(2) is pool
+
+
+def test_optimize_without_teams() -> None:
+    result = optimize(Problem(teams=(1,), slots=(datetime(2024, 1, 1),)), budget=0.1)
+    assert result.fixtures == []
+    assert result.score == 0
+
+
+def test_optimize_schedule(
+    api_client: APIClient,
+    scheduled_season: Season,
+    django_assert_max_num_queries: DjangoAssertNumQueries,
+) -> None:
+    team_ids = list(scheduled_season.team_set.values_list("id", flat=True))
+    venues = {str(team_id): "Stadium" for team_id in team_ids[:2]}
+    url = reverse("seasons-optimize_schedule", args=[scheduled_season.pk])
+    data = {"double": True, "budget": 0.2, "venues": venues, "kickoffs": ["20:00", "17:00"]}
+    response = api_client.post(url, data={**data, "dry_run": True}, format="json")
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["count"] == 30
+    assert not Match.objects.filter(season=scheduled_season).exists()
+
+    with django_assert_max_num_queries(16):
+        response = api_client.post(url, data=data, format="json")
+    assert response.status_code == status.HTTP_201_CREATED, response
+    assert response.data["violations"]["team_clashes"] == 0
+    assert response.data["violations"]["venue_clashes"] == 0
+    matches = list(Match.objects.filter(season=scheduled_season))
+    assert len(matches) == 30
+    assert {match.datetime.strftime("%H:%M") for match in matches} <= {"17:00", "20:00"}
+    stadium_matches = [match for match in matches if match.address == "Stadium"]
+    assert {match.host_id for match in stadium_matches} == set(team_ids[:2])
+    assert len({match.datetime for match in stadium_matches}) == len(stadium_matches)
+
+
+def test_optimize_schedule_ignores_requested_workers(
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    scheduled_season: Season,
+) -> None:
+    settings.SCHEDULER_WORKERS = 1
+    url = reverse("seasons-optimize_schedule", args=[scheduled_season.pk])
+    response = api_client.post(url, data={"budget": 0.1, "workers": 16, "dry_run": True}, format="json")
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["restarts"] == 1
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"budget": 1000},
+        {"budget": 5.5},
+        {"venues": {"abc": "Stadium"}},
+        {"venues": {"0": "Stadium"}},
+        {"kickoffs": []},
+    ],
+)
+def test_optimize_schedule_validation(api_client: APIClient, scheduled_season: Season, data: dict) -> None:
+    url = reverse("seasons-optimize_schedule", args=[scheduled_season.pk])
+    response = api_client.post(url, data={**data, "dry_run": True}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
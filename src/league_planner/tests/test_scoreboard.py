@@ -1,11 +1,17 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
+from io import StringIO
 
 import pytest
+from django.core.management import call_command
 from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from .factories import MatchFactory, SeasonFactory, TeamFactory
+from league_planner import scoreboard, standings
+from league_planner.models.season import Season
+
+from .factories import LeagueFactory, MatchFactory, SeasonFactory, TeamFactory
 
 pytestmark = [pytest.mark.django_db]
 
@@ -70,3 +76,139 @@ def test_scoreboard(
     assert teams[0]["score"] == 6
     assert teams[1]["score"] == 1
     assert teams[2]["score"] == 1
+
+
+def test_scoreboard_sql_aggregation(
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+) -> None:
+    season = season_factory.create(points_per_draw=2, points_per_lose=1)
+    team1 = team_factory.create(season=season, number=1)
+    team2 = team_factory.create(season=season, number=2)
+    team3 = team_factory.create(season=season, number=3)
+    team4 = team_factory.create(season=season, number=4)
+    match_factory.create(season=season, host=team1, visitor=team2, host_score=1, visitor_score=0, address="a")
+    match_factory.create(season=season, host=team3, visitor=team4, host_score=5, visitor_score=0, address="b")
+    match_factory.create(season=season, host=team2, visitor=team4, host_score=None, visitor_score=None, address="c")
+    match_factory.create(season=season, host=None, visitor=team2, host_score=2, visitor_score=2, address="d")
+    teams = scoreboard.scoreboard(season)
+    assert [team.id for team in teams] == [team2.pk, team3.pk, team1.pk, team4.pk]
+    assert [team.score for team in teams] == [3, 3, 3, 1]
+    assert [team.goal_difference for team in teams] == [-1, 5, 1, -5]
+    assert teams[0].score_as_visitor == 3
+    assert teams[0].draws == 1
+    assert teams[0].losses == 1
+    assert teams[3].away_losses == 1
+    assert [team.score for team in standings.scoreboard(season)] == [3, 3, 3, 1]
+    assert [team.id for team in standings.scoreboard(season)] == [team.id for team in teams]
+
+
+def test_benchmark_scoreboard_command() -> None:
+    stdout = StringIO()
+    call_command("benchmark_scoreboard", "--teams", "4", "--matches", "20", "--repeat", "1", stdout=stdout)
+    assert "sql aggregation" in stdout.getvalue()
+    assert not Season.objects.exists()
+
+
+@pytest.fixture()
+def season_with_matchdays(
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+) -> tuple[Season, list]:
+    season = season_factory.create()
+    teams = [team_factory.create(season=season, number=number) for number in range(3)]
+    day1 = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+    day2 = day1 + timedelta(days=7)
+    match_factory.create(season=season, host=teams[0], visitor=teams[1], host_score=2, visitor_score=0, datetime=day1)
+    match_factory.create(season=season, host=teams[2], visitor=teams[0], host_score=1, visitor_score=1, datetime=day2)
+    match_factory.create(
+        season=season,
+        host=teams[1],
+        visitor=teams[2],
+        host_score=3,
+        visitor_score=0,
+        datetime=day2 + timedelta(hours=2),
+    )
+    match_factory.create(
+        season=season,
+        host=teams[1],
+        visitor=teams[0],
+        host_score=None,
+        visitor_score=None,
+        datetime=day2 + timedelta(days=7),
+    )
+    return season, teams
+
+
+def test_scoreboard_as_of(api_client: APIClient, season_with_matchdays: tuple[Season, list]) -> None:
+    season, teams = season_with_matchdays
+    url = reverse("seasons-scoreboard", args=[season.pk])
+    response = api_client.get(url, {"as_of": "2024-03-05T00:00:00Z"})
+    assert response.status_code == status.HTTP_200_OK, response
+    assert [team["id"] for team in response.data["results"]] == [teams[0].pk, teams[2].pk, teams[1].pk]
+    assert [team["score"] for team in response.data["results"]] == [3, 0, 0]
+
+    response = api_client.get(url, {"round": 2})
+    assert response.status_code == status.HTTP_200_OK, response
+    assert [team["id"] for team in response.data["results"]] == [teams[0].pk, teams[1].pk, teams[2].pk]
+    assert [team["score"] for team in response.data["results"]] == [4, 3, 1]
+
+    response = api_client.get(url, {"round": 1, "as_of": "2024-03-05T00:00:00Z"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+
+
+def test_standings_progression(api_client: APIClient, season_with_matchdays: tuple[Season, list]) -> None:
+    season, teams = season_with_matchdays
+    response = api_client.get(reverse("seasons-progression", args=[season.pk]))
+    assert response.status_code == status.HTTP_200_OK, response
+    rounds = response.data["results"]
+    assert [matchday["round"] for matchday in rounds] == [1, 2, 3]
+    assert [matchday["date"] for matchday in rounds] == ["2024-03-01", "2024-03-08", "2024-03-15"]
+    first, second, third = (
+        [(standing["id"], standing["position"], standing["score"]) for standing in matchday["standings"]]
+        for matchday in rounds
+    )
+    assert first == [(teams[0].pk, 1, 3), (teams[2].pk, 2, 0), (teams[1].pk, 3, 0)]
+    assert second == [(teams[0].pk, 1, 4), (teams[1].pk, 2, 3), (teams[2].pk, 3, 1)]
+    assert third == second
+
+
+def test_scoreboards_for_many_seasons(
+    api_client: APIClient,
+    league_factory: LeagueFactory,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+    django_assert_max_num_queries: DjangoAssertNumQueries,
+) -> None:
+    league = league_factory.create()
+    season1 = season_factory.create(league=league, start_date=date(2023, 1, 1))
+    season2 = season_factory.create(league=league, start_date=date(2024, 1, 1), points_per_win=2)
+    empty_season = season_factory.create(league=league, start_date=date(2025, 1, 1))
+    for season in (season1, season2):
+        host = team_factory.create(season=season)
+        visitor = team_factory.create(season=season)
+        match_factory.create(season=season, host=host, visitor=visitor, host_score=1, visitor_score=0)
+    url = reverse("seasons-scoreboards")
+    with django_assert_max_num_queries(4):
+        response = api_client.get(url, {"league": league.pk})
+    assert response.status_code == status.HTTP_200_OK, response
+    assert [scoreboard["season"] for scoreboard in response.data["results"]] == [
+        season1.pk,
+        season2.pk,
+        empty_season.pk,
+    ]
+    assert [team["score"] for team in response.data["results"][0]["results"]] == [3, 0]
+    assert [team["score"] for team in response.data["results"][1]["results"]] == [2, 0]
+    assert response.data["results"][2]["results"] == []
+
+    response = api_client.get(url, {"ids": f"{season2.pk},{season2.pk}"})
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.data["count"] == 1
+
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+    response = api_client.get(url, {"ids": ",".join(str(number) for number in range(1, 102))})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response
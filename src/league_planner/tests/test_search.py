@@ -0,0 +1,56 @@
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.filters import LeagueFilter, TeamFilter
+from league_planner.models.league import League
+from league_planner.models.team import Team
+from league_planner.tests.factories import LeagueFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+def search(api_client: APIClient, url_name: str, term: str) -> list[str]:
+    response = api_client.get(reverse(url_name), data={"search": term})
+    assert response.status_code == status.HTTP_200_OK, response
+    return [row["name"] for row in response.data["results"]]
+
+
+def test_search_teams(api_client: APIClient, team_factory: TeamFactory) -> None:
+    for name, city in [
+        ("Szombierki Zabrze", "Zabrze"),
+        ("Górnik Zabrze", "Zabrze"),
+        ("Górnik", "Wałbrzych"),
+        ("Ruch", "Chorzów"),
+        ("Zagłębie", "Sosnowiec"),
+    ]:
+        team_factory.create(name=name, city=city)
+
+    assert search(api_client, "teams-list", "górnik") == ["Górnik", "Górnik Zabrze"]
+    assert search(api_client, "teams-list", "  ZAB ") == ["Górnik Zabrze", "Szombierki Zabrze"]
+    assert search(api_client, "teams-list", "chorz") == ["Ruch"]
+    assert search(api_client, "teams-list", "") == [team.name for team in Team.objects.all()]
+    assert search(api_client, "teams-list", "Legia") == []
+
+
+def test_search_leagues(api_client: APIClient, league_factory: LeagueFactory) -> None:
+    for name in ("Ekstraklasa", "Ekstraliga", "I liga", "Liga okręgowa"):
+        league_factory.create(name=name)
+    assert search(api_client, "leagues-list", "ekstra") == ["Ekstraklasa", "Ekstraliga"]
+    assert search(api_client, "leagues-list", "liga") == ["Liga okręgowa"]
+    assert search(api_client, "leagues-list", "ekstraliga") == ["Ekstraliga"]
+
+
+def test_search_is_index_backed(test_user: User) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    for filterset, index in (
+        (TeamFilter({"search": "gór"}, queryset=Team.objects.all()), "team_name_upper_idx"),
+        (LeagueFilter({"search": "ekstra"}, queryset=League.objects.all()), "league_name_upper_idx"),
+    ):
+        plan = filterset.qs.explain()
+        assert "Seq Scan" not in plan, plan
+        assert index in plan or "_trgm_idx" in plan, plan
@@ -0,0 +1,129 @@
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+from django.contrib.auth.models import User
+from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.models.match import Match
+from league_planner.models.season import Season
+from league_planner.tests.factories import SeasonFactory, TeamFactory
+from league_planner.views.mixins import FieldsetMixin
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture()
+def season(season_factory: SeasonFactory, team_factory: TeamFactory, test_user: User) -> Season:
+    season = season_factory.create(league__owner=test_user)
+    teams = [team_factory.create(season=season, number=number) for number in range(3)]
+    for host in teams:
+        for visitor in teams:
+            if host != visitor:
+                Match.objects.create(season=season, host=host, visitor=visitor)
+    Match.objects.create(season=season, host=teams[0], visitor=None)
+    return season
+
+
+def get(api_client: APIClient, url: str, **params: object) -> dict:
+    response = api_client.get(url, data=params)
+    assert response.status_code == status.HTTP_200_OK, response
+    return response.json()
+
+
+def test_sideload_matches(
+    api_client: APIClient,
+    season: Season,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    default = get(api_client, reverse("matches-list"))
+    with django_assert_num_queries(4):
+        data = get(api_client, reverse("matches-list"), sideload="true")
+    assert list(data) == ["count", "next", "previous", "results", "included"]
+    assert [row["season"] for row in data["results"]] == [season.pk] * 7
+    assert data["results"][-1]["visitor"] is None
+    assert list(data["included"]) == ["seasons", "teams"]
+    assert data["included"]["seasons"] == [default["results"][0]["season"]]
+    teams = {row["host"]["id"]: row["host"] for row in default["results"]}
+    assert data["included"]["teams"] == [teams[team_id] for team_id in sorted(teams)]
+
+
+def test_sideload_selected_by_accept_parameter(api_client: APIClient, season: Season) -> None:
+    flagged = get(api_client, reverse("matches-list"), sideload="true", season=season.pk)
+    assert "included" not in get(api_client, reverse("matches-list"), season=season.pk)
+    response = api_client.get(
+        reverse("matches-list"),
+        data={"season": season.pk},
+        HTTP_ACCEPT="application/json; sideload=true",
+    )
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.json() == flagged
+
+
+@pytest.mark.parametrize(
+    ("params", "included"),
+    [
+        ({"expand": "host"}, {"teams": 3}),
+        ({"expand": "season,visitor", "fields": "id,visitor"}, {"teams": 3}),
+        ({"expand": "season"}, {"seasons": 1}),
+        ({"fields": "id,host_score"}, {}),
+    ],
+)
+def test_sideload_with_fieldsets(api_client: APIClient, season: Season, params: dict, included: dict) -> None:
+    data = get(api_client, reverse("matches-list"), sideload="true", **params)
+    assert {name: len(objects) for name, objects in data["included"].items()} == included
+
+
+def test_sideload_teams_and_retrieve(api_client: APIClient, season: Season) -> None:
+    data = get(api_client, reverse("teams-list"), sideload="1")
+    assert [row["season"] for row in data["results"]] == [season.pk] * 3
+    assert [included["id"] for included in data["included"]["seasons"]] == [season.pk]
+
+    match = Match.objects.filter(season=season, visitor=None).get()
+    data = get(api_client, reverse("matches-detail", args=[match.pk]), sideload="true")
+    assert list(data) == ["result", "included"]
+    assert data["result"]["host"] == match.host_id
+    assert [team["id"] for team in data["included"]["teams"]] == [match.host_id]
+
+    data = get(api_client, reverse("leagues-list"), sideload="true")
+    assert data["included"] == {}
+
+
+@pytest.mark.parametrize(
+    ("url_name", "params"),
+    [
+        ("matches-list", {"sideload": "true"}),
+        ("matches-list", {"sideload": "true", "cursor": "", "expand": "host"}),
+        ("teams-list", {"sideload": "true"}),
+        ("seasons-list", {"sideload": "true"}),
+    ],
+)
+def test_fast_read_sideload(
+    api_client: APIClient,
+    settings: SettingsWrapper,
+    season: Season,
+    monkeypatch: pytest.MonkeyPatch,
+    url_name: str,
+    params: dict,
+) -> None:
+    serialized = []
+    included_objects = FieldsetMixin.included_objects
+
+    def spy(self: FieldsetMixin, *args: Any, **kwargs: Any) -> Sequence:
+        serialized.append(settings.FAST_READ_RENDERING)
+        return included_objects(self, *args, **kwargs)
+
+    monkeypatch.setattr(FieldsetMixin, "included_objects", spy)
+    contents = []
+    for fast in (False, True):
+        settings.FAST_READ_RENDERING = fast
+        response = api_client.get(reverse(url_name), data=params)
+        assert response.status_code == status.HTTP_200_OK, response
+        contents.append(response.content)
+    assert contents[0] == contents[1]
+    assert serialized
+    assert not any(serialized)
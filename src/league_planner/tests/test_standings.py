@@ -0,0 +1,146 @@
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command, CommandError
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner.models.standing import Standing
+from league_planner.models.team import Team
+from league_planner.standings import find_standings_drift
+from league_planner.tests.factories import MatchFactory, SeasonFactory, TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+def standing_of(team: Team) -> Standing:
+    return Standing.objects.get(team=team)
+
+
+def test_standing_created_with_team(team_factory: TeamFactory) -> None:
+    team = team_factory.create()
+    standing = standing_of(team)
+    assert standing.season_id == team.season_id
+    assert standing.points == 0
+
+
+def test_standings_follow_match_lifecycle(
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+) -> None:
+    season = season_factory.create()
+    host = team_factory.create(season=season)
+    visitor = team_factory.create(season=season)
+    other = team_factory.create(season=season)
+    match = match_factory.create(season=season, host=host, visitor=visitor, host_score=3, visitor_score=1)
+    assert standing_of(host).points == 3
+    assert standing_of(host).home_wins == 1
+    assert standing_of(host).goals_for == 3
+    assert standing_of(visitor).away_losses == 1
+    assert standing_of(visitor).goals_against == 3
+
+    match.host_score = 1
+    match.save()
+    assert standing_of(host).points == 1
+    assert standing_of(host).home_draws == 1
+    assert standing_of(host).home_wins == 0
+    assert standing_of(visitor).away_points == 1
+
+    match.visitor = other
+    match.save()
+    assert standing_of(visitor).points == 0
+    assert standing_of(visitor).away_draws == 0
+    assert standing_of(other).away_draws == 1
+
+    match.host_score = None
+    match.save()
+    assert standing_of(host).points == 0
+    assert standing_of(other).points == 0
+
+    match.host_score = 0
+    match.save()
+    match.delete()
+    assert standing_of(host).losses == 0
+    assert standing_of(other).wins == 0
+    assert find_standings_drift([season.pk]) == []
+
+
+def test_standings_follow_points_rule(
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+) -> None:
+    season = season_factory.create()
+    host = team_factory.create(season=season)
+    visitor = team_factory.create(season=season)
+    match_factory.create(season=season, host=host, visitor=visitor, host_score=2, visitor_score=2)
+    match_factory.create(season=season, host=visitor, visitor=host, host_score=2, visitor_score=0, address="away")
+    season.points_per_win = 2
+    season.points_per_draw = 5
+    season.points_per_lose = 1
+    season.save()
+    assert standing_of(host).points == 6
+    assert standing_of(host).away_points == 1
+    assert standing_of(visitor).points == 7
+    assert find_standings_drift([season.pk]) == []
+
+
+def test_standing_follows_team_to_other_season(
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+) -> None:
+    team = team_factory.create()
+    season = season_factory.create()
+    team.season = season
+    team.save()
+    assert standing_of(team).season_id == season.pk
+
+
+def test_rebuild_standings_command(
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+) -> None:
+    season = season_factory.create()
+    host = team_factory.create(season=season)
+    visitor = team_factory.create(season=season)
+    match_factory.create(season=season, host=host, visitor=visitor)
+    Standing.objects.filter(team=host).update(points=100)
+    Standing.objects.filter(team=visitor).delete()
+    with pytest.raises(CommandError):
+        call_command("rebuild_standings", "--check", "--season", str(season.pk))
+    call_command("rebuild_standings", "--season", str(season.pk))
+    assert standing_of(host).points == 3
+    assert standing_of(visitor).losses == 1
+    call_command("rebuild_standings")
+    call_command("rebuild_standings", "--check")
+
+
+def test_scoreboard_reads_standings(
+    api_client: APIClient,
+    season_factory: SeasonFactory,
+    team_factory: TeamFactory,
+    match_factory: MatchFactory,
+    test_user: User,
+) -> None:
+    season = season_factory.create(league__owner=test_user)
+    host = team_factory.create(season=season)
+    visitor = team_factory.create(season=season)
+    match = match_factory.create(season=season, host=host, visitor=visitor, host_score=1, visitor_score=4)
+    response = api_client.patch(
+        reverse("matches-detail", args=[match.pk]),
+        data={"host_score": 5},
+        format="json",
+    )
+    assert response.status_code == status.HTTP_200_OK, response
+    response = api_client.get(reverse("seasons-scoreboard", args=[season.pk]))
+    assert response.status_code == status.HTTP_200_OK, response
+    first, second = response.data["results"]
+    assert first["id"] == host.pk
+    assert first["score"] == 3
+    assert first["score_as_host"] == 3
+    assert first["wins"] == 1
+    assert first["goals_for"] == 5
+    assert second["losses"] == 1
+    assert second["goals_against"] == 5
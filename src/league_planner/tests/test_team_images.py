@@ -0,0 +1,424 @@
+import io
+import threading
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from league_planner import images
+from league_planner.images import (
+    acquire_blob,
+    blob_digest,
+    claim_image_job,
+    delete_blob_files,
+    enqueue_image,
+    IMAGE_DIRECTORY,
+    IMAGE_FORMATS,
+    IMAGE_SIZES,
+    process_image_job,
+    release_blob,
+    render_image,
+    rendition_name,
+    Renditions,
+)
+from league_planner.models.image_blob import ImageBlob
+from league_planner.models.image_job import ImageJob
+from league_planner.models.team import Team
+from league_planner.tests.factories import TeamFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def _media_root(settings: SettingsWrapper, tmp_path: Path) -> None:
+    settings.MEDIA_ROOT = tmp_path
+
+
+@pytest.fixture()
+def team(team_factory: TeamFactory, test_user: object) -> Team:
+    return team_factory.create(season__league__owner=test_user)
+
+
+def photo(width: int = 1200, height: int = 800) -> SimpleUploadedFile:
+    image = Image.new("RGB", (width, height), (200, 30, 30))
+    exif = Image.Exif()
+    exif[0x010F] = "Camera maker"
+    exif[0x0112] = 6
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", exif=exif, quality=95)
+    return SimpleUploadedFile("photo.jpg", buffer.getvalue(), content_type="image/jpeg")
+
+
+def upload(api_client: APIClient, team: Team, image: SimpleUploadedFile) -> int:
+    response = api_client.post(
+        reverse("teams-image_upload", args=[team.pk]),
+        data={"image": image},
+        format="multipart",
+    )
+    call_command("process_images", once=True, stdout=io.StringIO())
+    return response.status_code
+
+
+def download(api_client: APIClient, team: Team, **params: object) -> tuple[Image.Image, int]:
+    response = api_client.get(reverse("teams-image", args=[team.pk]), data=params)
+    assert response.status_code == status.HTTP_200_OK, response
+    content = b"".join(response.streaming_content)
+    image = Image.open(io.BytesIO(content))
+    assert response["Content-Type"] == IMAGE_FORMATS[image.format.lower()]
+    return image, len(content)
+
+
+def test_team_image_renditions(api_client: APIClient, team: Team) -> None:
+    original = photo()
+    assert upload(api_client, team, original) == status.HTTP_202_ACCEPTED
+    team.refresh_from_db()
+    assert team.image.name == rendition_name(team, 512, "png")
+    for size in IMAGE_SIZES:
+        for image_format in IMAGE_FORMATS:
+            assert default_storage.exists(rendition_name(team, size, image_format))
+
+    default, _ = download(api_client, team)
+    assert default.format == "PNG"
+    assert default.size == (341, 512)
+    assert not default.getexif()
+
+    badge, byte_count = download(api_client, team, size=48, format="webp")
+    assert badge.format == "WEBP"
+    assert max(badge.size) == 48
+    assert not badge.getexif()
+    assert "exif" not in badge.info
+    assert byte_count * 10 < original.size
+
+
+def stored_blobs() -> list[Path]:
+    return [path for path in Path(default_storage.location, IMAGE_DIRECTORY).rglob("*") if path.is_file()]
+
+
+def test_team_image_upload_replaces_renditions(
+    api_client: APIClient,
+    team: Team,
+    django_capture_on_commit_callbacks: Callable,
+) -> None:
+    with django_capture_on_commit_callbacks(execute=True):
+        assert upload(api_client, team, photo()) == status.HTTP_202_ACCEPTED
+        assert upload(api_client, team, photo(100, 40)) == status.HTTP_202_ACCEPTED
+    assert download(api_client, team, size=512, format="webp")[0].size == (40, 100)
+    assert len(stored_blobs()) == 6
+    assert list(ImageBlob.objects.values_list("refcount", flat=True)) == [1]
+
+
+def test_team_image_invalid(api_client: APIClient, team: Team, settings: SettingsWrapper) -> None:
+    invalid = SimpleUploadedFile("photo.png", b"not an image", content_type="image/png")
+    assert upload(api_client, team, invalid) == status.HTTP_202_ACCEPTED
+    assert ImageJob.objects.get().status == ImageJob.Status.FAILED
+    response = api_client.get(reverse("teams-image", args=[team.pk]))
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response
+
+    settings.IMAGE_UPLOAD_MAX_BYTES = 10
+    assert upload(api_client, team, photo()) == status.HTTP_400_BAD_REQUEST
+    settings.IMAGE_UPLOAD_MAX_BYTES = 10**7
+    assert upload(api_client, team, photo()) == status.HTTP_202_ACCEPTED
+    for params in ({"size": 64}, {"format": "gif"}):
+        response = api_client.get(reverse("teams-image", args=[team.pk]), data=params)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, response
+
+
+def test_team_image_legacy_fallback(api_client: APIClient, team: Team) -> None:
+    buffer = io.BytesIO()
+    Image.new("RGB", (20, 20)).save(buffer, "PNG")
+    team.image.save(f"team_{team.id}.png", SimpleUploadedFile("legacy.png", buffer.getvalue()))
+    assert download(api_client, team, size=48, format="webp")[0].format == "PNG"
+
+
+def test_team_image_delete(
+    api_client: APIClient,
+    team: Team,
+    django_capture_on_commit_callbacks: Callable,
+) -> None:
+    assert upload(api_client, team, photo()) == status.HTTP_202_ACCEPTED
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.delete(reverse("teams-image_delete", args=[team.pk]))
+    assert response.status_code == status.HTTP_204_NO_CONTENT, response
+    team.refresh_from_db()
+    assert not team.image
+    assert not stored_blobs()
+    assert not ImageBlob.objects.exists()
+    response = api_client.get(reverse("teams-image", args=[team.pk]))
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response
+
+
+def test_team_image_conditional_get(api_client: APIClient, team: Team) -> None:
+    assert upload(api_client, team, photo()) == status.HTTP_202_ACCEPTED
+    url = reverse("teams-image", args=[team.pk])
+    response = api_client.get(url, data={"size": 128, "format": "webp"})
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.streaming
+    assert response["Content-Type"] == "image/webp"
+    assert response["Accept-Ranges"] == "bytes"
+    etag, last_modified = response["ETag"], response["Last-Modified"]
+
+    response = api_client.get(url, data={"size": 128, "format": "webp"}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED, response
+    assert response["ETag"] == etag
+    response = api_client.get(url, data={"size": 128, "format": "webp"}, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED, response
+    response = api_client.get(url, data={"size": 48, "format": "webp"}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK, response
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("bytes=0-9", (0, 9)),
+        ("bytes=10-", (10, None)),
+        ("bytes=-5", (-5, None)),
+        ("bytes=5-100000", (5, None)),
+    ],
+)
+def test_team_image_range(
+    api_client: APIClient,
+    team: Team,
+    header: str,
+    expected: tuple[int, int | None],
+) -> None:
+    assert upload(api_client, team, photo()) == status.HTTP_202_ACCEPTED
+    url = reverse("teams-image", args=[team.pk])
+    full = b"".join(api_client.get(url).streaming_content)
+    response = api_client.get(url, HTTP_RANGE=header)
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT, response
+    start, end = expected
+    content = b"".join(response.streaming_content)
+    stop = end + 1 if end is not None else None
+    assert content == full[start:stop]
+    first = start if start >= 0 else len(full) + start
+    assert response["Content-Range"] == f"bytes {first}-{first + len(content) - 1}/{len(full)}"
+    assert response["Content-Length"] == str(len(content))
+
+
+def test_team_image_range_edge_cases(api_client: APIClient, team: Team) -> None:
+    assert upload(api_client, team, photo()) == status.HTTP_202_ACCEPTED
+    url = reverse("teams-image", args=[team.pk])
+    response = api_client.get(url)
+    size, etag = int(response["Content-Length"]), response["ETag"]
+
+    response = api_client.get(url, HTTP_RANGE=f"bytes={size}-")
+    assert response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, response
+    assert response["Content-Range"] == f"bytes */{size}"
+    for headers in (
+        {"HTTP_RANGE": "bytes=0-1,4-5"},
+        {"HTTP_RANGE": "bytes=0-"},
+        {"HTTP_RANGE": "bytes=0-1", "HTTP_IF_RANGE": '"stale"'},
+        {"HTTP_RANGE": "bytes=0-1", "HTTP_IF_RANGE": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    ):
+        response = api_client.get(url, **headers)
+        assert response.status_code == status.HTTP_200_OK, headers
+    response = api_client.get(url, HTTP_RANGE="bytes=0-1", HTTP_IF_RANGE=etag)
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT, response
+
+
+@pytest.mark.parametrize("header", ["X-Accel-Redirect", "X-Sendfile"])
+def test_team_image_offloaded(api_client: APIClient, team: Team, settings: SettingsWrapper, header: str) -> None:
+    assert upload(api_client, team, photo()) == status.HTTP_202_ACCEPTED
+    settings.FILE_SENDFILE_HEADER = header
+    team.refresh_from_db()
+    response = api_client.get(reverse("teams-image", args=[team.pk]), data={"size": 48, "format": "webp"})
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response.content == b""
+    assert response["Content-Type"] == "image/webp"
+    assert "ETag" in response
+    name = rendition_name(team, 48, "webp")
+    expected = "/protected-media/" + name if header == "X-Accel-Redirect" else default_storage.path(name)
+    assert response[header] == expected
+
+
+def test_team_image_processing_in_background(
+    api_client: APIClient,
+    team: Team,
+) -> None:
+    assert upload(api_client, team, photo()) == status.HTTP_202_ACCEPTED
+    previous, _ = download(api_client, team, size=128, format="png")
+
+    response = api_client.post(
+        reverse("teams-image_upload", args=[team.pk]),
+        data={"image": photo(300, 100)},
+        format="multipart",
+    )
+    assert response.status_code == status.HTTP_202_ACCEPTED, response
+    assert response.data["status"] == ImageJob.Status.PENDING
+    assert response["Location"].endswith(reverse("teams-image_status", args=[team.pk]))
+    job = ImageJob.objects.get(pk=response.data["id"])
+    assert default_storage.exists(job.source.name)
+    assert download(api_client, team, size=128, format="png")[0].size == previous.size
+
+    response = api_client.get(reverse("teams-image_status", args=[team.pk]))
+    assert response.data["status"] == ImageJob.Status.PENDING
+    output = io.StringIO()
+    call_command("process_images", once=True, stdout=output)
+    assert f"Image job {job.id} for team {team.id}: done" in output.getvalue()
+    response = api_client.get(reverse("teams-image_status", args=[team.pk]))
+    assert response.data["status"] == ImageJob.Status.DONE
+    assert response.data["finished_at"] is not None
+    assert not default_storage.exists(job.source.name)
+    assert download(api_client, team, size=128, format="png")[0].size == (43, 128)
+
+
+def test_team_image_jobs(team: Team, team_factory: TeamFactory) -> None:
+    source = photo(50, 50)
+    jobs = [enqueue_image(team, source) for _ in range(3)]
+    other = enqueue_image(team_factory.create(), photo(50, 50))
+    assert claim_image_job() == jobs[0]
+    assert claim_image_job() == jobs[1]
+
+    ImageJob.objects.filter(pk=jobs[0].pk).update(started_at=timezone.now() - timedelta(hours=1))
+    stale = claim_image_job()
+    assert stale == jobs[0]
+    assert stale.attempts == 2
+    stale.attempts = 4
+    process_image_job(stale)
+    stale.refresh_from_db()
+    assert stale.status == ImageJob.Status.FAILED
+    assert stale.error == "Image processing did not finish."
+
+    jobs[2].status = ImageJob.Status.DONE
+    jobs[2].save()
+    process_image_job(ImageJob.objects.get(pk=jobs[1].pk))
+    team.refresh_from_db()
+    assert not team.image
+    assert claim_image_job() == other
+
+
+def test_failing_image_job_does_not_stop_the_queue(
+    team: Team,
+    team_factory: TeamFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    failing = enqueue_image(team, photo(50, 50))
+    other_team = team_factory.create()
+    other = enqueue_image(other_team, photo(50, 50))
+    save_renditions = images.save_renditions
+
+    def broken_save_renditions(target: Team, renditions: Renditions) -> None:
+        if target.pk == team.pk:
+            raise RuntimeError("storage is down")
+        save_renditions(target, renditions)
+
+    monkeypatch.setattr(images, "save_renditions", broken_save_renditions)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with CaptureQueriesContext(connection) as queries:
+        call_command("process_images", once=True, stdout=stdout, stderr=stderr)
+    assert f"Image job {failing.id} for team {team.id} failed: RuntimeError('storage is down')" in stderr.getvalue()
+    assert "Processed 2 image jobs." in stdout.getvalue()
+    failing.refresh_from_db()
+    assert failing.status == ImageJob.Status.FAILED
+    assert failing.error == "Image processing failed."
+    other.refresh_from_db()
+    assert other.status == ImageJob.Status.DONE
+    other_team.refresh_from_db()
+    assert other_team.image
+    team_locks = [query["sql"] for query in queries if query["sql"].startswith('SELECT "league_planner_team"."id"')]
+    assert len(team_locks) == 2
+    assert all(sql.endswith("FOR UPDATE") for sql in team_locks)
+
+
+def test_team_image_status_without_jobs(api_client: APIClient, team: Team) -> None:
+    response = api_client.get(reverse("teams-image_status", args=[team.pk]))
+    assert response.status_code == status.HTTP_404_NOT_FOUND, response
+
+
+def test_team_images_are_deduplicated(
+    api_client: APIClient,
+    team: Team,
+    team_factory: TeamFactory,
+    django_capture_on_commit_callbacks: Callable,
+) -> None:
+    other = team_factory.create(season=team.season)
+    assert upload(api_client, team, photo()) == status.HTTP_202_ACCEPTED
+    assert upload(api_client, other, photo()) == status.HTTP_202_ACCEPTED
+    team.refresh_from_db()
+    other.refresh_from_db()
+    assert team.image.name == other.image.name
+    assert len(stored_blobs()) == 6
+    assert ImageBlob.objects.get().refcount == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        team.delete()
+    assert ImageBlob.objects.get().refcount == 1
+    assert download(api_client, other, size=48, format="webp")[0].format == "WEBP"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        other.season.delete()
+    assert not ImageBlob.objects.exists()
+    assert not stored_blobs()
+
+
+def test_released_blob_reacquired_before_files_are_deleted(django_capture_on_commit_callbacks: Callable) -> None:
+    renditions = render_image(photo())
+    digest = acquire_blob(renditions)
+    with django_capture_on_commit_callbacks() as callbacks:
+        release_blob(digest)
+    assert acquire_blob(renditions) == digest
+    for callback in callbacks:
+        callback()
+    assert ImageBlob.objects.get().refcount == 1
+    assert len(stored_blobs()) == 6
+
+
+@pytest.mark.django_db(transaction=True)
+def test_blob_files_are_deleted_after_concurrent_acquire_commits() -> None:
+    renditions = render_image(photo())
+    digest = acquire_blob(renditions)
+    ImageBlob.objects.filter(digest=digest).update(refcount=0)
+    acquired = threading.Event()
+
+    def acquire() -> None:
+        try:
+            with transaction.atomic():
+                acquire_blob(renditions)
+                acquired.set()
+                time.sleep(0.2)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    assert acquired.wait(5)
+    delete_blob_files(digest)
+    thread.join()
+    assert ImageBlob.objects.get().refcount == 1
+    assert len(stored_blobs()) == 6
+
+
+def test_immutable_image_url(api_client: APIClient, team: Team) -> None:
+    assert upload(api_client, team, photo()) == status.HTTP_202_ACCEPTED
+    response = api_client.get(reverse("teams-image", args=[team.pk]), data={"size": 128, "format": "webp"})
+    url = response["Content-Location"]
+    team.refresh_from_db()
+    assert url == "http://testserver" + reverse(
+        "image-blob",
+        kwargs={"digest": blob_digest(team.image.name), "size": 128, "image_format": "webp"},
+    )
+
+    response = APIClient().get(url)
+    assert response.status_code == status.HTTP_200_OK, response
+    assert response["Content-Type"] == "image/webp"
+    assert response["Cache-Control"] == "public, max-age=31536000, immutable"
+    assert Image.open(io.BytesIO(b"".join(response.streaming_content))).size == (85, 128)
+
+    response = APIClient().get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED, response
+    for missing in (url.replace("/128.", "/64."), url.replace(blob_digest(team.image.name) or "", "0" * 64)):
+        response = APIClient().get(missing)
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response
@@ -1,12 +1,13 @@
 from django.contrib import admin
-from django.urls import include, path
+from django.urls import include, path, re_path
 from rest_framework.routers import SimpleRouter
 
+from league_planner.views.image import ImageBlobView
 from league_planner.views.league import LeagueViewSet
 from league_planner.views.match import MatchViewSet
 from league_planner.views.season import SeasonViewSet
 from league_planner.views.team import TeamViewSet
-from league_planner.views.user import CreateUserView, LoginView
+from league_planner.views.user import CreateUserView, LoginView, LogoutView
 
 router = SimpleRouter()
 router.register("leagues", LeagueViewSet, "leagues")
@@ -20,4 +21,10 @@ urlpatterns = [
     path("", include(router.urls)),
     path("admin/", admin.site.urls),
     path("login/", LoginView.as_view()),
+    path("logout/", LogoutView.as_view()),
+    re_path(
+        r"^images/(?P<digest>[0-9a-f]{64})/(?P<size>\d+)\.(?P<image_format>webp|png)$",
+        ImageBlobView.as_view(),
+        name="image-blob",
+    ),
 ]
@@ -0,0 +1,27 @@
+from django.core.files.storage import default_storage
+from django.http import HttpResponseBase
+from rest_framework import permissions, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from league_planner.images import blob_name, IMAGE_FORMATS, IMAGE_SIZES
+from league_planner.negotiation import IgnoreClientContentNegotiation
+from league_planner.serving import serve_file
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImageBlobView(APIView):
+    authentication_classes = ()
+    permission_classes = (permissions.AllowAny,)
+    content_negotiation_class = IgnoreClientContentNegotiation
+
+    def get(self, request: Request, digest: str, size: str, image_format: str) -> HttpResponseBase:
+        if int(size) not in IMAGE_SIZES:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        name = blob_name(digest, int(size), image_format)
+        try:
+            return serve_file(request, default_storage, name, IMAGE_FORMATS[image_format], IMMUTABLE_CACHE_CONTROL)
+        except FileNotFoundError:
+            return Response(status=status.HTTP_404_NOT_FOUND)
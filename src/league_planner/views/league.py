@@ -1,26 +1,31 @@
+from collections import OrderedDict
+from functools import partial
 from typing import Any
 
-from rest_framework.mixins import (
-    CreateModelMixin,
-    DestroyModelMixin,
-    ListModelMixin,
-    RetrieveModelMixin,
-    UpdateModelMixin,
-)
+from django.db.models import QuerySet
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.mixins import CreateModelMixin, DestroyModelMixin, RetrieveModelMixin, UpdateModelMixin
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from league_planner.caching import versioned_response
+from league_planner.conflicts import find_conflicts
+from league_planner.filters import LeagueFilter
 from league_planner.models.league import League
+from league_planner.models.season import Season
 from league_planner.pagination import Pagination
 from league_planner.permissions import IsLeagueOwner
 from league_planner.serializers.league import LeagueSerializer
+from league_planner.serializers.match import ConflictSerializer
+from league_planner.views.mixins import FastReadMixin
 
 
 class LeagueViewSet(
     GenericViewSet,
-    ListModelMixin,
+    FastReadMixin,
     CreateModelMixin,
     RetrieveModelMixin,
     UpdateModelMixin,
@@ -30,7 +35,34 @@ class LeagueViewSet(
     queryset = League.objects.all()
     serializer_class = LeagueSerializer
     pagination_class = Pagination
+    filterset_class = LeagueFilter
+
+    def get_queryset(self) -> QuerySet[League]:
+        queryset = super().get_queryset()
+        if self.action in ["list", "retrieve"]:
+            return self.get_read_queryset(queryset)
+        return queryset.select_related("owner").only("id", "name", "owner__id", "owner__username")
 
     def create(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         request.data["owner"] = request.user.pk
         return super().create(request, *args, **kwargs)
+
+    @action(
+        methods=["GET"],
+        detail=True,
+        url_path="conflicts",
+    )
+    def conflicts(self, request: Request, pk: str) -> Response:
+        league = self.get_object()
+        season_ids = list(Season.objects.filter(league_id=league.id).values_list("id", flat=True))
+        return versioned_response(request, season_ids, partial(self.conflicts_response, season_ids))
+
+    def conflicts_response(self, season_ids: list[int]) -> Response:
+        data = ConflictSerializer(find_conflicts(season_ids), many=True).data
+        rest_response_data = OrderedDict(
+            count=len(data),
+            next=None,
+            previous=None,
+            results=data,
+        )
+        return Response(data=rest_response_data, status=status.HTTP_200_OK)
@@ -1,23 +1,26 @@
-from rest_framework import viewsets
-from rest_framework.mixins import (
-    CreateModelMixin,
-    DestroyModelMixin,
-    ListModelMixin,
-    RetrieveModelMixin,
-    UpdateModelMixin,
-)
-from rest_framework.permissions import IsAuthenticated
+from collections import Counter, OrderedDict
+
+from django.db.models import QuerySet
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.mixins import CreateModelMixin, DestroyModelMixin, RetrieveModelMixin, UpdateModelMixin
+from rest_framework.permissions import IsAuthenticated, SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.response import Response
 
-from league_planner.filters import FilterBySeason
+from league_planner.filters import MatchFilter
+from league_planner.match_results import submit_results
 from league_planner.models.match import Match
-from league_planner.pagination import Pagination
+from league_planner.pagination import KeysetPagination
 from league_planner.permissions import IsSeasonResourceOwner
-from league_planner.serializers.match import MatchDetailSerializer, MatchSerializer
+from league_planner.serializers.match import BulkResultsSerializer, MatchDetailSerializer, MatchSerializer
+from league_planner.views.mixins import FastReadMixin, SeasonVersionedListMixin
 
 
 class MatchViewSet(
     viewsets.GenericViewSet,
-    ListModelMixin,
+    SeasonVersionedListMixin,
+    FastReadMixin,
     CreateModelMixin,
     RetrieveModelMixin,
     UpdateModelMixin,
@@ -26,10 +29,36 @@ class MatchViewSet(
     permission_classes = (IsAuthenticated, IsSeasonResourceOwner)
     queryset = Match.objects.all()
     serializer_class = MatchSerializer
-    pagination_class = Pagination
-    filterset_class = FilterBySeason
+    pagination_class = KeysetPagination
+    keyset_field = "datetime"
+    filterset_class = MatchFilter
+    detail_serializer_class = MatchDetailSerializer
 
-    def get_serializer_class(self) -> type[MatchSerializer]:
+    def get_queryset(self) -> QuerySet[Match]:
+        queryset = super().get_queryset()
         if self.action in ["list", "retrieve"]:
-            return MatchDetailSerializer
-        return MatchSerializer
+            return self.get_read_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset.with_owner()
+        return queryset
+
+    @action(
+        methods=["POST"],
+        detail=False,
+        url_path="bulk-results",
+        url_name="bulk_results",
+    )
+    def bulk_results(self, request: Request) -> Response:
+        serializer = BulkResultsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        statuses = submit_results(request.user, serializer.validated_data["results"])
+        summary = Counter(item["status"] for item in statuses)
+        return Response(
+            data=OrderedDict(
+                count=len(statuses),
+                updated=summary["updated"],
+                failed=len(statuses) - summary["updated"] - summary["unchanged"],
+                results=statuses,
+            ),
+            status=status.HTTP_200_OK,
+        )
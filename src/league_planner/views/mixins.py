@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import partial
+from typing import Any
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils.http import parse_header_parameters
+from rest_framework import status
+from rest_framework.generics import GenericAPIView, get_object_or_404
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer
+
+from league_planner.caching import requested_season_ids, versioned_response
+from league_planner.rendering import FastJSONRenderer, row_mapper, RowMapper
+from league_planner.serializers.fieldsets import FieldsetQuerySerializer
+
+READ_ACTIONS = ("list", "retrieve")
+
+
+class SeasonVersionedListMixin(ListModelMixin):
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:  # noqa: A003
+        season_ids = requested_season_ids(request)
+        if season_ids is None:
+            return super().list(request, *args, **kwargs)
+        return versioned_response(request, season_ids, partial(super().list, request, *args, **kwargs))
+
+
+class FieldsetMixin(GenericAPIView):
+    detail_serializer_class: type[BaseSerializer] | None = None
+    fieldset: tuple[tuple[str, ...] | None, tuple[str, ...]] | None = None
+    sideload: tuple[str, ...] | None = None
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        super().initial(request, *args, **kwargs)
+        self.fieldset = self.sideload = None
+        if self.action not in READ_ACTIONS:
+            return
+        data = {**parse_header_parameters(request.accepted_media_type)[1], **request.query_params.dict()}
+        requested = {"fields", "expand", "sideload"} & data.keys()
+        if not requested:
+            return
+        serializer = FieldsetQuerySerializer(data=data, context={"serializer_class": self.serializer_class})
+        serializer.is_valid(raise_exception=True)
+        fields, expand = serializer.validated_data.get("fields"), serializer.validated_data.get("expand")
+        if serializer.validated_data["sideload"]:
+            relations = expand or tuple(getattr(self.serializer_class, "expandable_fields", {}))
+            self.sideload = tuple(name for name in relations if fields is None or name in fields)
+            self.fieldset = fields, ()
+        elif requested != {"sideload"}:
+            self.fieldset = fields, expand or ()
+
+    def get_serializer_class(self) -> type[BaseSerializer]:
+        if self.action in READ_ACTIONS and self.fieldset is None and self.detail_serializer_class is not None:
+            return self.detail_serializer_class
+        return super().get_serializer_class()
+
+    def get_serializer(self, *args: Any, **kwargs: Any) -> BaseSerializer:
+        if self.fieldset is not None:
+            kwargs["fields"], kwargs["expand"] = self.fieldset
+        return super().get_serializer(*args, **kwargs)
+
+    def get_read_mapper(self) -> RowMapper:
+        return row_mapper(self.get_serializer_class(), *(self.fieldset or ()))
+
+    def get_extra_lookups(self, mapper: RowMapper) -> list[str]:
+        keyset_field = getattr(self, "keyset_field", None)
+        if keyset_field is None or keyset_field in mapper.lookups:
+            return []
+        return [keyset_field]
+
+    def get_read_queryset(self, queryset: QuerySet) -> QuerySet:
+        mapper = self.get_read_mapper()
+        return mapper.restrict(queryset, *self.get_extra_lookups(mapper))
+
+    def get_included(self, rows: Sequence[dict], fast: bool = False) -> dict[str, Sequence]:
+        related_ids: dict[type[BaseSerializer], set[Any]] = {}
+        for name in self.sideload or ():
+            ids = related_ids.setdefault(self.get_serializer_class().expandable_fields[name], set())
+            ids.update(row[name] for row in rows if row[name] is not None)
+        included = {}
+        for serializer_class, ids in related_ids.items():
+            model = serializer_class.Meta.model
+            queryset = model.objects.filter(pk__in=ids)
+            objects = self.included_objects(serializer_class, queryset, fast) if ids else []
+            included[str(model._meta.verbose_name_plural)] = objects
+        return included
+
+    def included_objects(
+        self,
+        serializer_class: type[BaseSerializer],
+        queryset: QuerySet,
+        fast: bool = False,
+    ) -> Sequence:
+        queryset = row_mapper(serializer_class).restrict(queryset).order_by("pk")
+        return serializer_class(queryset, many=True).data
+
+    def sideloaded(self, response: Response, fast: bool = False) -> Response:
+        if self.sideload is None or response.status_code != status.HTTP_200_OK:
+            return response
+        if self.action == "retrieve":
+            response.data = OrderedDict(result=response.data, included=self.get_included([response.data], fast))
+        elif isinstance(response.data, list):
+            response.data = OrderedDict(results=response.data, included=self.get_included(response.data, fast))
+        else:
+            response.data["included"] = self.get_included(response.data["results"], fast)
+        return response
+
+
+class FastReadMixin(FieldsetMixin, ListModelMixin, RetrieveModelMixin):
+    fast_renderer = FastJSONRenderer()
+
+    def use_fast_read(self, request: Request) -> bool:
+        return settings.FAST_READ_RENDERING and type(request.accepted_renderer) is JSONRenderer
+
+    def fast_read_queryset(self, mapper: RowMapper) -> QuerySet:
+        return self.filter_queryset(self.get_queryset()).values(*mapper.lookups, *self.get_extra_lookups(mapper))
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:  # noqa: A003
+        if not self.use_fast_read(request):
+            return self.sideloaded(super().list(request, *args, **kwargs))
+        mapper = self.get_read_mapper()
+        queryset = self.fast_read_queryset(mapper)
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            response = Response([mapper(row) for row in queryset])
+        else:
+            response = self.get_paginated_response([mapper(row) for row in page])
+        request.accepted_renderer = self.fast_renderer
+        return self.sideloaded(response, fast=True)
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        if not self.use_fast_read(request):
+            return self.sideloaded(super().retrieve(request, *args, **kwargs))
+        mapper = self.get_read_mapper()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(self.fast_read_queryset(mapper), **{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        self.check_object_permissions(request, row)
+        request.accepted_renderer = self.fast_renderer
+        return self.sideloaded(Response(mapper(row)), fast=True)
+
+    def included_objects(
+        self,
+        serializer_class: type[BaseSerializer],
+        queryset: QuerySet,
+        fast: bool = False,
+    ) -> Sequence:
+        if not fast:
+            return super().included_objects(serializer_class, queryset)
+        mapper = row_mapper(serializer_class)
+        return [mapper(row) for row in queryset.order_by("pk").values(*mapper.lookups)]
@@ -1,33 +1,46 @@
 from collections import OrderedDict
+from functools import partial
 
-from django.db.models import Case, F, QuerySet, Value, When
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.mixins import (
-    CreateModelMixin,
-    DestroyModelMixin,
-    ListModelMixin,
-    RetrieveModelMixin,
-    UpdateModelMixin,
-)
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import ValidationError
+from rest_framework.mixins import CreateModelMixin, DestroyModelMixin, RetrieveModelMixin, UpdateModelMixin
+from rest_framework.permissions import IsAuthenticated, SAFE_METHODS
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from league_planner import scoreboard as sql_scoreboard
+from league_planner import standings
+from league_planner.caching import versioned_response
+from league_planner.conflicts import find_conflicts
+from league_planner.exporting import EXPORT_CONTENT_TYPES, export_csv, export_ics, export_ndjson
 from league_planner.filters import FilterByLeague
-from league_planner.models.match import Match
+from league_planner.importing import SeasonImporter
 from league_planner.models.season import Season
-from league_planner.models.team import Team
+from league_planner.negotiation import IgnoreClientContentNegotiation
 from league_planner.pagination import Pagination
 from league_planner.permissions import IsLeagueResourceOwner
-from league_planner.serializers.season import SeasonSerializer
-from league_planner.serializers.team import ScoreboardSerializer
+from league_planner.scheduling.schedule import build_optimized, build_round_robin, save_schedule
+from league_planner.serializers.imports import ImportReportSerializer, ImportRequestSerializer
+from league_planner.serializers.match import ConflictSerializer, MatchSerializer
+from league_planner.serializers.schedule import OptimizeScheduleRequestSerializer, ScheduleRequestSerializer
+from league_planner.serializers.season import (
+    ProgressionRoundSerializer,
+    ScoreboardQuerySerializer,
+    ScoreboardsQuerySerializer,
+    SeasonSerializer,
+)
+from league_planner.serializers.team import ScoreboardSerializer, SeasonScoreboardSerializer
+from league_planner.views.mixins import FastReadMixin
 
 
 class SeasonViewSet(
     GenericViewSet,
-    ListModelMixin,
+    FastReadMixin,
     CreateModelMixin,
     RetrieveModelMixin,
     UpdateModelMixin,
@@ -39,29 +52,33 @@ class SeasonViewSet(
     pagination_class = Pagination
     filterset_class = FilterByLeague
 
+    def get_queryset(self) -> QuerySet[Season]:
+        queryset = super().get_queryset()
+        if self.action in ["list", "retrieve"]:
+            return self.get_read_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset.with_owner()
+        return queryset
+
     @action(
         methods=["GET"],
         detail=True,
         url_path="scoreboard",
     )
-    def scoreboard(self, request: Request, pk: int) -> Response:
+    def scoreboard(self, request: Request, pk: str) -> Response:
         season = self.get_object()
-        teams_queryset = self.teams_queryset(season)
-        teams_to_points_map = {team.id: [0, 0] for team in teams_queryset}
-        matches_with_points_qs = self.matches_with_points_queryset(season)
-        for match in matches_with_points_qs:
-            if match.host_id is not None:
-                teams_to_points_map[match.host_id][0] += match.host_points
-            if match.visitor_id is not None:
-                teams_to_points_map[match.visitor_id][1] += match.visitor_points
-        scoreboard = []
-        for team in teams_queryset:
-            points = teams_to_points_map[team.id]
-            team.score = points[0] + points[1]
-            team.score_as_visitor = points[1]
-            scoreboard.append(team)
-        scoreboard.sort(key=lambda team: (team.score, team.score_as_visitor), reverse=True)
-        data = ScoreboardSerializer(scoreboard, many=True).data
+        return versioned_response(request, [season.pk], partial(self.scoreboard_response, season))
+
+    def scoreboard_response(self, season: Season) -> Response:
+        query_serializer = ScoreboardQuerySerializer(data=self.request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        as_of = query_serializer.validated_data.get("as_of")
+        rounds = query_serializer.validated_data.get("round")
+        if as_of is None and rounds is None:
+            teams = standings.scoreboard(season)
+        else:
+            teams = sql_scoreboard.scoreboard(season, until=as_of, rounds=rounds)
+        data = ScoreboardSerializer(teams, many=True).data
         rest_response_data = OrderedDict(
             count=len(data),
             next=None,
@@ -70,21 +87,167 @@ class SeasonViewSet(
         )
         return Response(data=rest_response_data, status=status.HTTP_200_OK)
 
-    @staticmethod
-    def teams_queryset(season: Season) -> QuerySet:
-        return Team.objects.filter(season_id=season.id).all()
-
-    @staticmethod
-    def matches_with_points_queryset(season: Season) -> QuerySet:
-        return Match.objects.filter(season_id=season.id).annotate(
-            host_points=Case(
-                When(host_score__gt=F("visitor_score"), then=Value(season.points_per_win)),
-                When(host_score=F("visitor_score"), then=Value(season.points_per_draw)),
-                default=Value(season.points_per_lose),
-            ),
-            visitor_points=Case(
-                When(visitor_score__gt=F("host_score"), then=Value(season.points_per_win)),
-                When(visitor_score=F("host_score"), then=Value(season.points_per_draw)),
-                default=Value(season.points_per_lose),
+    @action(
+        methods=["GET"],
+        detail=False,
+        url_path="scoreboards",
+    )
+    def scoreboards(self, request: Request) -> Response:
+        query_serializer = ScoreboardsQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        if "ids" in query_serializer.validated_data:
+            seasons = Season.objects.filter(id__in=query_serializer.validated_data["ids"])
+        else:
+            seasons = Season.objects.filter(league_id=query_serializer.validated_data["league"])
+        season_ids = list(seasons.values_list("id", flat=True))
+        return versioned_response(request, season_ids, partial(self.scoreboards_response, season_ids))
+
+    def scoreboards_response(self, season_ids: list[int]) -> Response:
+        scoreboards: dict[int, list] = {season_id: [] for season_id in season_ids}
+        for team in sql_scoreboard.scoreboard_queryset(season_ids):
+            scoreboards[team.season_id].append(team)
+        data = SeasonScoreboardSerializer(
+            [{"season": season_id, "results": teams} for season_id, teams in scoreboards.items()],
+            many=True,
+        ).data
+        rest_response_data = OrderedDict(
+            count=len(data),
+            next=None,
+            previous=None,
+            results=data,
+        )
+        return Response(data=rest_response_data, status=status.HTTP_200_OK)
+
+    @action(
+        methods=["GET"],
+        detail=True,
+        url_path="progression",
+    )
+    def progression(self, request: Request, pk: str) -> Response:
+        season = self.get_object()
+        return versioned_response(request, [season.pk], partial(self.progression_response, season))
+
+    def progression_response(self, season: Season) -> Response:
+        data = ProgressionRoundSerializer(sql_scoreboard.progression(season), many=True).data
+        rest_response_data = OrderedDict(
+            count=len(data),
+            next=None,
+            previous=None,
+            results=data,
+        )
+        return Response(data=rest_response_data, status=status.HTTP_200_OK)
+
+    @action(
+        methods=["GET"],
+        detail=True,
+        url_path="conflicts",
+    )
+    def conflicts(self, request: Request, pk: str) -> Response:
+        season = self.get_object()
+        return versioned_response(request, [season.pk], partial(self.conflicts_response, season))
+
+    def conflicts_response(self, season: Season) -> Response:
+        data = ConflictSerializer(find_conflicts([season.id]), many=True).data
+        rest_response_data = OrderedDict(
+            count=len(data),
+            next=None,
+            previous=None,
+            results=data,
+        )
+        return Response(data=rest_response_data, status=status.HTTP_200_OK)
+
+    @action(
+        methods=["POST"],
+        detail=True,
+        url_path="generate-schedule",
+        url_name="generate_schedule",
+    )
+    def generate_schedule(self, request: Request, pk: str) -> Response:
+        season = self.get_object()
+        serializer = ScheduleRequestSerializer(data=request.data, context={"season": season})
+        serializer.is_valid(raise_exception=True)
+        options = serializer.validated_data
+        matches = build_round_robin(season, options["double"], options["kickoff"], options["interval_days"])
+        if not matches:
+            raise ValidationError("Season needs at least two teams to be scheduled.")
+        if options["dry_run"]:
+            response_status = status.HTTP_200_OK
+        else:
+            matches = save_schedule(season, matches, replace=options["replace"])
+            response_status = status.HTTP_201_CREATED
+        data = MatchSerializer(matches, many=True).data
+        return Response(data=OrderedDict(count=len(data), results=data), status=response_status)
+
+    @action(
+        methods=["POST"],
+        detail=True,
+        url_path="optimize-schedule",
+        url_name="optimize_schedule",
+    )
+    def optimize_schedule(self, request: Request, pk: str) -> Response:
+        season = self.get_object()
+        serializer = OptimizeScheduleRequestSerializer(data=request.data, context={"season": season})
+        serializer.is_valid(raise_exception=True)
+        options = serializer.validated_data
+        matches, result = build_optimized(
+            season,
+            double=options["double"],
+            kickoffs=options["kickoffs"],
+            interval_days=options["interval_days"],
+            min_rest_days=options["min_rest_days"],
+            venues=options["venues"],
+            budget=options["budget"],
+            workers=settings.SCHEDULER_WORKERS,
+        )
+        if not matches:
+            raise ValidationError("Season needs at least two teams to be scheduled.")
+        if options["dry_run"]:
+            response_status = status.HTTP_200_OK
+        else:
+            matches = save_schedule(season, matches, replace=options["replace"])
+            response_status = status.HTTP_201_CREATED
+        data = MatchSerializer(matches, many=True).data
+        return Response(
+            data=OrderedDict(
+                score=result.score,
+                violations=result.violations,
+                restarts=result.restarts,
+                iterations=result.iterations,
+                count=len(data),
+                results=data,
             ),
+            status=response_status,
         )
+
+    @action(
+        methods=["POST"],
+        detail=True,
+        url_path="import",
+        url_name="import",
+    )
+    def import_rows(self, request: Request, pk: str) -> Response:
+        season = self.get_object()
+        serializer = ImportRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        options = serializer.validated_data
+        report = SeasonImporter(season, options["kind"]).run(options["file"], options["file_format"])
+        return Response(data=ImportReportSerializer(report).data, status=status.HTTP_200_OK)
+
+    @action(
+        methods=["GET"],
+        detail=True,
+        url_path=r"export/(?P<export_format>csv|ndjson|ics)",
+        url_name="export",
+        content_negotiation_class=IgnoreClientContentNegotiation,
+    )
+    def export(self, request: Request, pk: str, export_format: str) -> StreamingHttpResponse:
+        season = self.get_object()
+        if export_format == "csv":
+            content = export_csv(season.id)
+        elif export_format == "ndjson":
+            content = export_ndjson(season.id)
+        else:
+            content = export_ics(season.id, request.get_host())
+        response = StreamingHttpResponse(content, content_type=EXPORT_CONTENT_TYPES[export_format])
+        response["Content-Disposition"] = f'attachment; filename="season-{season.id}-matches.{export_format}"'
+        return response
@@ -1,27 +1,37 @@
-from django.http import HttpResponse
+from django.core.files.storage import default_storage
+from django.db.models import QuerySet
+from django.http import HttpResponseBase
+from django.urls import reverse as django_reverse
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.mixins import (
-    CreateModelMixin,
-    DestroyModelMixin,
-    ListModelMixin,
-    RetrieveModelMixin,
-    UpdateModelMixin,
-)
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.mixins import CreateModelMixin, DestroyModelMixin, RetrieveModelMixin, UpdateModelMixin
+from rest_framework.permissions import IsAuthenticated, SAFE_METHODS
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 
-from league_planner.filters import FilterBySeason
+from league_planner.filters import TeamFilter
+from league_planner.images import blob_digest, delete_renditions, enqueue_image, IMAGE_FORMATS, rendition_name
+from league_planner.models.image_job import ImageJob
 from league_planner.models.team import Team
-from league_planner.pagination import Pagination
+from league_planner.negotiation import IgnoreClientContentNegotiation
+from league_planner.pagination import KeysetPagination
 from league_planner.permissions import IsSeasonResourceOwner
-from league_planner.serializers.team import TeamDetailSerializer, TeamImageSerializer, TeamSerializer
+from league_planner.serializers.team import (
+    ImageJobSerializer,
+    TeamDetailSerializer,
+    TeamImageQuerySerializer,
+    TeamImageSerializer,
+    TeamSerializer,
+)
+from league_planner.serving import serve_file
+from league_planner.views.mixins import FastReadMixin, SeasonVersionedListMixin
 
 
 class TeamViewSet(
     viewsets.GenericViewSet,
-    ListModelMixin,
+    SeasonVersionedListMixin,
+    FastReadMixin,
     CreateModelMixin,
     RetrieveModelMixin,
     UpdateModelMixin,
@@ -30,13 +40,18 @@ class TeamViewSet(
     permission_classes = (IsAuthenticated, IsSeasonResourceOwner)
     queryset = Team.objects.all()
     serializer_class = TeamSerializer
-    pagination_class = Pagination
-    filterset_class = FilterBySeason
+    pagination_class = KeysetPagination
+    keyset_field = "number"
+    filterset_class = TeamFilter
+    detail_serializer_class = TeamDetailSerializer
 
-    def get_serializer_class(self) -> type[TeamSerializer]:
+    def get_queryset(self) -> QuerySet[Team]:
+        queryset = super().get_queryset()
         if self.action in ["list", "retrieve"]:
-            return TeamDetailSerializer
-        return TeamSerializer
+            return self.get_read_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset.with_owner()
+        return queryset
 
     @action(
         methods=["POST"],
@@ -49,22 +64,55 @@ class TeamViewSet(
         team = self.get_object()
         serializer = self.get_serializer(team, data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        job = enqueue_image(team, serializer.validated_data["image"])
+        return Response(
+            data=ImageJobSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": reverse("teams-image_status", args=[team.pk], request=request)},
+        )
+
+    @action(
+        methods=["GET"],
+        detail=True,
+        url_path="image-status",
+        url_name="image_status",
+    )
+    def image_status(self, request: Request, pk: int) -> Response:
+        team = self.get_object()
+        job = ImageJob.objects.filter(team=team).order_by("-id").first()
+        if job is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        return Response(data=ImageJobSerializer(job).data, status=status.HTTP_200_OK)
 
     @action(
         methods=["GET"],
         detail=True,
         url_path="image",
         url_name="image",
+        content_negotiation_class=IgnoreClientContentNegotiation,
     )
-    def image_download(self, request: Request, pk: int) -> Response | HttpResponse:
+    def image_download(self, request: Request, pk: int) -> HttpResponseBase:
         team = self.get_object()
+        query_serializer = TeamImageQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        size, image_format = query_serializer.validated_data["size"], query_serializer.validated_data["format"]
+        if not team.image:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        name = rendition_name(team, size, image_format)
+        if name is None:
+            name, content_type = team.image.name, None
+        else:
+            content_type = IMAGE_FORMATS[image_format]
         try:
-            image = team.image.read()
-        except ValueError:
+            response = serve_file(request, default_storage, name, content_type)
+        except FileNotFoundError:
             return Response(status=status.HTTP_404_NOT_FOUND)
-        return HttpResponse(image, content_type="image/png")
+        digest = blob_digest(name)
+        if digest is not None:
+            response["Content-Location"] = request.build_absolute_uri(
+                django_reverse("image-blob", kwargs={"digest": digest, "size": size, "image_format": image_format}),
+            )
+        return response
 
     @action(
         methods=["DELETE"],
@@ -74,5 +122,5 @@ class TeamViewSet(
     )
     def image_delete(self, request: Request, pk: int) -> Response:
         team = self.get_object()
-        team.image.delete()
+        delete_renditions(team)
         return Response(status=status.HTTP_204_NO_CONTENT)
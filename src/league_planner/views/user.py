@@ -1,11 +1,12 @@
 from typing import Any
 
 from django.contrib.auth.models import User
-from rest_framework import mixins, permissions, viewsets
+from rest_framework import mixins, permissions, status, viewsets
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from league_planner.serializers.user import CreateUserSerializer
 
@@ -26,3 +27,10 @@ class LoginView(ObtainAuthToken):
         user = serializer.validated_data.get("user")
         token, created = Token.objects.get_or_create(user=user)
         return Response({"id": user.pk, "token": token.key})
+
+
+class LogoutView(APIView):
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        if isinstance(request.auth, Token):
+            Token.objects.filter(key=request.auth.key).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)